@@ -0,0 +1 @@
+"""Benchmarks of the editor's core on synthetic projects; run ``python -m benchmarks``."""
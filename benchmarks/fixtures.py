@@ -0,0 +1,114 @@
+"""Synthetic CFRU-style decomp trees for the benchmarks.
+
+``make_project(folder, count)`` writes everything the editor reads, laid
+out like the real thing: items.h, item_tables.c with ``gItemData`` and
+``gItemGraphicsTable``, item_tables.h with ROM-defined ``#define DESC_``
+lines and externs, item_descriptions.string and one 24x24 PNG per item.
+The content only depends on ``count`` and ``seed``, so timings of
+different runs are comparable.
+"""
+import os
+import random
+import struct
+import zlib
+
+from crazyitem.charmap import DEFAULT_CHARMAP, MAX_NAME_LENGTH
+
+WORDS = [
+    "Potion", "Super", "Hyper", "Max", "Ball", "Poke", "Great", "Ultra", "Berry", "Orb", "Band",
+    "Scarf", "Herb", "Stone", "Plate", "Gem", "Dust", "Shard", "Fossil", "Mail", "Pokeblock", "Poké",
+    "Elixir", "Ether", "Repel", "Lure", "Scale", "Fang", "Claw", "Seed", "Incense", "Memo",
+]
+POCKETS = ["POCKET_ITEMS", "POCKET_KEY_ITEMS", "POCKET_POKE_BALLS", "POCKET_TM_CASE", "POCKET_BERRY_POUCH"]
+HOLD_EFFECTS = ["0", "HOLD_EFFECT_RESTORE_HP", "HOLD_EFFECT_CURE_PAR", "HOLD_EFFECT_CHOICE_BAND", "HOLD_EFFECT_LEFTOVERS"]
+FIELD_FUNCS = ["(void*) 0x80A2325", "FieldUseFunc_Medicine", "NULL"]
+
+
+def png_bytes(size=24, seed=0):
+    """Returns a valid ``size`` x ``size`` RGBA PNG, without needing Pillow."""
+    rng = random.Random(seed)
+    color = bytes(rng.randrange(256) for _ in range(3)) + b"\xff"
+    rows = b"".join(b"\x00" + color * size for _ in range(size))
+
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 6, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(rows)) + chunk(b"IEND", b""))
+
+
+def item_name(rng, i):
+    while True:
+        name = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 2)))
+        if rng.random() < 0.3:
+            name += f" {i % 100}"
+        if DEFAULT_CHARMAP.length(name) <= MAX_NAME_LENGTH:
+            return name
+
+
+def symbol(const):
+    return "gBag_" + const[5:].title().replace("_", "")
+
+
+def make_project(folder, count, seed=0, sprites=True):
+    """Writes a decomp tree with ``count`` items (``ITEM_NONE`` included) into ``folder``."""
+    rng = random.Random(seed)
+    for sub in (("include", "constants"), ("include", "new"), ("src", "tables"), ("strings",),
+                ("graphics", "item_sprites")):
+        os.makedirs(os.path.join(folder, *sub), exist_ok=True)
+    consts = ["ITEM_NONE"] + [f"ITEM_SYNTH_{i:05d}" for i in range(1, count)]
+
+    with open(os.path.join(folder, "include", "constants", "items.h"), "w", encoding="utf-8") as f:
+        f.write("#pragma once\n\n")
+        for i, const in enumerate(consts):
+            f.write(f"#define {const} 0x{i:03X}\n")
+        f.write(f"\n#define ITEMS_COUNT ({consts[-1]} + 1)\n")
+
+    c = ['#include "../config.h"\n#include "../../include/new/item_tables.h"\n\n',
+         "const struct Item gItemData[] =\n{\n"]
+    for i, const in enumerate(consts):
+        name = "????????" if i == 0 else item_name(rng, i)
+        c.append(
+            f"\t[{const}] =\n\t{{\n"
+            f"\t\t.name = {{{DEFAULT_CHARMAP.encode(name)}}},\n"
+            f"\t\t.itemId = {const},\n"
+            f"\t\t.price = {rng.randrange(0, 20000, 50)},\n"
+            f"\t\t.holdEffect = {rng.choice(HOLD_EFFECTS)},\n"
+            f"\t\t.holdEffectParam = {rng.randrange(0, 100, 10)},\n"
+            f"\t\t.description = DESC_{const[5:]},\n"
+            f"\t\t.importance = {int(rng.random() < 0.1)},\n"
+            f"\t\t.unk19 = 0,\n"
+            f"\t\t.pocket = {rng.choice(POCKETS)},\n"
+            f"\t\t.type = {rng.randrange(5)},\n"
+            f"\t\t.fieldUseFunc = {rng.choice(FIELD_FUNCS)},\n"
+            f"\t\t.battleUsage = {rng.randrange(3)},\n"
+            f"\t\t.battleUseFunc = NULL,\n"
+            f"\t\t.secondaryId = 0,\n"
+            f"\t}},\n\n"
+        )
+    c.append("};\n\nconst u32* const gItemGraphicsTable[ITEMS_COUNT + 1][2] =\n{\n")
+    for const in consts:
+        c.append(f"\t{{{symbol(const)}Tiles, {symbol(const)}Pal}},\n")
+    c.append("\t// terminator\n\t{gBag_NoneTiles, gBag_NonePal},\n};\n")
+    with open(os.path.join(folder, "src", "tables", "item_tables.c"), "w", encoding="utf-8") as f:
+        f.write("".join(c))
+
+    # Every third description is still ROM-defined, the rest live in the .string file
+    with open(os.path.join(folder, "include", "new", "item_tables.h"), "w", encoding="utf-8") as h, \
+            open(os.path.join(folder, "strings", "item_descriptions.string"), "w", encoding="utf-8") as s:
+        h.write("#pragma once\n\n")
+        for i, const in enumerate(consts):
+            tag = f"DESC_{const[5:]}"
+            if i % 3 == 1:
+                h.write(f"#define {tag} ((const u8 *) 0x84{i:05X})\n")
+                continue
+            h.write(f"extern const u8 {tag}[];\n")
+            words = " ".join(rng.choice(WORDS).lower() for _ in range(rng.randint(3, 9)))
+            s.write(f"#org @{tag}\nA synthetic item:\\n{words}.\n\n")
+
+    if sprites:
+        png = png_bytes(seed=seed)
+        for const in consts:
+            with open(os.path.join(folder, "graphics", "item_sprites", symbol(const) + ".png"), "wb") as f:
+                f.write(png)
+    return folder
@@ -0,0 +1,296 @@
+"""Times the editor's hot paths on synthetic projects and tracks them over time.
+
+    python -m benchmarks                         # 500, 5,000 and 50,000 items
+    python -m benchmarks --sizes 5000 -k load    # only benchmarks named *load*
+    python -m benchmarks --compare               # against the previous saved run
+    python -m benchmarks --compare baseline.json --fail-on-regression
+
+Each run is saved as JSON in ``.benchmarks/``.  With ``--compare`` every
+benchmark's median is set against the same benchmark of an earlier run and
+anything slower by more than ``--threshold`` is reported as a regression.
+"""
+import argparse
+import glob
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from crazyitem import ItemProject, decode_char_array, encode_char_array
+from crazyitem.search import SearchIndex
+
+from .fixtures import make_project, png_bytes
+
+DEFAULT_SIZES = [500, 5000, 50000]
+RESULTS_DIR = ".benchmarks"
+# What the search box sees while someone types, then a few field queries
+QUERIES = ["p", "po", "pot", "poti", "potion", "pocket:key_items", "price>1000 pocket:items", "hold:restore ball"]
+# Launches the editor on a project and exits once its window is on screen, or
+# with "loaded" once every item is in the list
+STARTUP_SCRIPT = """
+import os, sys
+from PyQt5.QtWidgets import QApplication
+import master
+app = QApplication(sys.argv[:1])
+window = master.ItemEditor(sys.argv[1])
+window.show()
+app.processEvents()
+while sys.argv[2] == "loaded" and not window.save_btn.isEnabled():
+    app.processEvents()
+os._exit(0)  # without waiting for the loader thread
+"""
+
+BENCHMARKS = []
+
+
+def benchmark(name):
+    """Registers ``func(state)`` as ``name``; it returns the callable to time, or None to skip."""
+    def register(func):
+        BENCHMARKS.append((name, func))
+        return func
+    return register
+
+
+class State:
+    """One synthetic project, shared by the benchmarks of a size in order."""
+
+    def __init__(self, folder, size):
+        self.folder = folder
+        self.size = size
+        self.project = None
+        self.counter = 0
+
+    def loaded(self):
+        if self.project is None:
+            self.project = ItemProject(self.folder)
+            self.project.load_all()
+        return self.project
+
+
+@benchmark("decode_char_array")
+def bench_decode_char_array(state):
+    arrays = [record.name_array() for record in state.loaded().load_item_tables().items]
+    return lambda: [decode_char_array(array) for array in arrays]
+
+
+@benchmark("encode_char_array")
+def bench_encode_char_array(state):
+    names = [item.Name for item in state.loaded().data]
+    return lambda: [encode_char_array(name) for name in names]
+
+
+@benchmark("load_all_cold")
+def bench_load_all_cold(state):
+    return lambda: ItemProject(state.folder, use_cache=False).load_all()
+
+
+@benchmark("load_all_cached")
+def bench_load_all_cached(state):
+    ItemProject(state.folder).load_all()  # writes the cache
+    return lambda: ItemProject(state.folder).load_all()
+
+
+@benchmark("search_index_build")
+def bench_search_index_build(state):
+    project = state.loaded()
+    return lambda: SearchIndex(project)
+
+
+@benchmark("filter_items")
+def bench_filter_items(state):
+    index = SearchIndex(state.loaded())
+
+    def run():
+        index.last_terms = index.last_result = None
+        for query in QUERIES:
+            index.search(query)
+    return run
+
+
+@benchmark("save_all")
+def bench_save_all(state):
+    project = state.loaded()
+
+    def run():
+        # One field and one description, like a typical edit-and-save
+        state.counter += 1
+        project.set_field(1, "Price", str(state.counter))
+        tag = project.data[2].Desc
+        project.set_description(tag, f"Edited {state.counter} times.")
+        project.save_all()
+    return run
+
+
+@benchmark("add_item")
+def bench_add_item(state):
+    try:
+        import PIL  # noqa: F401  add_item reads the icon with Pillow
+    except ImportError:
+        return None
+    project = state.loaded()
+    icon = os.path.join(state.folder, "new_icon.png")
+    with open(icon, "wb") as f:
+        f.write(png_bytes())
+
+    def run():
+        state.counter += 1
+        project.add_item(f"BENCH_{state.counter}", "Bench Item", "100", "POCKET_ITEMS", "ITEM_USE_BAG_MENU",
+                         "Added by the benchmarks.", icon)
+    return run
+
+
+def launch(state, until):
+    # From a fresh interpreter, so every import is cold
+    try:
+        import PyQt5.QtWidgets  # noqa: F401
+    except ImportError:
+        return None
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    # The synthetic project is kept out of the user's recent projects
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"),
+               CRAZYITEM_CONFIG=os.path.join(state.folder, "config"))
+    argv = [sys.executable, "-c", STARTUP_SCRIPT, state.folder, until]
+    return lambda: subprocess.run(argv, cwd=root, env=env, check=True, stderr=subprocess.DEVNULL)
+
+
+@benchmark("startup")
+def bench_startup(state):
+    return launch(state, "shown")
+
+
+@benchmark("startup_loaded")
+def bench_startup_loaded(state):
+    # Until every item is listed; the loader already runs while the window is built
+    return launch(state, "loaded")
+
+
+def time_call(func, repeat, min_time):
+    """Runs ``func`` at least ``repeat`` times and for at least ``min_time`` seconds."""
+    times = []
+    started = time.perf_counter()
+    while len(times) < repeat or (time.perf_counter() - started < min_time and len(times) < 100):
+        t = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t)
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+        "runs": len(times),
+    }
+
+
+def commit_id():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)))
+    except OSError:
+        return ""
+    return out.stdout.strip()
+
+
+def run_benchmarks(sizes, pattern=None, repeat=5, min_time=0.5, log=print):
+    """Returns ``{"name[size]": timings}`` for every benchmark matching ``pattern``."""
+    results = {}
+    for size in sizes:
+        with tempfile.TemporaryDirectory(prefix=f"crazyitem-bench-{size}-") as folder:
+            t = time.perf_counter()
+            make_project(folder, size)
+            log(f"{size} items: fixture written in {time.perf_counter() - t:.2f}s")
+            state = State(folder, size)
+            for name, func in BENCHMARKS:
+                if pattern and pattern not in name:
+                    continue
+                call = func(state)
+                if call is None:
+                    log(f"  {name:<22} skipped")
+                    continue
+                # Big projects get fewer rounds so a full run stays in minutes
+                rounds = max(1, repeat if size <= 5000 else repeat // 2)
+                timing = time_call(call, rounds, min_time)
+                results[f"{name}[{size}]"] = timing
+                log(f"  {name:<22} median {timing['median'] * 1000:10.2f} ms  "
+                    f"min {timing['min'] * 1000:10.2f} ms  ({timing['runs']} runs)")
+    return results
+
+
+def save_results(results, folder=RESULTS_DIR):
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, time.strftime("%Y%m%d-%H%M%S") + ".json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": commit_id(),
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "results": results,
+        }, f, indent=2)
+    return path
+
+
+def previous_run(folder=RESULTS_DIR, exclude=None):
+    runs = sorted(p for p in glob.glob(os.path.join(folder, "*.json")) if p != exclude)
+    return runs[-1] if runs else None
+
+
+def compare(results, baseline_path, threshold, log=print):
+    """Prints the change of every median against ``baseline_path``; returns the regressed names."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    log(f"Compared with {baseline_path} ({baseline.get('commit') or 'unknown commit'}):")
+    regressions = []
+    for name, timing in results.items():
+        old = baseline.get("results", {}).get(name)
+        if not old:
+            continue
+        ratio = timing["median"] / old["median"] if old["median"] else 1.0
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            flag = "  faster"
+        log(f"  {name:<30} {old['median'] * 1000:10.2f} -> {timing['median'] * 1000:10.2f} ms "
+            f"({(ratio - 1) * 100:+.0f}%){flag}")
+    return regressions
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="benchmarks", description="Crazy Item benchmarks")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma separated item counts (default: %(default)s)")
+    parser.add_argument("-k", dest="pattern", help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5, help="minimum timed runs per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.5, help="minimum seconds per benchmark")
+    parser.add_argument("--compare", nargs="?", const="previous", metavar="RUN.json",
+                        help="compare with a saved run (default: the latest one)")
+    parser.add_argument("--threshold", type=float, default=0.2, help="slowdown that counts as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit with 1 on a regression")
+    parser.add_argument("--no-save", action="store_true", help="do not save this run in .benchmarks/")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    results = run_benchmarks(sizes, args.pattern, args.repeat, args.min_time)
+    path = None if args.no_save else save_results(results)
+    if path:
+        print(f"Saved to {path}")
+
+    regressions = []
+    if args.compare:
+        baseline = previous_run(exclude=path) if args.compare == "previous" else args.compare
+        if baseline is None:
+            print("No earlier run to compare with")
+        else:
+            regressions = compare(results, baseline, args.threshold)
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
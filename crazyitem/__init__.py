@@ -0,0 +1,35 @@
+"""Qt-free core of the Crazy Item editor.
+
+The names below are imported from their modules on first use, so importing
+the package, or only one module of it, stays cheap.
+"""
+import importlib
+
+_EXPORTS = {
+    "ProjectCache": "cache",
+    "Charmap": "charmap", "decode_char_array": "charmap", "decode_many": "charmap",
+    "encode_char_array": "charmap", "encode_many": "charmap", "read_charmap": "charmap",
+    "DescriptionsError": "descriptions", "StringBlock": "descriptions", "StringIndex": "descriptions",
+    "parse_descriptions": "descriptions", "read_descriptions": "descriptions",
+    "write_descriptions": "descriptions",
+    "Item": "item",
+    "ItemRecord": "item_tables", "ItemTables": "item_tables", "ItemTablesError": "item_tables",
+    "apply_edits": "item_tables", "field_edit": "item_tables", "parse_item_tables": "item_tables",
+    "read_item_tables": "item_tables", "write_edits": "item_tables",
+    "ItemProject": "project", "ProjectError": "project",
+    "Transaction": "transaction", "TransactionError": "transaction", "recover": "transaction",
+}
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,138 @@
+"""On-disk cache of parsed project files.
+
+Parsed results are pickled to ``.crazyitem/project.cache`` inside the decomp
+folder.  Each entry remembers the size, mtime and SHA-1 of the files it was
+built from: matching size and mtime is trusted as is, and a changed mtime with
+an unchanged hash (e.g. after a checkout) still counts as a hit.  Only entries
+whose files really changed have to be parsed again.
+"""
+import hashlib
+import os
+import pickle
+
+from .profiling import timed
+
+# Bump whenever what the loaders store changes shape or meaning
+CACHE_VERSION = 5
+CACHE_DIR = ".crazyitem"
+CACHE_FILE = "project.cache"
+
+
+def file_hash(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def state_folder(base_path):
+    """Returns the editor's folder inside the decomp, creating it (git-ignored) if needed."""
+    folder = os.path.join(base_path, CACHE_DIR)
+    os.makedirs(folder, exist_ok=True)
+    ignore = os.path.join(folder, ".gitignore")
+    if not os.path.exists(ignore):
+        with open(ignore, "w", encoding="utf-8") as f:
+            f.write("*\n")
+    return folder
+
+
+def file_signature(path):
+    st = os.stat(path)
+    return (st.st_size, st.st_mtime_ns, file_hash(path))
+
+
+class ProjectCache:
+    def __init__(self, base_path):
+        self.base_path = base_path
+        self.folder = os.path.join(base_path, CACHE_DIR)
+        self.path = os.path.join(self.folder, CACHE_FILE)
+        self.entries = {}  # name -> (signatures by path, payload)
+        self.changed = False
+        self.read()
+
+    @timed("cache.read", files=("path",))
+    def read(self):
+        try:
+            with open(self.path, "rb") as f:
+                version, entries = pickle.load(f)
+        except Exception:
+            return
+        if version == CACHE_VERSION and isinstance(entries, dict):
+            self.entries = entries
+
+    def get(self, name, paths):
+        """Returns the payload stored under ``name`` if none of ``paths`` changed since."""
+        entry = self.entries.get(name)
+        if entry is None:
+            return None
+        signatures, payload = entry
+        if sorted(signatures) != sorted(paths):
+            return None
+        refreshed = {}
+        for path in paths:
+            size, mtime_ns, digest = signatures[path]
+            try:
+                st = os.stat(path)
+                if st.st_size != size:
+                    return None
+                if st.st_mtime_ns != mtime_ns:
+                    if file_hash(path) != digest:
+                        return None
+                    # Same content with a new mtime: remember it so the next
+                    # start does not hash the file again
+                    refreshed[path] = (size, st.st_mtime_ns, digest)
+            except OSError:
+                return None
+        if refreshed:
+            signatures.update(refreshed)
+            self.changed = True
+        return payload
+
+    def stamp(self, name, path):
+        """The ``(size, mtime_ns)`` of ``path`` that the entry ``name`` was last checked against."""
+        size, mtime_ns, _ = self.entries[name][0][path]
+        return size, mtime_ns
+
+    def signatures(self, paths, stamps=None):
+        """Returns the signatures to ``put`` what is parsed from ``paths`` under.
+
+        They are taken before the files are read, so a file changed while it is
+        parsed does not match next time.  ``stamps`` are the ``(size, mtime_ns)``
+        of files read earlier; returns None if one of them changed since, or if
+        a file is missing.
+        """
+        try:
+            signatures = {path: file_signature(path) for path in paths}
+        except OSError:
+            return None
+        if stamps is not None and any(sig[:2] != stamps.get(path) for path, sig in signatures.items()):
+            return None
+        return signatures
+
+    def put(self, name, signatures, payload):
+        if signatures is None:
+            return
+        self.entries[name] = (signatures, payload)
+        self.changed = True
+
+    @timed("cache.save", files=("path",))
+    def save(self):
+        if not self.changed:
+            return
+        try:
+            state_folder(self.base_path)
+            tmp = self.path + ".tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump((CACHE_VERSION, self.entries), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path)
+        except OSError:
+            return
+        self.changed = False
+
+    def clear(self):
+        self.entries = {}
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,223 @@
+"""Conversion between display names and gItemData ``.name`` char arrays.
+
+A ``Charmap`` holds precomputed token <-> text tables.  The built-in tables
+cover the macros item names use (``_A``, ``_SPACE``, ``_PERIOD``, ...); when
+the decomp ships a ``charmap.txt``, symbols it defines with the same bytes as
+a character (``'♂' = B5`` and ``MALE = B5``) are added on top, so those
+characters encode to ``_MALE`` instead of a C char literal.
+
+The codec is lossless: a token whose text would not encode back to the same
+token is shown as the token itself in braces, e.g. ``{_PK}{_MN}`` or
+``{'a'}``, so ``encode(decode(array))`` gives back the original tokens.
+"""
+import re
+
+MAX_NAME_LENGTH = 13  # bytes before _END; every token is one byte
+
+_PUNCTUATION = {
+    "_SPACE": " ", "_PERIOD": ".", "_HYPHEN": "-", "_APOSTROPHE": "'", "_EXCLAMATION": "!",
+    "_QUESTION": "?", "_eACUTE": "é", "_NEWLINE": "\n", "_AT": "@",
+}
+_ENCODE_PUNCTUATION = {text: token for token, text in _PUNCTUATION.items()}
+
+# Words drawn with dedicated multi-tile glyphs
+_SEQUENCES = [
+    ("Pokeblock", ("_PO", "_KE", "_BL", "_OC", "_OK")),
+    ("Pokéblock", ("_P", "_o", "_k", "_eACUTE", "_BL", "_OC", "_OK")),
+]
+
+_TOKEN_RE = re.compile(r"'(?:\\.|[^'\\])*'|[^,\s']+")
+_ESCAPE_RE = re.compile(r"\{(_\w+|'(?:\\.|[^'\\])*'|\w+)\}")
+_CHARMAP_LINE_RE = re.compile(
+    r"^\s*('(?:\\.|[^'\\])'|[A-Za-z_]\w*)\s*=\s*([0-9A-Fa-f]{2}(?:\s+[0-9A-Fa-f]{2})*)\s*(?:@.*)?$"
+)
+_ESCAPES = {"\\n": "\n", "\\'": "'", "\\\\": "\\"}
+
+
+def _decode_token(token):
+    if token.startswith("'") and token.endswith("'") and len(token) >= 3:
+        return _ESCAPES.get(token[1:-1], token[1:-1])
+    if token.startswith("_") and len(token) == 2:
+        return token[1]
+    return None
+
+
+def _encode_char(ch):
+    if ch.isdigit() and ch.isascii():
+        return f"_{ch}"
+    if ch.isalpha():
+        return f"_{ch}"
+    if ch == "\\":
+        return "'\\\\'"
+    return f"'{ch}'"
+
+
+def split_char_array(array_text):
+    """Returns the tokens of a ``.name`` array up to and including ``_END``."""
+    tokens = []
+    for token in _TOKEN_RE.findall(array_text):
+        tokens.append(token)
+        if token == "_END":
+            break
+    return tokens
+
+
+class Charmap:
+    def __init__(self, symbols=None):
+        """``symbols`` maps extra ``_NAME`` tokens to the character they stand for."""
+        self.encode_table = dict(_ENCODE_PUNCTUATION)
+        for token, ch in (symbols or {}).items():
+            if ch not in self.encode_table and not ch.isalnum():
+                self.encode_table[ch] = token
+        # A token decodes to text only if that text encodes back to it
+        self.decode_table = {token: ch for ch, token in self.encode_table.items()}
+        # First token / first character -> (tokens, word), longest first
+        self.decode_sequences = {}
+        self.encode_sequences = {}
+        for word, tokens in sorted(_SEQUENCES, key=lambda s: -len(s[1])):
+            self.decode_sequences.setdefault(tokens[0], []).append((tokens, word))
+            self.encode_sequences.setdefault(word[0], []).append((tokens, word))
+
+    def decode(self, array_text):
+        """Returns the display name spelled by the tokens of a ``.name`` array."""
+        tokens = split_char_array(array_text)
+        if tokens and tokens[-1] == "_END":
+            tokens.pop()
+        text = self._decode(tokens, ())
+        if any(ch in text for ch in self.encode_sequences) and self.tokens(text, None) != tokens:
+            # Plain letters that happen to spell a sequence word: escape the
+            # characters such a word starts with so they stay apart
+            text = self._decode(tokens, self.encode_sequences)
+        return text
+
+    def _decode(self, tokens, escape):
+        decode_table = self.decode_table
+        sequences = self.decode_sequences
+        result = []
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            if token in sequences:
+                match = next((c for c in sequences[token] if tuple(tokens[i:i + len(c[0])]) == c[0]), None)
+                if match:
+                    pattern, word = match
+                    result.append(word)
+                    i += len(pattern)
+                    continue
+            text = decode_table.get(token)
+            if text is None:
+                text = self._text(token)
+            if text in escape:
+                text = f"{{{token}}}"
+            result.append(text)
+            i += 1
+        return "".join(result)
+
+    def _text(self, token):
+        text = _decode_token(token)
+        if text is None or len(text) != 1 or text == "{" or self._token(text) != token:
+            text = f"{{{token}}}"
+        self.decode_table[token] = text
+        return text
+
+    def tokens(self, text, limit=MAX_NAME_LENGTH):
+        """Returns the tokens spelling ``text``, without ``_END``.
+
+        With a ``limit``, tokens past it are dropped; a sequence word is never cut in half.
+        """
+        encode_table = self.encode_table
+        sequences = self.encode_sequences
+        result = []
+        i = 0
+        while i < len(text):
+            ch = text[i]
+            if ch == "{":
+                m = _ESCAPE_RE.match(text, i)
+                if m:
+                    result.append(m.group(1))
+                    i = m.end()
+                    continue
+            elif ch in sequences:
+                match = next((c for c in sequences[ch] if text.startswith(c[1], i)), None)
+                if match:
+                    tokens, word = match
+                    if limit is not None and len(result) + len(tokens) > limit:
+                        return result
+                    result.extend(tokens)
+                    i += len(word)
+                    continue
+            token = encode_table.get(ch)
+            if token is None:
+                token = self._token(ch)
+            result.append(token)
+            i += 1
+        if limit is not None:
+            del result[limit:]
+        return result
+
+    def _token(self, ch):
+        token = self.encode_table.get(ch)
+        if token is None:
+            token = self.encode_table[ch] = _encode_char(ch)
+        return token
+
+    def length(self, text):
+        """Returns how many bytes ``text`` takes in ``.name``, ``_END`` excluded."""
+        return len(self.tokens(text, None))
+
+    def encode(self, text, limit=MAX_NAME_LENGTH):
+        """Returns the ``.name`` array text spelling ``text``, ``_END`` included."""
+        return ", ".join(self.tokens(text, limit) + ["_END"])
+
+    def decode_many(self, arrays):
+        decode = self.decode
+        return [decode(array_text) for array_text in arrays]
+
+    def encode_many(self, texts, limit=MAX_NAME_LENGTH):
+        encode = self.encode
+        return [encode(text, limit) for text in texts]
+
+
+def parse_charmap(text):
+    """Returns the ``_NAME`` -> character pairs a charmap.txt implies.
+
+    A symbol counts when it has exactly the bytes of a single quoted character.
+    """
+    chars = {}
+    names = {}
+    for line in text.splitlines():
+        m = _CHARMAP_LINE_RE.match(line)
+        if not m:
+            continue
+        key, value = m.group(1), bytes.fromhex("".join(m.group(2).split()))
+        if key.startswith("'"):
+            ch = _ESCAPES.get(key[1:-1], key[1:-1])
+            if len(ch) == 1:
+                chars.setdefault(value, ch)
+        else:
+            names.setdefault(key, value)
+    return {f"_{name}": chars[value] for name, value in names.items() if value in chars}
+
+
+def read_charmap(path):
+    with open(path, encoding="utf-8") as f:
+        return Charmap(parse_charmap(f.read()))
+
+
+DEFAULT_CHARMAP = Charmap()
+
+
+def decode_char_array(array_text):
+    return DEFAULT_CHARMAP.decode(array_text)
+
+
+def encode_char_array(text):
+    return DEFAULT_CHARMAP.encode(text)
+
+
+def decode_many(arrays):
+    return DEFAULT_CHARMAP.decode_many(arrays)
+
+
+def encode_many(texts):
+    return DEFAULT_CHARMAP.encode_many(texts)
@@ -0,0 +1,170 @@
+"""Command line access to the item tables, no display needed.
+
+    python -m crazyitem --project path/to/decomp list --search "pocket:key_items price>1000"
+    python -m crazyitem get ITEM_POTION
+    python -m crazyitem set 0x0D Price=300 Pocket=POCKET_ITEMS
+    python -m crazyitem add MY_ITEM --name "My Item" --price 200 --description "..." --icon icon.png
+    python -m crazyitem add-batch new_items.csv
+    python -m crazyitem export items.csv
+    python -m crazyitem export items.parquet
+    python -m crazyitem import changes.csv --dry-run
+    python -m crazyitem --profile --profile-stats load.pstats list
+"""
+import argparse
+import os
+import sys
+
+from .profiling import PROFILER, configure, span
+from .project import POCKETS, USE_TYPES, ItemProject, ProjectError, item_constant
+from .search import SearchIndex
+from .tabular import FORMATS, TabularError, read_rows, write_rows
+
+
+def cmd_list(project, args):
+    if args.search:
+        rows = SearchIndex(project).search(args.search)
+    else:
+        rows = range(len(project.data))
+    for idx in rows:
+        item = project.data[idx]
+        item_id = item["ID"]
+        print(f"{item_id:5d}  0x{item_id:03X}  {project.item_id_to_name.get(item_id, ''):<32} {item['Name']}")
+    return 0
+
+
+def cmd_get(project, args):
+    row = project.item_row(project.find_item(args.item))
+    width = max(len(column) for column in row)
+    for column, value in row.items():
+        print(f"{column + ':':<{width + 1}} {value}")
+    return 0
+
+
+def cmd_set(project, args):
+    idx = project.find_item(args.item)
+    fields = {field.lower(): field for field in project.columns()}
+    row = {"ID": idx}
+    for assignment in args.assignments:
+        name, sep, value = assignment.partition("=")
+        field = fields.get(name.strip().lower())
+        if not sep or field is None or field in ("ID", "Constant"):
+            raise ProjectError(f"Expected FIELD=VALUE with an editable field, got {assignment!r}")
+        row[field] = value
+    changed = project.apply_row(row)
+    project.save_all()
+    print(f"{changed} field(s) changed")
+    return 0
+
+
+def cmd_add(project, args):
+    new_id = project.add_item(
+        args.const, args.name, args.price, args.pocket, args.type, args.description, args.icon
+    )
+    for warning in project.warnings:
+        print(f"warning: {warning}", file=sys.stderr)
+    print(f"ITEM_{item_constant(args.const)} added as ID 0x{new_id:03X}")
+    return 0
+
+
+def cmd_add_batch(project, args):
+    base_dir = os.path.dirname(os.path.abspath(args.path))
+    specs = [project.item_spec(row, base_dir) for row in read_rows(args.path, args.format)]
+    new_ids = project.add_items(specs)
+    for warning in project.warnings:
+        print(f"warning: {warning}", file=sys.stderr)
+    if new_ids:
+        print(f"{len(new_ids)} items added as IDs 0x{new_ids[0]:03X}-0x{new_ids[-1]:03X}")
+    else:
+        print("No items to add")
+    return 0
+
+
+def cmd_export(project, args):
+    # One pass over the parsed tables; the project's item list is not built first
+    with span("export", [args.path]):
+        count = write_rows(args.path, project.columns(), project.iter_rows(), args.format)
+    print(f"{count} items written to {args.path}")
+    return 0
+
+
+def cmd_import(project, args):
+    rows = read_rows(args.path, args.format)
+    changes = project.diff_rows(rows)
+    for idx, column, old, new in changes:
+        print(f"{project.item_id_to_name.get(idx, idx)}  {column}: {old!r} -> {new!r}")
+    items = len({idx for idx, _, _, _ in changes})
+    print(f"{len(rows)} rows read, {len(changes)} field(s) to change on {items} item(s)")
+    if changes and not args.dry_run:
+        project.apply_changes(changes)
+        project.save_all()
+        print("Changes written")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="crazyitem", description="Crazy Item command line editor")
+    parser.add_argument("--project", "-p", default=".", help="decomp folder (default: current directory)")
+    parser.add_argument("--no-cache", action="store_true", help="parse every file instead of using .crazyitem/")
+    parser.add_argument("--profile", action="store_true",
+                        help="print the time each loader and writer took (also: CRAZYITEM_PROFILE=1)")
+    parser.add_argument("--profile-stats", metavar="FILE.pstats",
+                        help="also run cProfile and write its stats to this file (also: CRAZYITEM_PROFILE=FILE)")
+    sub = parser.add_subparsers(dest="command")
+    sub.required = True
+
+    p = sub.add_parser("list", help="list items")
+    p.add_argument("--search", "-s", help="search query, e.g. 'potion' or 'pocket:key_items price>1000'")
+    p.set_defaults(func=cmd_list)
+
+    p = sub.add_parser("get", help="show every field of one item")
+    p.add_argument("item", help="item ID (decimal or 0x hex) or constant")
+    p.set_defaults(func=cmd_get)
+
+    p = sub.add_parser("set", help="change fields of one item")
+    p.add_argument("item", help="item ID (decimal or 0x hex) or constant")
+    p.add_argument("assignments", nargs="+", metavar="FIELD=VALUE")
+    p.set_defaults(func=cmd_set)
+
+    p = sub.add_parser("add", help="add a new item")
+    p.add_argument("const", help="constant name without ITEM_ (e.g. MY_ITEM)")
+    p.add_argument("--name", required=True, help="display name (max 13 chars)")
+    p.add_argument("--price", required=True)
+    p.add_argument("--pocket", default=POCKETS[0], choices=POCKETS)
+    p.add_argument("--type", default=USE_TYPES[0], choices=USE_TYPES)
+    p.add_argument("--description", required=True)
+    p.add_argument("--icon", required=True, help="24x24 PNG")
+    p.set_defaults(func=cmd_add)
+
+    p = sub.add_parser("add-batch", help="add every item listed in a file in one go")
+    p.add_argument("path", help=".csv, .json or .jsonl file with Constant, Name, Price, Pocket, Type, Description and Icon columns")
+    p.add_argument("--format", choices=FORMATS, help="override the format implied by the extension")
+    p.set_defaults(func=cmd_add_batch)
+
+    for name, help_text in [("export", "write all items to a file"), ("import", "apply field changes from a file")]:
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("path", help=".csv, .json, .jsonl or .parquet file (Parquet needs pyarrow)")
+        p.add_argument("--format", choices=FORMATS, help="override the format implied by the extension")
+        p.set_defaults(func=cmd_export if name == "export" else cmd_import, load=name != "export")
+        if name == "import":
+            p.add_argument("--dry-run", "-n", action="store_true", help="only show what would change")
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    profiling = configure(args.profile, args.profile_stats)
+    project = ItemProject(args.project, use_cache=not args.no_cache)
+    try:
+        if getattr(args, "load", True):
+            project.load_all()
+        return args.func(project, args)
+    except (OSError, ProjectError, TabularError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if profiling:
+            PROFILER.stop()
+            print(PROFILER.flush(), file=sys.stderr)
+            if PROFILER.stats_path:
+                print(f"cProfile stats written to {PROFILER.stats_path}", file=sys.stderr)
@@ -0,0 +1,135 @@
+"""Streaming parser for strings/item_descriptions.string.
+
+The file is a list of ``#org @TAG`` blocks.  It is read line by line and only
+the byte range of each block is kept besides the text, so writers can replace
+the text of the blocks that changed and leave every other byte of the file
+alone.
+"""
+from .transaction import replace_file
+
+ORG_PREFIX = b"#org @"
+BOM = b"\xef\xbb\xbf"
+
+
+class DescriptionsError(Exception):
+    pass
+
+
+class StringBlock:
+    """Byte offsets of one ``#org @TAG`` block."""
+
+    def __init__(self, tag, start, text_start):
+        self.tag = tag
+        self.start = start            # offset of the #org line
+        self.text_start = text_start  # offset just past the #org line
+        self.text_end = text_start    # offset just past the last non-blank line
+        self.text_newline = False     # whether that last line ends with a newline
+
+
+class StringIndex:
+    def __init__(self):
+        self.blocks = {}  # tag -> StringBlock, in file order
+        self.size = 0
+        self.newline = b"\n"
+        self.ends_with_newline = True
+
+
+def parse_descriptions(lines):
+    """Returns ``(index, texts)`` for an iterable of the file's byte lines.
+
+    ``texts`` maps each tag to its lines, stripped and joined with ``\\n``.
+    """
+    index = StringIndex()
+    texts = {}
+    _parse(lines, index, texts, 0)
+    return index, texts
+
+
+def _parse(lines, index, texts, pos):
+    block = None
+    text_lines = []
+    line = b""
+    for line in lines:
+        start = pos
+        pos += len(line)
+        if start == 0 and line.startswith(BOM):
+            start = len(BOM)
+            line = line[len(BOM):]
+        if line.startswith(ORG_PREFIX):
+            if block is not None and text_lines:
+                texts[block.tag] = "\n".join(text_lines).strip()
+            if not index.blocks and line.endswith(b"\n"):
+                index.newline = b"\r\n" if line.endswith(b"\r\n") else b"\n"
+            block = StringBlock(line[len(ORG_PREFIX):].strip().decode("utf-8"), start, pos)
+            index.blocks[block.tag] = block
+            text_lines = []
+        elif block is not None:
+            text = line.strip()
+            text_lines.append(text.decode("utf-8"))
+            if text:
+                block.text_end = pos
+                block.text_newline = line.endswith(b"\n")
+    if block is not None and text_lines:
+        texts[block.tag] = "\n".join(text_lines).strip()
+    if line:
+        index.ends_with_newline = line.endswith(b"\n")
+    index.size = pos
+
+
+def read_descriptions(path):
+    with open(path, "rb") as f:
+        return parse_descriptions(f)
+
+
+def write_descriptions(path, index, changes, transaction=None):
+    """Writes the text of every tag in ``changes`` and moves ``index`` along.
+
+    Only the lines of the changed blocks are replaced and tags the file does not
+    have yet are appended; every other byte stays as it was.  With a
+    ``transaction`` the new file is only staged in it.
+    """
+    if not changes:
+        return
+    nl = index.newline
+    edits = []
+    appended = b""
+    for tag, text in changes.items():
+        body = nl.join(line.encode("utf-8") for line in text.splitlines())
+        block = index.blocks.get(tag)
+        if block is None:
+            appended += nl + ORG_PREFIX + tag.encode("utf-8") + nl + body + nl
+        elif block.text_end > block.text_start:
+            edits.append((block, body + nl if body and block.text_newline else body))
+        elif body:
+            if block.text_start == index.size and not index.ends_with_newline:
+                body = nl + body  # the #org line is the last line of the file
+            edits.append((block, body + nl))
+    edits.sort(key=lambda edit: edit[0].text_start)
+
+    with open(path, "rb") as f:
+        raw = f.read()
+    if len(raw) != index.size or not all(raw.startswith(ORG_PREFIX, block.start) for block, _ in edits):
+        raise DescriptionsError("item_descriptions.string was changed outside the editor, reload it first")
+
+    parts = []
+    pos = 0
+    for block, data in edits:
+        parts.append(raw[pos:block.text_start])
+        parts.append(data)
+        pos = block.text_end
+    parts.append(raw[pos:])
+    if appended:
+        if raw and not b"".join(parts).endswith(b"\n"):
+            appended = nl + appended
+        parts.append(appended)
+    new_raw = b"".join(parts)
+    replace_file(path, new_raw, transaction)
+
+    # Everything from the block holding the first change on moved: index it again
+    if edits:
+        start = edits[0][0].start
+    else:
+        start = max((block.start for block in index.blocks.values()), default=0)
+    for tag in [tag for tag, block in index.blocks.items() if block.start >= start]:
+        del index.blocks[tag]
+    _parse(new_raw[start:].splitlines(keepends=True), index, {}, start)
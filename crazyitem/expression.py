@@ -0,0 +1,134 @@
+"""Values and arithmetic for bulk edits.
+
+``evaluate("price * 1.1", item)`` computes a new value from the fields of one
+item.  The text is parsed with ``ast`` and only numbers, field names,
+arithmetic, comparisons and a few functions are allowed, so nothing typed
+into the editor can run code.  Text that is not an expression, such as
+``POCKET_KEY_ITEMS`` or ``(void*) 0x80A2325``, is a plain value.
+"""
+import ast
+import math
+import operator
+
+from .item import FIELDS
+
+_BINARY = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv, ast.Mod: operator.mod, ast.Pow: operator.pow,
+    ast.BitAnd: operator.and_, ast.BitOr: operator.or_, ast.LShift: operator.lshift, ast.RShift: operator.rshift,
+}
+_UNARY = {ast.USub: operator.neg, ast.UAdd: operator.pos, ast.Invert: operator.invert}
+_COMPARE = {
+    ast.Lt: operator.lt, ast.LtE: operator.le, ast.Gt: operator.gt, ast.GtE: operator.ge,
+    ast.Eq: operator.eq, ast.NotEq: operator.ne,
+}
+_FUNCTIONS = {
+    "round": round, "int": int, "min": min, "max": max, "abs": abs,
+    "floor": math.floor, "ceil": math.ceil,
+}
+# Field names as typed in expressions, case-insensitive
+_NAMES = {field.lower(): field for field in FIELDS}
+_NAMES.update({"holdeffectparam": "HoldParam", "hold": "HoldEffect", "id": "ID"})
+# What the numeric members of struct Item can hold; the rest are u8
+_U8 = (0, 0xFF)
+_RANGES = {"Price": (0, 0xFFFF), "ID": (0, 0xFFFF), "FieldUseFunc": (0, 0xFFFFFFFF), "BattleUseFunc": (0, 0xFFFFFFFF)}
+# Larger intermediate values are refused, so nested powers and shifts cannot eat the memory
+_LIMIT = 1 << 64
+
+
+class ExpressionError(Exception):
+    pass
+
+
+def _number(text, field):
+    if isinstance(text, (int, float)):
+        return text
+    try:
+        return int(text, 0)
+    except ValueError:
+        try:
+            return float(text)
+        except ValueError:
+            raise ExpressionError(f"{field} is {text!r}, not a number")
+
+
+def is_expression(text):
+    """Whether ``text`` is arithmetic over fields rather than a plain value."""
+    try:
+        tree = ast.parse(text.strip(), mode="eval").body
+    except SyntaxError:
+        return False
+    if isinstance(tree, ast.Name):
+        return tree.id.lower() in _NAMES
+    return not isinstance(tree, ast.Constant)
+
+
+def evaluate(text, item, field=None):
+    """Returns the text ``text`` gives for ``item``: the result of an expression, or ``text`` itself.
+
+    With ``field``, the result of an expression must fit in that member of
+    struct Item (a u8 unless listed in ``_RANGES``).
+    """
+    if not is_expression(text):
+        return text.strip()
+    value = _eval(ast.parse(text.strip(), mode="eval").body, item)
+    if isinstance(value, bool):
+        value = int(value)
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            raise ExpressionError(f"{text} gives {value}")
+        value = int(round(value))  # every numeric gItemData field is an integer
+    if field is not None and field not in ("Name", "Desc"):
+        low, high = _RANGES.get(field, _U8)
+        if not low <= value <= high:
+            raise ExpressionError(f"{text} gives {value}, {field} must be between {low} and {high}")
+    return str(value)
+
+
+def _bounded(value):
+    if isinstance(value, int) and abs(value) >= _LIMIT:
+        raise ExpressionError("Value too large")
+    return value
+
+
+def _eval(node, item):
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            return _bounded(node.value)
+        raise ExpressionError(f"Unsupported value {node.value!r}")
+    if isinstance(node, ast.Name):
+        field = _NAMES.get(node.id.lower())
+        if field is None:
+            raise ExpressionError(f"Unknown field {node.id}")
+        return _number(item[field], field)
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY:
+        left, right = _eval(node.left, item), _eval(node.right, item)
+        if isinstance(node.op, (ast.Pow, ast.LShift)) and abs(right) > 64:
+            raise ExpressionError("Exponent too large")
+        try:
+            return _bounded(_BINARY[type(node.op)](left, right))
+        except (ArithmeticError, TypeError, ValueError) as e:
+            raise ExpressionError(str(e))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY:
+        try:
+            return _UNARY[type(node.op)](_eval(node.operand, item))
+        except TypeError as e:
+            raise ExpressionError(str(e))
+    if isinstance(node, ast.Compare) and all(type(op) in _COMPARE for op in node.ops):
+        left = _eval(node.left, item)
+        for op, comparator in zip(node.ops, node.comparators):
+            right = _eval(comparator, item)
+            if not _COMPARE[type(op)](left, right):
+                return 0
+            left = right
+        return 1
+    if isinstance(node, ast.IfExp):
+        return _eval(node.body, item) if _eval(node.test, item) else _eval(node.orelse, item)
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in _FUNCTIONS
+            and not node.keywords):
+        args = [_eval(arg, item) for arg in node.args]
+        try:
+            return _bounded(_FUNCTIONS[node.func.id](*args))
+        except (ArithmeticError, TypeError, ValueError) as e:
+            raise ExpressionError(str(e))
+    raise ExpressionError(f"{type(node).__name__} is not allowed in an expression")
@@ -0,0 +1,140 @@
+"""Undo/redo of item edits.
+
+A step holds only what changed, as ``("field", idx, column, old, new)`` and
+``("description", tag, old, new)`` entries, never copies of the items.  The
+oldest steps are dropped once there are too many or they hold too much text.
+Undoing and redoing only change the project in memory, so any number of
+steps costs a single write when the project is saved.
+"""
+from collections import deque
+from contextlib import contextmanager
+
+MAX_STEPS = 500
+MAX_SIZE = 2000000  # characters of old and new values kept over all steps
+
+
+def _size(change):
+    return 32 + sum(len(value) for value in change[-2:] if isinstance(value, str))
+
+
+class Step:
+    def __init__(self, label):
+        self.label = label
+        self.changes = []
+        self.size = 0
+
+    def add(self, change):
+        self.changes.append(change)
+        self.size += _size(change)
+
+
+class History:
+    def __init__(self, max_steps=MAX_STEPS, max_size=MAX_SIZE):
+        self.max_steps = max_steps
+        self.max_size = max_size
+        self.clear()
+
+    def clear(self):
+        self.undo_steps = deque()
+        self.redo_steps = []
+        self.size = 0
+        self.open = None  # the step being grouped by ``step``
+        self.depth = 0
+        self.replaying = False
+
+    @contextmanager
+    def step(self, label=""):
+        """Groups every change recorded inside the block into one undo step."""
+        if self.depth == 0:
+            self.open = Step(label)
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            if self.depth == 0:
+                step, self.open = self.open, None
+                self._push(step)
+
+    @contextmanager
+    def paused(self):
+        """Changes made inside the block are not recorded (used while replaying)."""
+        replaying, self.replaying = self.replaying, True
+        try:
+            yield
+        finally:
+            self.replaying = replaying
+
+    def record(self, change):
+        if self.replaying:
+            return
+        if self.open is not None:
+            self.open.add(change)
+            return
+        step = Step("")
+        step.add(change)
+        self._push(step)
+
+    def _push(self, step):
+        if not step.changes:
+            return
+        self.size -= sum(s.size for s in self.redo_steps)
+        self.redo_steps = []
+        self.undo_steps.append(step)
+        self.size += step.size
+        while len(self.undo_steps) > 1 and (len(self.undo_steps) > self.max_steps or self.size > self.max_size):
+            self.size -= self.undo_steps.popleft().size
+
+    def remap(self, moved):
+        """Moves item changes to new indices (``moved``: old index -> new one, or None if gone).
+
+        Changes of items that are gone are dropped, and so are the steps left empty.
+        """
+        def remapped(steps):
+            kept = []
+            for step in steps:
+                new = Step(step.label)
+                for change in step.changes:
+                    if change[0] == "field":
+                        idx = moved.get(change[1])
+                        if idx is None:
+                            continue
+                        change = (change[0], idx) + change[2:]
+                    new.add(change)
+                if new.changes:
+                    kept.append(new)
+            return kept
+
+        self.undo_steps = deque(remapped(self.undo_steps))
+        self.redo_steps = remapped(self.redo_steps)
+        self.size = sum(step.size for step in self.undo_steps) + sum(step.size for step in self.redo_steps)
+
+    def can_undo(self):
+        return bool(self.undo_steps)
+
+    def can_redo(self):
+        return bool(self.redo_steps)
+
+    def undo_label(self):
+        return self.undo_steps[-1].label if self.undo_steps else ""
+
+    def redo_label(self):
+        return self.redo_steps[-1].label if self.redo_steps else ""
+
+    def undo(self, steps=1):
+        """Moves up to ``steps`` steps to the redo stack; returns their changes, last one first."""
+        changes = []
+        for _ in range(min(steps, len(self.undo_steps))):
+            step = self.undo_steps.pop()
+            self.redo_steps.append(step)
+            changes.extend(reversed(step.changes))
+        return changes
+
+    def redo(self, steps=1):
+        """Moves up to ``steps`` steps back to the undo stack; returns their changes in order."""
+        changes = []
+        for _ in range(min(steps, len(self.redo_steps))):
+            step = self.redo_steps.pop()
+            self.undo_steps.append(step)
+            changes.extend(step.changes)
+        return changes
@@ -0,0 +1,105 @@
+"""Compact record type for the rows of ``ItemProject.data``.
+
+An ``Item`` keeps its fields in ``__slots__`` instead of a dict of its own,
+which takes about a fifth of the memory, and still reads like the dicts the
+editor used before: ``item["Price"]``, ``item.get("Desc")``, ``dict(item)``.
+Code that touches a lot of items can use the attributes (``item.Price``)
+directly, which is faster than going through the mapping methods.
+"""
+import sys
+
+HEADERS = ["Name", "Price", "HoldEffect", "HoldParam", "Pocket", "Type", "Desc"]
+EXTRA_FIELDS = ["Importance", "Unk19", "FieldUseFunc", "BattleUsage", "BattleUseFunc", "SecondaryId"]
+FIELDS = tuple(HEADERS + EXTRA_FIELDS + ["ID"])
+_FIELD_SET = frozenset(FIELDS)
+
+
+class Item:
+    __slots__ = FIELDS
+
+    def __init__(self, Name="", Price="", HoldEffect="", HoldParam="", Pocket="", Type="", Desc="",
+                 Importance="", Unk19="", FieldUseFunc="", BattleUsage="", BattleUseFunc="", SecondaryId="",
+                 ID=0):
+        self.Name = Name
+        self.Price = Price
+        self.HoldEffect = HoldEffect
+        self.HoldParam = HoldParam
+        self.Pocket = Pocket
+        self.Type = Type
+        self.Desc = Desc
+        self.Importance = Importance
+        self.Unk19 = Unk19
+        self.FieldUseFunc = FieldUseFunc
+        self.BattleUsage = BattleUsage
+        self.BattleUseFunc = BattleUseFunc
+        self.SecondaryId = SecondaryId
+        self.ID = ID
+
+    @classmethod
+    def from_fields(cls, name, index, fields, columns):
+        """Builds an item from parsed gItemData ``fields`` (C name -> text).
+
+        ``columns`` lists ``(c_name, column)`` pairs.  Values such as pockets,
+        types and hold effects repeat across items, so they are interned and
+        every item shares the same string objects.
+        """
+        item = cls(name, ID=index)
+        intern = sys.intern
+        for c_name, column in columns:
+            value = fields.get(c_name)
+            if value:
+                setattr(item, column, intern(value))
+        return item
+
+    def __getitem__(self, field):
+        if field not in _FIELD_SET:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __setitem__(self, field, value):
+        if field not in _FIELD_SET:
+            raise KeyError(field)
+        setattr(self, field, value)
+
+    def __contains__(self, field):
+        return field in _FIELD_SET
+
+    def __iter__(self):
+        return iter(FIELDS)
+
+    def __len__(self):
+        return len(FIELDS)
+
+    def get(self, field, default=None):
+        return getattr(self, field) if field in _FIELD_SET else default
+
+    def keys(self):
+        return list(FIELDS)
+
+    def values(self):
+        return [getattr(self, field) for field in FIELDS]
+
+    def items(self):
+        return [(field, getattr(self, field)) for field in FIELDS]
+
+    def copy(self):
+        return Item(*self.values())
+
+    def __eq__(self, other):
+        if isinstance(other, Item):
+            return self.values() == other.values()
+        if isinstance(other, dict):
+            return dict(self.items()) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __getstate__(self):
+        return tuple(self.values())
+
+    def __setstate__(self, state):
+        for field, value in zip(FIELDS, state):
+            setattr(self, field, value)
+
+    def __repr__(self):
+        return f"Item(Name={self.Name!r}, ID={self.ID!r})"
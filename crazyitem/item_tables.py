@@ -0,0 +1,312 @@
+"""Single-pass parser for src/tables/item_tables.c.
+
+The file is walked once as bytes.  Every ``gItemData`` entry becomes an
+``ItemRecord`` holding the raw text of each designated field, and
+``gItemGraphicsTable`` rows are collected in the same pass.  Byte offsets of
+entries and of their field values are kept so writers can splice new values
+in without reformatting anything else.
+"""
+import bisect
+import os
+import re
+
+from .transaction import replace_file
+
+ITEM_DATA_SYMBOL = b"gItemData"
+GRAPHICS_TABLE_SYMBOL = b"gItemGraphicsTable"
+
+# Building blocks.  Every loop below is written as ``plain (special plain)*``
+# with disjoint first characters, so a failed match never backtracks
+# exponentially.
+_STR = rb'"(?:\\.|[^"\\\n])*"'
+_CHR = rb"'(?:\\.|[^'\\\n])*'"
+_CMT = rb"//[^\n]*|/\*.*?\*/"
+_ATOM = rb"(?:" + _STR + rb"|" + _CHR + rb"|" + _CMT + rb"|/)"
+_GROUP = rb"\{[^{}\"'/]*(?:" + _ATOM + rb"[^{}\"'/]*)*\}"
+# Parentheses nest two deep, so the commas in ``HOLD(1, (2, 3))`` stay in the value;
+# an unbalanced one is taken as a plain character
+_PARENS = rb"\([^()\"'/]*(?:" + _ATOM + rb"[^()\"'/]*)*\)"
+_PARENS = rb"\([^()\"'/]*(?:(?:" + _ATOM + rb"|" + _PARENS + rb")[^()\"'/]*)*\)"
+_VALUE = rb"[^,{}\"'/(]*(?:(?:" + _ATOM + rb"|" + _GROUP + rb"|" + _PARENS + rb"|\()[^,{}\"'/(]*)*"
+_ENTRY = rb"\{[^{}\"'/]*(?:(?:" + _ATOM + rb"|" + _GROUP + rb")[^{}\"'/]*)*\}"
+# Whitespace, commas, comments, preprocessor lines and ``[ITEM_X] =``
+# designators that may sit between the rows of an initializer.
+_SEP = rb"(?:\s+|,|" + _CMT + rb"|\#[^\n]*|\[[^\]\n]*\]\s*=)*"
+
+_TOP_RE = re.compile(_CMT + rb"|" + _STR + rb"|" + _CHR + rb"|[{};]", re.DOTALL)
+_DATA_STEP_RE = re.compile(_SEP + rb"(?:(" + _ENTRY + rb")|\})", re.DOTALL)
+_GRAPHICS_STEP_RE = re.compile(_SEP + rb"(?:\{([^{}]*)\}|\})", re.DOTALL)
+_FIELD_RE = re.compile(
+    rb"(?:" + _CMT + rb")|\.\s*([A-Za-z_]\w*)\s*=(?!=)\s*(" + _VALUE + rb")", re.DOTALL
+)
+_COMMENT_RE = re.compile(_CMT, re.DOTALL)
+_DECL_RE = re.compile(rb"([A-Za-z_]\w*)\s*(?:\[[^\]]*\]\s*)*=\s*\Z")
+_SPACE = b" \t\r\n"
+
+
+class ItemTablesError(Exception):
+    pass
+
+
+class ItemRecord:
+    """One ``gItemData`` entry and the raw text of its designated fields."""
+
+    def __init__(self, index, start, end, fields):
+        self.index = index
+        self.start = start    # offset of the entry's opening brace
+        self.end = end        # offset just past the entry's closing brace
+        self.fields = fields  # C field name -> raw value text
+        self.spans = None     # C field name -> (start, end), filled on demand
+
+    def name_array(self):
+        """Returns the text between the braces of ``.name = {...}``."""
+        value = self.fields.get("name", "")
+        if value.startswith("{") and value.endswith("}"):
+            return value[1:-1]
+        return ""
+
+
+class ItemTables:
+    """Everything read from one pass over item_tables.c."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.items = []
+        self.item_id_to_name = {}
+        self.graphics_table = {}
+        self.item_data_end = -1        # offset of gItemData's closing brace
+        self.graphics_table_end = -1   # offset of gItemGraphicsTable's closing brace
+
+    def __getstate__(self):
+        # The file bytes are not pickled; whoever unpickles reads them back from disk
+        state = dict(self.__dict__)
+        state["raw"] = b""
+        return state
+
+    def field_spans(self, record):
+        """Returns the byte span of every field value of ``record``."""
+        if record.spans is None:
+            spans = {}
+            for m in _FIELD_RE.finditer(self.raw, record.start + 1, record.end - 1):
+                if m.group(1):
+                    start, end = m.span(2)
+                    while end > start and self.raw[end - 1] in _SPACE:
+                        end -= 1
+                    spans[m.group(1).decode("ascii")] = (start, end)
+            record.spans = spans
+        return record.spans
+
+
+def _skip_braces(raw, pos):
+    """Returns the offset just past the brace closing the one opened before ``pos``."""
+    depth = 1
+    while depth:
+        m = _TOP_RE.search(raw, pos)
+        if not m:
+            return len(raw)
+        pos = m.end()
+        tok = m.group()
+        if tok == b"{":
+            depth += 1
+        elif tok == b"}":
+            depth -= 1
+    return pos
+
+
+def _parse_fields(raw, start, end):
+    fields = {}
+    for name, value in _FIELD_RE.findall(raw, start, end):
+        if name:
+            fields[name.decode("ascii")] = value.strip().decode("utf-8")
+    return fields
+
+
+def _parse_item_data(raw, pos, tables):
+    items = tables.items
+    while True:
+        m = _DATA_STEP_RE.match(raw, pos)
+        if m is None:
+            # Something the fast path does not understand, e.g. a nested
+            # initializer: fall back to plain brace matching for this entry.
+            brace = raw.find(b"{", pos)
+            close = raw.find(b"}", pos)
+            if close < 0:
+                return len(raw)
+            if brace < 0 or close < brace:
+                tables.item_data_end = close
+                return close + 1
+            start, end = brace, _skip_braces(raw, brace + 1)
+        elif m.lastindex is None:
+            tables.item_data_end = m.end() - 1
+            return m.end()
+        else:
+            start, end = m.span(1)
+        record = ItemRecord(len(items), start, end, _parse_fields(raw, start + 1, end - 1))
+        items.append(record)
+        item_const = record.fields.get("itemId", "")
+        if item_const.startswith("ITEM_"):
+            tables.item_id_to_name[record.index] = item_const
+        pos = end
+
+
+def _parse_graphics_table(raw, pos, tables):
+    graphics = tables.graphics_table
+    while True:
+        m = _GRAPHICS_STEP_RE.match(raw, pos)
+        if m is None:
+            return _skip_braces(raw, pos)
+        if m.lastindex is None:
+            tables.graphics_table_end = m.end() - 1
+            return m.end()
+        cells = m.group(1).split(b",")
+        if len(cells) >= 2:
+            graphics[len(graphics)] = (cells[0].strip().decode("utf-8"), cells[1].strip().decode("utf-8"))
+        pos = m.end()
+
+
+def parse_item_tables(raw):
+    """Parses the bytes of item_tables.c into an ``ItemTables``."""
+    tables = ItemTables(raw)
+    pos = 0
+    decl_start = 0
+    while True:
+        m = _TOP_RE.search(raw, pos)
+        if not m:
+            break
+        tok = m.group()
+        if tok == b"{":
+            header = _COMMENT_RE.sub(b"", raw[decl_start:m.start()])
+            decl = _DECL_RE.search(header)
+            symbol = decl.group(1) if decl else None
+            if symbol == ITEM_DATA_SYMBOL:
+                pos = _parse_item_data(raw, m.end(), tables)
+            elif symbol == GRAPHICS_TABLE_SYMBOL:
+                pos = _parse_graphics_table(raw, m.end(), tables)
+            else:
+                pos = _skip_braces(raw, m.end())
+            decl_start = pos
+            continue
+        if tok == b";" or tok == b"}":
+            decl_start = m.end()
+        pos = m.end()
+    return tables
+
+
+def read_item_tables(path):
+    with open(path, "rb") as f:
+        return parse_item_tables(f.read())
+
+
+def field_edit(tables, record, field, text):
+    """Returns a ``(start, end, bytes)`` edit setting ``field`` of ``record`` to ``text``.
+
+    Fields the entry does not have yet are added on a new line after the last one.
+    """
+    raw = tables.raw
+    value = text.encode("utf-8")
+    spans = tables.field_spans(record)
+    if field in spans:
+        start, end = spans[field]
+        return (start, end, value)
+
+    pos = record.end - 1
+    while pos > record.start + 1 and raw[pos - 1] in _SPACE:
+        pos -= 1
+    line_start = raw.rfind(b"\n", 0, pos) + 1
+    line = raw[line_start:pos]
+    indent = line[:len(line) - len(line.lstrip(b" \t"))]
+    newline = b"\r\n" if raw[line_start - 2:line_start] == b"\r\n" else b"\n"
+    sep = b"" if raw[pos - 1:pos] in (b",", b"{") else b","
+    return (pos, pos, sep + newline + indent + b"." + field.encode("ascii") + b" = " + value + b",")
+
+
+def append_rows(tables, end, text):
+    """Returns a ``(start, end, bytes)`` edit adding ``text`` as rows before the closing brace at ``end``.
+
+    ``text`` uses ``\n`` line ends and is written with the file's own.
+    """
+    raw = tables.raw
+    line_start = raw.rfind(b"\n", 0, end) + 1
+    newline = b"\r\n" if raw[line_start - 2:line_start] == b"\r\n" else b"\n"
+    data = text.encode("utf-8").replace(b"\n", newline)
+    if raw[line_start:end].strip(_SPACE):
+        # The brace shares its line with the last row, so the new rows start a line of their own
+        return (end, end, newline + data)
+    return (line_start, line_start, data)
+
+
+def apply_edits(tables, edits):
+    """Splices ``edits`` into ``tables.raw`` and moves every recorded offset along.
+
+    Returns the offset of the first changed byte.
+    """
+    edits = sorted(edits, key=lambda edit: (edit[0], edit[1]))
+    raw = tables.raw
+    parts = []
+    starts = []
+    deltas = [0]
+    pos = 0
+    for start, end, text in edits:
+        if start < pos:
+            raise ItemTablesError("Overlapping edits to item_tables.c")
+        parts.append(raw[pos:start])
+        parts.append(text)
+        pos = end
+        starts.append(start)
+        deltas.append(deltas[-1] + len(text) - (end - start))
+    parts.append(raw[pos:])
+    tables.raw = b"".join(parts)
+
+    def moved(offset):
+        return offset + deltas[bisect.bisect_left(starts, offset)]
+
+    def moved_brace(offset):
+        # Rows inserted right before a closing brace push it along
+        return offset + deltas[bisect.bisect_right(starts, offset)]
+
+    record_starts = [record.start for record in tables.items]
+    touched = set()
+    for start in starts:
+        idx = bisect.bisect_right(record_starts, start) - 1
+        if idx >= 0 and start < tables.items[idx].end:
+            touched.add(idx)
+
+    first_record = max(bisect.bisect_right(record_starts, starts[0]) - 1, 0) if starts else len(record_starts)
+    for record in tables.items[first_record:]:
+        delta = moved(record.start) - record.start
+        record.start += delta
+        record.end = moved(record.end)
+        if record.index in touched:
+            record.fields = _parse_fields(tables.raw, record.start + 1, record.end - 1)
+            record.spans = None
+            item_const = record.fields.get("itemId", "")
+            if item_const.startswith("ITEM_"):
+                tables.item_id_to_name[record.index] = item_const
+        elif record.spans and delta:
+            record.spans = {k: (s + delta, e + delta) for k, (s, e) in record.spans.items()}
+    if tables.item_data_end >= 0:
+        tables.item_data_end = moved_brace(tables.item_data_end)
+    if tables.graphics_table_end >= 0:
+        tables.graphics_table_end = moved_brace(tables.graphics_table_end)
+    return starts[0] if starts else len(raw)
+
+
+def write_edits(path, tables, edits, transaction=None):
+    """Applies ``edits`` to ``tables`` and writes the result to ``path``.
+
+    The file must still hold ``tables.raw`` where the edits go, so changes made
+    outside the editor are never overwritten.  With a ``transaction`` the new
+    file is only staged in it.
+    """
+    if not edits:
+        return
+    old_raw = tables.raw
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size != len(old_raw):
+            raise ItemTablesError("item_tables.c was changed outside the editor, reload it first")
+        for start, end, _ in edits:
+            f.seek(start)
+            if f.read(end - start) != old_raw[start:end]:
+                raise ItemTablesError("item_tables.c was changed outside the editor, reload it first")
+    apply_edits(tables, edits)
+    replace_file(path, tables.raw, transaction)
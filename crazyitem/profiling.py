@@ -0,0 +1,225 @@
+"""Timing spans around the loaders and writers, and an optional cProfile run.
+
+Profiling is off unless asked for, by ``--profile`` or by the
+``CRAZYITEM_PROFILE`` environment variable for the packaged editor, which has
+no console to take arguments from::
+
+    python -m crazyitem --profile list
+    python -m crazyitem --profile-stats export.pstats export items.csv
+    CRAZYITEM_PROFILE=1 danger.exe
+    CRAZYITEM_PROFILE=startup.pstats danger.exe
+
+Every span records its wall time, the size of the files it works on and what
+its parse found (items, ROM defines, #org blocks...), which is what tells a
+slow disk from a huge project.  ``report`` lists the spans nested; the pstats
+file can be read with ``python -m pstats`` or snakeviz.  While profiling is
+off, a timed method costs one attribute check.
+"""
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+ENV_VAR = "CRAZYITEM_PROFILE"
+_ON = ("1", "true", "yes", "on")
+_OFF = ("", "0", "false", "no", "off")
+_CO_GENERATOR = 0x20  # code flag of generator functions, checked without importing inspect
+
+
+def _size(n):
+    for unit in ("B", "KB", "MB"):
+        if n < 1024 or unit == "MB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+
+
+class Span:
+    def __init__(self, name, files):
+        self.name = name
+        self.files = files
+        self.seconds = None  # set when the span ends
+        self.bytes = None  # total size of the files that exist
+        self.info = {}  # counts of what was parsed or written
+        self.children = []
+
+    def count(self, **info):
+        self.info.update(info)
+
+    def finish(self, seconds):
+        self.seconds = seconds
+        # Measured at the end, so a writer reports the size it produced
+        sizes = [os.path.getsize(path) for path in self.files if os.path.isfile(path)]
+        self.bytes = sum(sizes) if sizes else None
+
+    def line(self, depth):
+        size = _size(self.bytes) if self.bytes is not None else ""
+        info = " ".join(f"{key}={value}" for key, value in self.info.items())
+        name = "  " * depth + self.name
+        return f"{name:<36} {self.seconds * 1000:10.1f} ms {size:>10}  {info}".rstrip()
+
+
+class Profiler:
+    def __init__(self):
+        self.enabled = False
+        self.stats_path = None
+        self.roots = []      # top-level spans not reported yet
+        self.profiles = []   # cProfile runs, one per profiled thread
+        self.main_profile = None
+        self.local = threading.local()
+
+    def start(self, stats_path=None):
+        """Starts recording spans, and with ``stats_path`` runs cProfile on this thread."""
+        self.enabled = True
+        self.stats_path = stats_path
+        self.roots = []
+        self.profiles = []
+        self.main_profile = self._profile() if stats_path else None
+
+    def stop(self):
+        """Stops profiling and writes the pstats file, if one was asked for."""
+        if self.main_profile is not None:
+            self.main_profile.disable()
+            self.main_profile = None
+        if self.stats_path and self.profiles:
+            import pstats
+
+            pstats.Stats(*self.profiles).dump_stats(self.stats_path)
+        self.enabled = False
+
+    def _profile(self):
+        import cProfile
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Python 3.12+ has one profiler per process, and it already sees every thread
+            return None
+        self.profiles.append(profile)
+        return profile
+
+    @contextmanager
+    def thread(self):
+        """Also runs cProfile on the calling thread, for work done off the main thread."""
+        profile = self._profile() if self.enabled and self.stats_path else None
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+
+    def _stack(self):
+        stack = getattr(self.local, "stack", None)
+        if stack is None:
+            stack = self.local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name, files=()):
+        if not self.enabled:
+            yield _NULL_SPAN
+            return
+        span = Span(name, files)
+        stack = self._stack()
+        (stack[-1].children if stack else self.roots).append(span)
+        stack.append(span)
+        started = time.perf_counter()
+        try:
+            yield span
+        finally:
+            span.finish(time.perf_counter() - started)
+            stack.pop()
+
+    def count(self, **info):
+        """Adds ``info`` to the innermost open span of this thread."""
+        if self.enabled:
+            stack = self._stack()
+            if stack:
+                stack[-1].info.update(info)
+
+    def report(self, roots=None):
+        lines = []
+
+        def add(span, depth):
+            lines.append(span.line(depth))
+            for child in span.children:
+                add(child, depth + 1)
+        for span in self.roots if roots is None else roots:
+            add(span, 0)
+        return "\n".join(lines)
+
+    def summary(self):
+        """One line about the slowest top-level span not reported yet and its phases, for a status bar."""
+        done = [span for span in self.roots if span.seconds is not None]
+        if not done:
+            return ""
+        span = max(done, key=lambda span: span.seconds)
+        phases = ", ".join(f"{child.name} {child.seconds * 1000:.0f} ms" for child in span.children)
+        return f"{span.name} {span.seconds * 1000:.0f} ms" + (f" ({phases})" if phases else "")
+
+    def flush(self, log_path=None):
+        """Returns the report of the finished top-level spans and forgets them; appends it to ``log_path``."""
+        done = [span for span in self.roots if span.seconds is not None]
+        self.roots = [span for span in self.roots if span.seconds is None]
+        text = self.report(done)
+        if text and log_path:
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(f"--- {time.strftime('%Y-%m-%d %H:%M:%S')}\n{text}\n")
+        return text
+
+
+class _NullSpan:
+    def count(self, **info):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+PROFILER = Profiler()
+span = PROFILER.span
+count = PROFILER.count
+
+
+def timed(name=None, files=()):
+    """Runs the method in a span, named after it unless ``name`` is given.
+
+    ``files`` are names of attributes of ``self`` holding the paths the method
+    reads or writes.  Generator methods are timed until they are exhausted.
+    """
+    def decorate(func):
+        label = name or func.__name__
+
+        if func.__code__.co_flags & _CO_GENERATOR:
+            @functools.wraps(func)
+            def timed_generator(self, *args, **kwargs):
+                if not PROFILER.enabled:
+                    return (yield from func(self, *args, **kwargs))
+                with PROFILER.span(label, [getattr(self, attr) for attr in files]):
+                    return (yield from func(self, *args, **kwargs))
+            return timed_generator
+
+        @functools.wraps(func)
+        def timed_method(self, *args, **kwargs):
+            if not PROFILER.enabled:
+                return func(self, *args, **kwargs)
+            with PROFILER.span(label, [getattr(self, attr) for attr in files]):
+                return func(self, *args, **kwargs)
+        return timed_method
+    return decorate
+
+
+def configure(profile=False, stats_path=None):
+    """Starts profiling if asked to by the arguments or by ``CRAZYITEM_PROFILE``; returns whether it did.
+
+    The variable is either a true value (``1``) for spans only, or the path of
+    the pstats file to write as well.
+    """
+    if not profile and not stats_path:
+        value = os.environ.get(ENV_VAR, "").strip()
+        if value.lower() in _OFF:
+            return False
+        if value.lower() not in _ON:
+            stats_path = value
+    PROFILER.start(stats_path)
+    return True
@@ -0,0 +1,918 @@
+"""Loading and editing the item tables of a CFRU-style decomp project.
+
+``ItemProject`` holds everything the editor shows and knows how to write it
+back.  It has no Qt dependency, so the GUI, the command line tool and build
+scripts all go through the same code.
+"""
+import os
+import re
+
+from .cache import CACHE_DIR, ProjectCache, state_folder
+from .charmap import DEFAULT_CHARMAP, MAX_NAME_LENGTH, read_charmap
+from .descriptions import DescriptionsError, read_descriptions, write_descriptions
+from .history import History
+from .item import EXTRA_FIELDS, HEADERS, Item
+from .item_tables import ItemTablesError, append_rows, field_edit, read_item_tables, write_edits
+from .profiling import count, span, timed
+from .transaction import JOURNAL_FILE, Transaction, recover
+
+# gItemData field -> editor column
+ITEM_FIELDS = [
+    ("price", "Price"), ("holdEffect", "HoldEffect"), ("holdEffectParam", "HoldParam"),
+    ("pocket", "Pocket"), ("type", "Type"), ("description", "Desc"),
+    ("importance", "Importance"), ("unk19", "Unk19"), ("fieldUseFunc", "FieldUseFunc"),
+    ("battleUsage", "BattleUsage"), ("battleUseFunc", "BattleUseFunc"), ("secondaryId", "SecondaryId")
+]
+C_FIELD_NAMES = {column: c_name for c_name, column in ITEM_FIELDS}
+C_FIELD_NAMES["Name"] = "name"
+
+POCKETS = [
+    "POCKET_ITEMS",
+    "POCKET_KEY_ITEMS",
+    "POCKET_POKE_BALLS",
+    "POCKET_TM_CASE",
+    "POCKET_BERRY_POUCH"
+]
+USE_TYPES = [
+    "ITEM_USE_MAIL",
+    "ITEM_USE_PARTY_MENU",
+    "ITEM_USE_FIELD",
+    "ITEM_USE_PBLOCK_CASE",
+    "ITEM_USE_BAG_MENU",
+    "ITEM_USE_PARTY_MENU_MOVES"
+]
+
+
+class ProjectError(Exception):
+    pass
+
+
+def item_constant(name):
+    """The part of an item constant after ``ITEM_``, upper-cased, whether or not the prefix was typed."""
+    name = str(name).strip().upper()
+    return name[5:] if name.startswith("ITEM_") else name
+
+
+def _read_lines(path):
+    """Returns the lines of ``path`` with their own line ends, and the one to use for new lines."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        lines = f.readlines()
+    return lines, "\r\n" if lines and lines[0].endswith("\r\n") else "\n"
+
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+
+class ItemProject:
+    def __init__(self, base_path, use_cache=True):
+        self.base_path = base_path
+        self.use_cache = use_cache
+        self.items_h_path = os.path.join(base_path, "include", "constants", "items.h")
+        self.item_tables_c_path = os.path.join(base_path, "src", "tables", "item_tables.c")
+        self.description_path = os.path.join(base_path, "strings", "item_descriptions.string")
+        self.icon_folder = os.path.join(base_path, "graphics", "item_sprites")
+        self.table_h_path = os.path.join(base_path, "include", "new", "item_tables.h")
+        self.charmap_path = os.path.join(base_path, "charmap.txt")
+
+        self.headers = list(HEADERS)
+        self.extra_fields = list(EXTRA_FIELDS)
+        self.warnings = []  # non-fatal problems met while writing, for the caller to show
+        self.file_stamps = {}  # watched path -> (size, mtime) when last read or written
+        self.history = History()
+        self.reset()
+
+    def reset(self):
+        self.data = []  # Item records, indexed by item ID
+        self.readonly_tags = set()
+        self.original_rom_defined = set()  # all DESC_ originally ROM-defined
+        self.descriptions = {}
+        self.description_index = None
+        self.dirty_descriptions = set()  # tags edited but not yet written
+        self.pending_externs = set()  # ROM-defined tags to turn into externs on the next save
+        self.icon_map = {}
+        self.icons_loaded = False  # graphics/item_sprites is listed on first use
+        self.graphics_table = {}
+        self.item_id_to_name = {}
+        self.item_tables = None
+        self.charmap = DEFAULT_CHARMAP
+        self.dirty = {}  # item index -> set of edited columns not yet written
+        self.history.clear()
+
+    def load_all(self):
+        for _ in self.iter_load():
+            pass
+
+    @timed("load_all")
+    def iter_load(self, batch_size=256):
+        """Loads everything like ``load_all``, yielding ``(done, total, step)`` on the way.
+
+        Items are appended to ``data`` in batches after everything else is
+        loaded, so another thread can show them while the rest is still read.
+        Files that did not change since the last load come from the cache in
+        ``.crazyitem/`` instead of being parsed again.
+        """
+        self.reset()
+        if recover(os.path.join(self.base_path, CACHE_DIR, JOURNAL_FILE)):
+            self.warnings.append("The last save was interrupted, the files it was writing were rolled back.")
+        self.remember_files()
+        cache = ProjectCache(self.base_path) if self.use_cache else None
+        self.load_charmap()
+        tables_paths = [self.item_tables_c_path]
+        if self.charmap is not DEFAULT_CHARMAP:
+            tables_paths.append(self.charmap_path)  # decoded names depend on it
+        description_paths = [self.table_h_path, self.description_path]
+
+        yield 0, 1, "Reading item_tables.c"
+        cached_items = cache.get("item_tables", tables_paths) if cache else None
+        if cached_items is not None:
+            with open(self.item_tables_c_path, "rb") as f:
+                raw = f.read()
+            # Written since get(): the cached offsets would not fit these bytes
+            stamp = cache.stamp("item_tables", self.item_tables_c_path)
+            if len(raw) != stamp[0] or _stamp(self.item_tables_c_path) != stamp:
+                cached_items = None
+        count(item_tables="cached" if cached_items is not None else "parsed")
+        if cached_items is not None:
+            tables, item_id_to_name, graphics_table, items = cached_items
+            tables.raw = raw
+            self.item_tables = tables
+            self.item_id_to_name = item_id_to_name
+        else:
+            # Before parsing; charmap.txt was read already, so it must still match its stamp
+            tables_signatures = cache.signatures(tables_paths, self.file_stamps) if cache else None
+            self.load_item_defines()
+        total = 2 + (len(self.item_tables.items) if self.item_tables else 0)
+
+        yield 1, total, "Loading descriptions"
+        cached_descriptions = cache.get("descriptions", description_paths) if cache else None
+        count(descriptions="cached" if cached_descriptions is not None else "parsed")
+        if cached_descriptions is not None:
+            (self.readonly_tags, self.original_rom_defined, self.descriptions,
+             self.description_index) = cached_descriptions
+        else:
+            description_signatures = cache.signatures(description_paths) if cache else None
+            self.load_descriptions()
+            if cache:
+                cache.put("descriptions", description_signatures,
+                          (self.readonly_tags, self.original_rom_defined, self.descriptions,
+                           self.description_index))
+
+        yield 2, total, "Loading items"
+        if cached_items is not None:
+            self.graphics_table = graphics_table
+            for start in range(0, len(items), batch_size):
+                self.data.extend(items[start:start + batch_size])
+                yield 2 + len(self.data), total, "Loading items"
+        else:
+            self.load_item_graphics_table()
+            for done in self.iter_items(batch_size):
+                yield 2 + done, total, "Loading items"
+            if cache and self.item_tables is not None:
+                cache.put("item_tables", tables_signatures,
+                          (self.item_tables, self.item_id_to_name, self.graphics_table, self.data))
+        if cache:
+            cache.save()
+
+    def watched_paths(self):
+        """The files and folders the loaded project was read from."""
+        return [self.items_h_path, self.item_tables_c_path, self.table_h_path,
+                self.description_path, self.charmap_path, self.icon_folder]
+
+    def remember_files(self, paths=None):
+        for path in self.watched_paths() if paths is None else paths:
+            self.file_stamps[path] = _stamp(path)
+
+    def changed_files(self):
+        """Returns the watched paths that changed on disk since they were read or written."""
+        return [path for path in self.watched_paths() if _stamp(path) != self.file_stamps.get(path)]
+
+    def reload_changed(self):
+        return self.reload_files(self.changed_files())
+
+    @timed()
+    def reload_files(self, paths):
+        """Re-reads only what depends on ``paths`` and merges it into the loaded project.
+
+        Unsaved edits are kept.  Returns ``(rows, icons)``: the indices of the
+        items that look different now, and whether the sprites folder changed.
+        items.h is only read when adding items, so it needs nothing here.
+        """
+        paths = set(paths)
+        stamps = {path: _stamp(path) for path in paths}  # taken first, so a write while reading is seen next time
+        rows = set()
+        if paths & {self.item_tables_c_path, self.charmap_path}:
+            rows |= self._reload_items()
+        if paths & {self.table_h_path, self.description_path}:
+            rows |= self._reload_descriptions()
+        icons = self.icon_folder in paths
+        if icons:
+            self.icon_map = {}
+            self.icons_loaded = False
+        self.file_stamps.update(stamps)
+        return sorted(rows), icons
+
+    def _reload_items(self):
+        old, old_names = self.data, self.item_id_to_name
+        self.load_charmap()
+        self.item_tables = None
+        self.load_item_defines()
+        self.load_item_graphics_table()
+        self.data = []
+        self.load_items()
+
+        # Unsaved edits follow their item by constant, in case items were inserted or removed outside
+        new_index = {name: idx for idx, name in self.item_id_to_name.items()}
+        moved = {}
+        for idx in range(len(old)):
+            name = old_names.get(idx)
+            if name is not None:
+                moved[idx] = new_index.get(name)
+            elif idx < len(self.data) and idx not in self.item_id_to_name:
+                moved[idx] = idx  # no constant on either side, so only the position is left
+        dirty, self.dirty = self.dirty, {}
+        lost = []
+        for idx, columns in dirty.items():
+            new_idx = moved.get(idx)
+            if new_idx is None:
+                lost.append(old_names.get(idx, str(idx)))
+                continue
+            for column in columns:
+                self.data[new_idx][column] = old[idx][column]
+            self.dirty[new_idx] = set(columns)
+        if lost:
+            self.warnings.append(f"Unsaved edits of items no longer in item_tables.c were dropped: {', '.join(lost)}")
+        if any(moved.get(idx) != idx for idx in range(len(old))):
+            self.history.remap(moved)
+        return {idx for idx in range(max(len(old), len(self.data)))
+                if idx >= len(old) or idx >= len(self.data) or old[idx] != self.data[idx]}
+
+    def _reload_descriptions(self):
+        old_descriptions, old_readonly = self.descriptions, self.readonly_tags
+        rom_defined = self.original_rom_defined
+        self.readonly_tags = set()
+        self.original_rom_defined = set()
+        self.load_descriptions()
+        self.original_rom_defined |= rom_defined
+        self.readonly_tags -= self.pending_externs
+        for tag in self.dirty_descriptions:
+            if tag in old_descriptions:
+                self.descriptions[tag] = old_descriptions[tag]
+        changed = {tag for tag in set(old_descriptions) | set(self.descriptions)
+                   if old_descriptions.get(tag) != self.descriptions.get(tag)}
+        changed |= old_readonly ^ self.readonly_tags
+        return {idx for idx, item in enumerate(self.data) if item.get("Desc") in changed}
+
+    @timed(files=("charmap_path",))
+    def load_charmap(self):
+        """Uses the decomp's charmap.txt when it has one, the built-in tables otherwise."""
+        self.charmap = DEFAULT_CHARMAP
+        if os.path.exists(self.charmap_path):
+            try:
+                self.charmap = read_charmap(self.charmap_path)
+            except (OSError, UnicodeDecodeError) as e:
+                self.warnings.append(f"Could not read charmap.txt, using the built-in one: {e}")
+
+    def load_item_tables(self):
+        """Parses item_tables.c once; the loaders below all read from the result."""
+        if self.item_tables is None:
+            with span("read_item_tables", [self.item_tables_c_path]) as s:
+                self.item_tables = read_item_tables(self.item_tables_c_path)
+                s.count(items=len(self.item_tables.items), graphics=len(self.item_tables.graphics_table))
+        return self.item_tables
+
+    @timed(files=("item_tables_c_path",))
+    def load_item_defines(self):
+        """Maps each gItemData entry to its .itemId constant."""
+        self.item_id_to_name = {}
+        if not os.path.exists(self.item_tables_c_path):
+            return
+        self.item_id_to_name = dict(self.load_item_tables().item_id_to_name)
+        count(constants=len(self.item_id_to_name))
+
+    @timed()
+    def load_icons(self):
+        self.icons_loaded = True
+        if os.path.exists(self.icon_folder):
+            for f in os.listdir(self.icon_folder):
+                if f.endswith(".png"):
+                    key = os.path.splitext(f)[0]
+                    self.icon_map[key] = os.path.join(self.icon_folder, f)
+        count(sprites=len(self.icon_map))
+
+    @timed(files=("table_h_path", "description_path"))
+    def load_descriptions(self):
+        with open(self.table_h_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if "#define DESC_" in line and "(const u8 *)" in line:
+                    m = re.match(r"#define\s+(DESC_\w+)", line)
+                    if m:
+                        tag = m.group(1)
+                        self.readonly_tags.add(tag)
+                        self.original_rom_defined.add(tag)
+        self.description_index, self.descriptions = read_descriptions(self.description_path)
+        count(rom_defines=len(self.readonly_tags), blocks=len(self.descriptions))
+
+    def load_description_index(self):
+        if self.description_index is None:
+            self.description_index, _ = read_descriptions(self.description_path)
+        return self.description_index
+
+    @timed(files=("item_tables_c_path",))
+    def load_item_graphics_table(self):
+        self.graphics_table = {}
+        if not os.path.exists(self.item_tables_c_path):
+            return
+        self.graphics_table = dict(self.load_item_tables().graphics_table)
+        count(entries=len(self.graphics_table))
+
+    def load_items(self):
+        for _ in self.iter_items():
+            pass
+
+    @timed("load_items", files=("item_tables_c_path",))
+    def iter_items(self, batch_size=256):
+        """Appends the items to ``data``, yielding the item count after each batch."""
+        tables = self.load_item_tables()
+        names = self.charmap.decode_many(record.name_array() for record in tables.items)
+        for record, name in zip(tables.items, names):
+            self.data.append(Item.from_fields(name, record.index, record.fields, ITEM_FIELDS))
+            if len(self.data) % batch_size == 0:
+                yield len(self.data)
+        count(items=len(self.data))
+        yield len(self.data)
+
+    def find_item(self, key):
+        """Returns the index of the item named by an ID (``12``, ``0x0C``) or a constant."""
+        key = str(key).strip()
+        try:
+            idx = int(key, 0)
+        except ValueError:
+            const = key.upper()
+            if not const.startswith("ITEM_"):
+                const = "ITEM_" + const
+            for idx, name in self.item_id_to_name.items():
+                if name == const:
+                    return idx
+            raise ProjectError(f"No item named {key}")
+        if idx < 0 or idx >= len(self.data):
+            raise ProjectError(f"No item with ID {key}")
+        return idx
+
+    def item_spec(self, row, base_dir=""):
+        """Turns a spreadsheet row into an ``add_items`` spec.
+
+        Column names are matched case-insensitively; relative icon paths are
+        taken relative to ``base_dir``.
+        """
+        row = {str(k).strip().lower(): v for k, v in row.items() if k is not None}
+
+        def pick(*names):
+            for name in names:
+                if row.get(name) not in (None, ""):
+                    return str(row[name]).strip()
+            return ""
+
+        icon_path = pick("icon_path", "icon")
+        if icon_path and not os.path.isabs(icon_path):
+            icon_path = os.path.join(base_dir, icon_path)
+        return {
+            "const": pick("const", "constant"),
+            "display": pick("display", "name"),
+            "price": pick("price"),
+            "pocket": pick("pocket") or POCKETS[0],
+            "type": pick("type", "use_type") or USE_TYPES[0],
+            "description": pick("description"),
+            "icon_path": icon_path
+        }
+
+    def columns(self):
+        """Columns of ``item_row``: identity, every editable field, then the description text."""
+        return ["ID", "Constant"] + self.headers + self.extra_fields + ["Description"]
+
+    def item_row(self, idx):
+        return self._row(self.data[idx])
+
+    def _row(self, item):
+        row = {"ID": item.ID, "Constant": self.item_id_to_name.get(item.ID, "")}
+        for field in self.headers + self.extra_fields:
+            row[field] = getattr(item, field, "")
+        row["Description"] = self.descriptions.get(item.Desc, "")
+        return row
+
+    def iter_rows(self):
+        """Yields ``item_row`` of every item, one at a time.
+
+        Loaded items are used as they are, unsaved edits included.  When
+        nothing is loaded, item_tables.c and the descriptions are still parsed
+        in full before the first row (every ``ItemRecord`` and description
+        text is in memory), but the ``Item`` of each row is built only when the
+        row is asked for and dropped right after, so ``data`` is never filled.
+        """
+        if self.data:
+            for idx in range(len(self.data)):
+                yield self.item_row(idx)
+            return
+        self.load_charmap()
+        self.load_item_defines()
+        if self.description_index is None:
+            self.load_descriptions()
+        if self.item_tables is None:
+            return
+        decode = self.charmap.decode
+        for record in self.item_tables.items:
+            yield self._row(Item.from_fields(decode(record.name_array()), record.index, record.fields, ITEM_FIELDS))
+
+    def icon_path(self, idx):
+        if not self.icons_loaded:
+            self.load_icons()
+        tile_symbol, _ = self.graphics_table.get(idx, ("", ""))
+        icon_key = tile_symbol[:-5] if tile_symbol.endswith("Tiles") else tile_symbol
+        return self.icon_map.get(icon_key, "")
+
+    def set_field(self, idx, field, value):
+        """Updates one column of an item and remembers it for the next save."""
+        item = self.data[idx]
+        old = item.get(field)
+        if old != value:
+            item[field] = value
+            self.dirty.setdefault(idx, set()).add(field)
+            self.history.record(("field", idx, field, old, value))
+
+    def set_description(self, tag, text):
+        """Changes a description; a ROM-defined one is turned into an extern first."""
+        text = text.strip()
+        original_text = self.descriptions.get(tag, "").strip()
+        if tag in self.original_rom_defined and tag in self.readonly_tags:
+            if text != original_text:
+                # item_tables.h is patched by the next save, with everything else
+                self.pending_externs.add(tag)
+                self.readonly_tags.discard(tag)
+
+        if tag not in self.readonly_tags and text != self.descriptions.get(tag):
+            self.history.record(("description", tag, self.descriptions.get(tag), text))
+            self.descriptions[tag] = text
+            self.dirty_descriptions.add(tag)
+
+    def undo(self, steps=1):
+        """Reverts the last ``steps`` edit steps in memory; returns the indices of the items they touched."""
+        return self._replay(self.history.undo(steps), undo=True)
+
+    def redo(self, steps=1):
+        return self._replay(self.history.redo(steps), undo=False)
+
+    def _replay(self, changes, undo):
+        rows = set()
+        with self.history.paused():
+            for change in changes:
+                value = change[-2] if undo else change[-1]
+                if change[0] == "field":
+                    idx, column = change[1], change[2]
+                    if idx < len(self.data):
+                        self.set_field(idx, column, value)
+                        rows.add(idx)
+                else:
+                    tag = change[1]
+                    self._restore_description(tag, value)
+                    rows.update(idx for idx, item in enumerate(self.data) if item.Desc == tag)
+        return sorted(rows)
+
+    def _restore_description(self, tag, text):
+        if text is None:
+            # The tag had no text of its own before the edit
+            if tag in self.pending_externs:
+                # Still ROM-defined on disk: forget the edit altogether
+                self.pending_externs.discard(tag)
+                self.readonly_tags.add(tag)
+                self.descriptions.pop(tag, None)
+                self.dirty_descriptions.discard(tag)
+                return
+            text = ""
+        self.set_description(tag, text)
+
+    def row_item(self, row):
+        """Returns the index of the item a row names by ``ID`` or ``Constant``."""
+        key = row.get("ID")
+        if key in (None, ""):
+            key = row.get("Constant")
+        if key in (None, ""):
+            raise ProjectError("Row has neither an ID nor a Constant column")
+        return self.find_item(key)
+
+    def diff_rows(self, rows):
+        """Returns what applying ``rows`` would change, without changing anything.
+
+        Every row must name an existing item (see ``row_item``).  Blank cells
+        leave their column alone, and when several rows name the same item the
+        last value of each column wins, and a name too long for the item
+        tables raises ``ProjectError``.  The result is a list of
+        ``(idx, column, old, new)`` in item order, where ``column`` is an
+        editable field or ``"Description"``.
+        """
+        fields = self.headers + self.extra_fields
+        wanted = {}  # idx -> {column: new value}
+        for row in rows:
+            columns = wanted.setdefault(self.row_item(row), {})
+            for field in fields:
+                if row.get(field) not in (None, ""):
+                    columns[field] = str(row[field])
+            if row.get("Description") not in (None, ""):
+                columns["Description"] = str(row["Description"]).strip()
+
+        changes = []
+        for idx in sorted(wanted):
+            item = self.data[idx]
+            columns = wanted[idx]
+            name = columns.get("Name")
+            if name is not None and self.charmap.length(name) > MAX_NAME_LENGTH:
+                raise ProjectError(f"{self.item_id_to_name.get(idx, idx)}: "
+                                   f"'{name}' is longer than the {MAX_NAME_LENGTH} characters a name can have")
+            for field in fields:
+                if field in columns and columns[field] != getattr(item, field):
+                    changes.append((idx, field, getattr(item, field), columns[field]))
+            tag = columns.get("Desc", item.Desc)
+            text = columns.get("Description")
+            if tag and text is not None and text != self.descriptions.get(tag, ""):
+                changes.append((idx, "Description", self.descriptions.get(tag, ""), text))
+        return changes
+
+    def bulk_changes(self, indices, field, text):
+        """Returns the changes setting ``field`` to ``text`` on every item in ``indices``.
+
+        ``text`` is either a plain value or an expression over the item's own
+        fields such as ``price * 1.1`` (see ``crazyitem.expression``).  The
+        result has the ``diff_rows`` shape, ready for ``apply_changes``.
+        """
+        from .expression import ExpressionError, evaluate  # only needed here; ast is slow to import
+
+        if field not in self.headers + self.extra_fields:
+            raise ProjectError(f"{field} is not an editable field")
+        changes = []
+        for idx in sorted(set(indices)):
+            item = self.data[idx]
+            try:
+                value = evaluate(text, item, field)
+            except ExpressionError as e:
+                raise ProjectError(f"{self.item_id_to_name.get(idx, idx)}: {e}")
+            if field == "Name" and self.charmap.length(value) > MAX_NAME_LENGTH:
+                raise ProjectError(f"'{value}' is longer than the {MAX_NAME_LENGTH} characters a name can have")
+            old = getattr(item, field)
+            if value != old:
+                changes.append((idx, field, old, value))
+        return changes
+
+    def apply_changes(self, changes, label="import"):
+        """Applies a list from ``diff_rows`` as one undo step; nothing is written until the next save."""
+        with self.history.step(label):
+            for idx, column, _, new in changes:
+                if column != "Description":
+                    self.set_field(idx, column, new)
+            for idx, column, _, new in changes:
+                tag = self.data[idx].Desc
+                if column == "Description" and tag:
+                    self.set_description(tag, new)
+
+    def apply_row(self, row):
+        """Applies the editable columns present in ``row`` to the item it names.
+
+        The item is looked up by ``ID`` or ``Constant``.  Returns the number of
+        columns that changed.
+        """
+        changes = self.diff_rows([row])
+        self.apply_changes(changes, "edit of one item")
+        return len(changes)
+
+    def transaction(self):
+        """Returns a ``Transaction`` journaled in ``.crazyitem/``.
+
+        If it does not commit, parsed files are dropped so they are read again
+        from disk, which still holds the old content.
+        """
+        transaction = Transaction(os.path.join(state_folder(self.base_path), JOURNAL_FILE))
+        transaction.on_rollback(self.forget_parsed_files)
+        # Our own writes are not changes from outside
+        transaction.on_commit(lambda: self.remember_files(
+            set(transaction.staged) | {os.path.dirname(path) for path in transaction.staged}))
+        return transaction
+
+    def forget_parsed_files(self):
+        self.item_tables = None
+        self.description_index = None
+
+    @timed()
+    def save_all(self):
+        """Writes item_tables.c, item_descriptions.string and item_tables.h together, or none of them."""
+        with self.transaction() as transaction:
+            self.save_item_tables(transaction)
+            self.save_descriptions(transaction)
+            self.save_externs(transaction)
+
+    @timed(files=("item_tables_c_path",))
+    def save_item_tables(self, transaction=None):
+        """Splices only the fields that changed into item_tables.c."""
+        if transaction is None:
+            with self.transaction() as transaction:
+                return self.save_item_tables(transaction)
+        tables = self.load_item_tables()
+        edits = []
+        renamed = [idx for idx, columns in sorted(self.dirty.items()) if "Name" in columns]
+        arrays = dict(zip(renamed, self.charmap.encode_many(self.data[idx].Name for idx in renamed)))
+        for idx, columns in sorted(self.dirty.items()):
+            item = self.data[idx]
+            record = tables.items[idx]
+            for column in columns:
+                if column == "Name":
+                    text = f"{{{arrays[idx]}}}"
+                else:
+                    text = getattr(item, column)
+                edits.append(field_edit(tables, record, C_FIELD_NAMES[column], text))
+        count(edits=len(edits))
+        try:
+            write_edits(self.item_tables_c_path, tables, edits, transaction)
+        except ItemTablesError as e:
+            raise ProjectError(str(e))
+        transaction.on_commit(self.dirty.clear)
+
+    @timed(files=("description_path",))
+    def save_descriptions(self, transaction=None):
+        """Rewrites only the #org blocks of the descriptions that changed."""
+        if not self.dirty_descriptions:
+            return
+        if transaction is None:
+            with self.transaction() as transaction:
+                return self.save_descriptions(transaction)
+        changes = {tag: self.descriptions[tag] for tag in sorted(self.dirty_descriptions)}
+        count(blocks=len(changes))
+        try:
+            write_descriptions(self.description_path, self.load_description_index(), changes, transaction)
+        except DescriptionsError as e:
+            raise ProjectError(str(e))
+        transaction.on_commit(self.dirty_descriptions.clear)
+
+    @timed()
+    def import_icon(self, idx, file_path):
+        """Copies a 24x24 PNG over the sprite of item ``idx``; returns the sprite symbol."""
+        from PIL import Image
+
+        try:
+            img = Image.open(file_path)
+        except Exception as e:
+            raise ProjectError(f"Could not open image: {e}")
+        if img.size != (24, 24):
+            raise ProjectError("Image must be exactly 24x24 pixels.")
+
+        item_id = self.data[idx].get("ID")
+        tile_symbol, pal_symbol = self.graphics_table.get(item_id, ("", ""))
+        if not tile_symbol or not pal_symbol:
+            raise ProjectError(f"Graphics symbols not found for item ID {item_id}")
+
+        base_symbol = tile_symbol
+        if base_symbol.endswith("Tiles"):
+            base_symbol = base_symbol[:-5]
+
+        dest_path = os.path.join(self.icon_folder, f"{base_symbol}.png")
+        with self.transaction() as transaction:
+            try:
+                transaction.save_image(dest_path, img)
+            except Exception as e:
+                raise ProjectError(f"Failed to save image: {e}")
+            self.update_item_tables_header(tile_symbol, pal_symbol, transaction)
+
+        if self.icons_loaded:
+            self.icon_map[base_symbol] = dest_path
+        return base_symbol
+
+    def add_item(self, const_name, display, price, pocket, use_type, description, icon_path):
+        """Appends a new item to every table and returns its ID.
+
+        The new item is merged into ``data`` afterwards.
+        """
+        return self.add_items([{
+            "const": const_name, "display": display, "price": price, "pocket": pocket,
+            "type": use_type, "description": description, "icon_path": icon_path
+        }])[0]
+
+    @timed(files=("items_h_path", "table_h_path", "description_path", "item_tables_c_path"))
+    def add_items(self, specs):
+        """Appends several new items at once and returns their IDs.
+
+        ``specs`` are dicts with the keys of ``AddItemDialog.get_data`` (see
+        ``item_spec`` for reading them from spreadsheet rows).  Everything is
+        validated before the first write, IDs are allocated in one pass and each
+        file is written once, all of them in one transaction.  The new items are
+        merged into ``data`` afterwards.
+        """
+        from PIL import Image
+
+        items = []
+        seen = set()
+        for spec in specs:
+            const_name = item_constant(spec.get("const", ""))
+            display = str(spec.get("display", "")).strip()
+            description = str(spec.get("description", "")).strip()
+            price = str(spec.get("price", "")).strip()
+            icon_path = str(spec.get("icon_path", "")).strip()
+            if not (const_name and display and description and price and icon_path):
+                raise ProjectError(f"All fields are required ({const_name or 'unnamed item'}).")
+            if not re.match(r"^[A-Z0-9_]+$", const_name):
+                raise ProjectError(f"Invalid constant name: {const_name}")
+            if const_name in seen or f"ITEM_{const_name}" in self.item_id_to_name.values():
+                raise ProjectError(f"ITEM_{const_name} already exists")
+            seen.add(const_name)
+
+            try:
+                img = Image.open(icon_path)
+            except Exception as e:
+                raise ProjectError(f"Could not open icon for {const_name}:\n{e}")
+            if img.size != (24, 24):
+                raise ProjectError(f"Icon for {const_name} must be exactly 24×24 pixels.")
+
+            items.append({
+                "const": const_name, "display": display, "description": description,
+                "price": price, "pocket": spec.get("pocket") or POCKETS[0],
+                "type": spec.get("type") or USE_TYPES[0], "image": img
+            })
+        if not items:
+            return []
+        count(items=len(items))
+        with self.transaction() as transaction:
+            transaction.on_commit(lambda: self.reload_files(
+                [self.item_tables_c_path, self.table_h_path, self.description_path, self.icon_folder]))
+            return self._add_items(items, transaction)
+
+    def _add_items(self, items, transaction):
+        # Every file keeps its own line ends (CRLF in many Windows checkouts)
+        # STEP 1: Assign the next available IDs from items.h
+        lines, newline = _read_lines(self.items_h_path)
+
+        # Find the #define ITEMS_COUNT line
+        count_index = None
+        for i, line in enumerate(lines):
+            if line.strip().startswith("#define ITEMS_COUNT"):
+                count_index = i
+                break
+
+        if count_index is None:
+            raise ProjectError("Could not find ITEMS_COUNT in items.h")
+
+        # Walk backwards to find the last real item ID
+        last_id = None
+        for j in range(count_index - 1, -1, -1):
+            match = re.search(r"#define\s+ITEM_\w+\s+(0x[0-9A-Fa-f]+)", lines[j])
+            if match:
+                last_id = int(match.group(1), 16)
+                break
+
+        if last_id is None:
+            raise ProjectError("Could not parse previous item ID before ITEMS_COUNT")
+
+        new_ids = list(range(last_id + 1, last_id + 1 + len(items)))
+
+        # Insert the new defines before ITEMS_COUNT and point ITEMS_COUNT at the last one
+        defines = [f"#define ITEM_{item['const']} 0x{new_id:03X}{newline}" for item, new_id in zip(items, new_ids)]
+        count_end = lines[count_index][len(lines[count_index].rstrip("\r\n")):]  # may be the last line
+        count_line = f"#define ITEMS_COUNT (ITEM_{items[-1]['const']} + 1){count_end}"
+        lines[count_index:count_index + 1] = defines + [count_line]
+
+        transaction.write_bytes(self.items_h_path, "".join(lines).encode("utf-8"))
+
+        # STEP 2: Add externs to item_tables.h
+        lines, newline = _read_lines(self.table_h_path)
+        externs = []
+        for item in items:
+            const_name = item["const"]
+            externs += [
+                f"extern const u32 gBag_{const_name}Tiles[];{newline}",
+                f"extern const u32 gBag_{const_name}Pal[];{newline}",
+                f"extern const u8 DESC_{const_name}[];{newline}"
+            ]
+
+        # The last #endif closes the include guard, often as "#endif // GUARD_..."
+        endif_index = None
+        for i in range(len(lines) - 1, -1, -1):
+            if lines[i].strip().startswith("#endif"):
+                endif_index = i
+                break
+
+        if endif_index is not None:
+            lines[endif_index:endif_index] = externs
+        else:
+            self.warnings.append("#endif not found in item_tables.h. Appending at end.")
+            lines += externs
+        transaction.write_bytes(self.table_h_path, "".join(lines).encode("utf-8"))
+
+        # STEP 3: Add descriptions
+        try:
+            write_descriptions(self.description_path, self.load_description_index(),
+                               {f"DESC_{item['const']}": item["description"] for item in items}, transaction)
+        except DescriptionsError as e:
+            raise ProjectError(str(e))
+
+        # STEP 4: Save the icons
+        try:
+            for item in items:
+                transaction.save_image(os.path.join(self.icon_folder, f"gBag_{item['const']}.png"), item["image"])
+        except Exception as e:
+            raise ProjectError(f"Could not save icon:\n{e}")
+
+        # STEP 5: Patch gItemGraphicsTable and gItemData (in .c file), before the
+        # closing braces the parser found, leaving every other byte alone
+        tables = self.load_item_tables()
+        edits = []
+        if tables.graphics_table_end >= 0:
+            edits.append(append_rows(tables, tables.graphics_table_end, "".join(
+                f"    {{ gBag_{item['const']}Tiles, gBag_{item['const']}Pal }},\n" for item in items
+            )))
+        else:
+            self.warnings.append("Could not find gItemGraphicsTable block in item_tables.c")
+        if tables.item_data_end >= 0:
+            edits.append(append_rows(tables, tables.item_data_end,
+                                     "".join(self.item_data_entry(item) for item in items)))
+        else:
+            self.warnings.append("Could not find gItemData[] block in item_tables.c")
+        try:
+            write_edits(self.item_tables_c_path, tables, edits, transaction)
+        except ItemTablesError as e:
+            raise ProjectError(str(e))
+        return new_ids
+
+    def item_data_entry(self, item):
+        const_name = item["const"]
+        return f"""    [ITEM_{const_name}] = {{
+                .name = {{ {self.charmap.encode(item['display'])} }},
+                .itemId = ITEM_{const_name},
+                .price = {item['price']},
+                .description = DESC_{const_name},
+                .pocket = {item['pocket']},
+                .type = {item['type']},
+                .fieldUseFunc = NULL,
+                .battleUsage = 0,
+                .battleUseFunc = NULL,
+                .importance = 0,
+                .unk19 = 0,
+                .holdEffect = 0,
+                .holdEffectParam = 0,
+                .secondaryId = 0
+            }},\n"""
+
+    @timed(files=("table_h_path",))
+    def update_item_tables_header(self, tile_sym, pal_sym, transaction=None):
+        if not os.path.exists(self.table_h_path):
+            return
+        if transaction is None:
+            with self.transaction() as transaction:
+                return self.update_item_tables_header(tile_sym, pal_sym, transaction)
+
+        with open(self.table_h_path, "r", encoding="utf-8") as f:
+            content = f.read()
+
+        # Convert to extern if defined
+        changed = False
+        for sym in [tile_sym, pal_sym]:
+            pattern = rf"#define\s+{sym}\s+\(\(u32\*\).+?\)"
+            if re.search(pattern, content):
+                content = re.sub(pattern, f"extern const u32 {sym}[];", content)
+                changed = True
+
+        if changed:
+            transaction.write_text(self.table_h_path, content)
+
+    @timed(files=("table_h_path",))
+    def save_externs(self, transaction=None):
+        """Turns the ROM-defined descriptions edited since the last save into externs."""
+        if not self.pending_externs:
+            return
+        if transaction is None:
+            with self.transaction() as transaction:
+                return self.save_externs(transaction)
+        tags = sorted(self.pending_externs)
+        self.update_desc_define_to_extern(tags, transaction)
+        transaction.on_commit(lambda: self.pending_externs.difference_update(tags))
+
+    @timed(files=("table_h_path",))
+    def update_desc_define_to_extern(self, desc_tag, transaction=None):
+        """Replaces the ``#define`` of one tag, or of a list of tags, with an extern."""
+        if not os.path.exists(self.table_h_path):
+            return
+        if transaction is None:
+            with self.transaction() as transaction:
+                return self.update_desc_define_to_extern(desc_tag, transaction)
+        tags = [desc_tag] if isinstance(desc_tag, str) else list(desc_tag)
+
+        with open(self.table_h_path, "r", encoding="utf-8") as f:
+            content = f.read()
+
+        changed = False
+        for tag in tags:
+            pattern = rf"#define\s+{tag}\s+\(\(const u8 \*\)[^\)]+\)"
+            replacement = f"extern const u8 {tag}[];"
+            if re.search(pattern, content):
+                content = re.sub(pattern, replacement, content)
+                changed = True
+        if changed:
+            transaction.write_text(self.table_h_path, content)
+            transaction.on_commit(lambda: self.readonly_tags.difference_update(tags))
@@ -0,0 +1,69 @@
+"""Decomp folders opened lately, so the editor can reopen the last one at launch.
+
+The list is kept in ``recent.json`` in the user's config folder:
+``%APPDATA%\\crazyitem`` on Windows, ``$XDG_CONFIG_HOME/crazyitem`` (by default
+``~/.config/crazyitem``) elsewhere, or wherever ``CRAZYITEM_CONFIG`` points.
+It is a convenience only: a missing or damaged file is an empty list and a
+failed write is ignored.
+"""
+import json
+import os
+
+ENV_VAR = "CRAZYITEM_CONFIG"
+RECENT_FILE = "recent.json"
+MAX_RECENT = 10
+
+
+def config_folder():
+    folder = os.environ.get(ENV_VAR, "").strip()
+    if folder:
+        return folder
+    if os.name == "nt":
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config")
+    return os.path.join(base, "crazyitem")
+
+
+def same_folder(a, b):
+    return os.path.normcase(os.path.abspath(a)) == os.path.normcase(os.path.abspath(b))
+
+
+class RecentProjects:
+    def __init__(self, path=None):
+        self.path = path or os.path.join(config_folder(), RECENT_FILE)
+        self.paths = []  # most recent first
+        self.read()
+
+    def read(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                paths = json.load(f)["recent"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        if isinstance(paths, list):
+            self.paths = [path for path in paths if isinstance(path, str)][:MAX_RECENT]
+
+    def existing(self):
+        """The folders that are still there, most recent first."""
+        return [path for path in self.paths if os.path.isdir(path)]
+
+    def last(self):
+        """The most recent folder that is still there, or None."""
+        return next(iter(self.existing()), None)
+
+    def add(self, folder):
+        """Puts ``folder`` first and saves the list."""
+        folder = os.path.abspath(folder)
+        self.paths = [folder] + [path for path in self.paths if not same_folder(path, folder)][:MAX_RECENT - 1]
+        self.save()
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"recent": self.paths}, f, indent=1)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
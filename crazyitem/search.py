@@ -0,0 +1,265 @@
+"""Prebuilt search index over the items of an ``ItemProject``.
+
+A query is a list of whitespace separated terms that must all match:
+
+    potion                  name, constant or description contains "potion"
+    pocket:key_items        the Pocket column contains "key_items"
+    price>1000              numeric comparison (>, >=, <, <=, =, !=)
+    "poke ball"             quotes keep spaces inside one term
+
+Text terms are looked up in indexes instead of being tried on every item: bare
+words in a map from each word of the names, constants and descriptions to its
+items, ``column:`` terms in a map from each distinct value of the column to its
+items. Only the keys are searched for the substring, and values like pockets
+repeat on most items. Both maps are built on the first search that needs them,
+so opening a project does not pay for them. Terms with spaces are narrowed by
+their words and then checked per item, comparisons are checked per item.
+
+When a query only extends the previous one (more terms, or longer text in a
+term), the previous result is narrowed instead of using the indexes again.
+"""
+import re
+import shlex
+from sys import intern
+
+# Query aliases -> columns of ``ItemProject.item_row``
+FIELD_ALIASES = {
+    "id": "ID",
+    "const": "Constant",
+    "constant": "Constant",
+    "name": "Name",
+    "price": "Price",
+    "holdeffect": "HoldEffect",
+    "hold": "HoldEffect",
+    "holdparam": "HoldParam",
+    "pocket": "Pocket",
+    "type": "Type",
+    "desc": "Description",
+    "description": "Description",
+    "tag": "Desc",
+    "importance": "Importance",
+    "unk19": "Unk19",
+    "fielduse": "FieldUseFunc",
+    "fieldusefunc": "FieldUseFunc",
+    "battleusage": "BattleUsage",
+    "battleuse": "BattleUseFunc",
+    "battleusefunc": "BattleUseFunc",
+    "secondaryid": "SecondaryId",
+}
+
+_TERM_RE = re.compile(r"^([A-Za-z_]\w*)\s*(>=|<=|!=|>|<|=|:)(.*)$", re.DOTALL)
+
+_COMPARE = {
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    "=": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+}
+
+
+def _number(text):
+    try:
+        return int(str(text).strip(), 0)
+    except ValueError:
+        try:
+            return float(text)
+        except ValueError:
+            return None
+
+
+def parse_query(query):
+    """Returns the terms of ``query`` as ``(column, op, value)`` tuples.
+
+    Bare words use ``column=None`` and ``op=":"``.
+    """
+    try:
+        words = shlex.split(query)
+    except ValueError:  # unbalanced quote while typing
+        words = query.replace('"', " ").replace("'", " ").split()
+    terms = []
+    for word in words:
+        m = _TERM_RE.match(word)
+        column = FIELD_ALIASES.get(m.group(1).lower()) if m else None
+        if column is None:
+            terms.append((None, ":", word.lower()))
+            continue
+        op, value = m.group(2), m.group(3).strip()
+        if op == ":":
+            terms.append((column, ":", value.lower()))
+        else:
+            number = _number(value)
+            if number is None:  # e.g. "price>" while typing: ignore the term
+                continue
+            terms.append((column, op, number))
+    return terms
+
+
+def _words(haystack):
+    return set(haystack.replace("\0", " ").split())
+
+
+def _containing(postings, text):
+    """The items of every key of ``postings`` that contains ``text``."""
+    found = set()
+    for key, items in postings.items():
+        if text in key:
+            found |= items
+    return found
+
+
+def _add(postings, key, idx):
+    items = postings.get(key)
+    if items is None:
+        items = postings[key] = set()
+    items.add(idx)
+
+
+def _discard(postings, key, idx):
+    items = postings.get(key)
+    if items is not None:
+        items.discard(idx)
+        if not items:
+            del postings[key]
+
+
+def _narrows(previous, terms):
+    """True if every item matching ``terms`` also matches ``previous``."""
+    if previous is None or len(terms) < len(previous):
+        return False
+    for old, new in zip(previous, terms):
+        if old[0] != new[0] or old[1] != new[1]:
+            return False
+        if old[1] == ":":
+            if old[2] not in new[2]:
+                return False
+        elif old[2] != new[2]:
+            return False
+    return True
+
+
+class SearchIndex:
+    def __init__(self, project):
+        self.project = project
+        self.rows = []       # per item: {column: lowercased text}
+        self.numbers = []    # per item: {column: number}, filled on first comparison
+        self.haystack = []   # per item: name, constant and description for bare words
+        self.words = None    # word of a haystack -> set of items, filled on first use
+        self.values = {}     # column -> {lowercased text -> set of items}, filled on first use
+        self.last_terms = None
+        self.last_result = None
+        self.rebuild()
+
+    def rebuild(self):
+        self.rows = [self._index_row(idx) for idx in range(len(self.project.data))]
+        self.numbers = [None] * len(self.rows)
+        self.haystack = [self._haystack(row) for row in self.rows]
+        self.words = None
+        self.values = {}
+        self.last_terms = None
+        self.last_result = None
+
+    def update(self, idx):
+        """Re-indexes one item after it was edited."""
+        if idx >= len(self.rows):
+            self.rebuild()
+            return
+        old_row, old_haystack = self.rows[idx], self.haystack[idx]
+        self.rows[idx] = self._index_row(idx)
+        self.numbers[idx] = None
+        self.haystack[idx] = self._haystack(self.rows[idx])
+        if self.words is not None:
+            for word in _words(old_haystack):
+                _discard(self.words, word, idx)
+            for word in _words(self.haystack[idx]):
+                _add(self.words, word, idx)
+        for column, values in self.values.items():
+            _discard(values, old_row.get(column, ""), idx)
+            _add(values, self.rows[idx].get(column, ""), idx)
+        self.last_terms = None
+        self.last_result = None
+
+    def _index_row(self, idx):
+        row = self.project.item_row(idx)
+        # Pockets, types and the like repeat on most items: share one string each
+        return {column: intern(str(value).lower()) for column, value in row.items()}
+
+    @staticmethod
+    def _haystack(row):
+        return "\0".join((row["Name"], row["Constant"], row["Description"]))
+
+    def _number(self, idx, column):
+        numbers = self.numbers[idx]
+        if numbers is None:
+            numbers = self.numbers[idx] = {}
+        if column not in numbers:
+            numbers[column] = _number(self.rows[idx].get(column, ""))
+        return numbers[column]
+
+    def _haystack_words(self):
+        if self.words is None:
+            words = self.words = {}
+            for idx, haystack in enumerate(self.haystack):
+                for word in haystack.replace("\0", " ").split():
+                    items = words.get(word)
+                    if items is None:
+                        words[word] = {idx}
+                    else:
+                        items.add(idx)
+        return self.words
+
+    def _column_values(self, column):
+        values = self.values.get(column)
+        if values is None:
+            values = self.values[column] = {}
+            for idx, row in enumerate(self.rows):
+                _add(values, row.get(column, ""), idx)
+        return values
+
+    def _candidates(self, term):
+        """The items ``term`` can match according to the indexes, or None if
+        the term has to be checked on every item."""
+        column, op, value = term
+        if op != ":" or not value.strip():
+            return None
+        if column is not None:
+            return _containing(self._column_values(column), value)
+        # A word of the term is inside a word of every haystack that contains it
+        found = None
+        for word in value.split():
+            items = _containing(self._haystack_words(), word)
+            found = items if found is None else found & items
+        return found
+
+    def _matches(self, idx, term):
+        column, op, value = term
+        if column is None:
+            return value in self.haystack[idx]
+        if op == ":":
+            return value in self.rows[idx].get(column, "")
+        number = self._number(idx, column)
+        return number is not None and _COMPARE[op](number, value)
+
+    def search(self, query):
+        """Returns the indices of the items matching ``query``, in table order."""
+        terms = parse_query(query)
+        if _narrows(self.last_terms, terms):
+            result, check = self.last_result, terms
+        else:
+            found, check = None, []
+            for term in terms:
+                items = self._candidates(term)
+                if items is None:
+                    check.append(term)
+                    continue
+                found = items if found is None else found & items
+                if term[0] is None and term[2].split() != [term[2]]:
+                    check.append(term)  # the index only has its words
+            result = range(len(self.rows)) if found is None else sorted(found)
+        for term in check:
+            result = [idx for idx in result if self._matches(idx, term)]
+        result = list(result)
+        self.last_terms = terms
+        self.last_result = result
+        return result
@@ -0,0 +1,121 @@
+"""Reading and writing item rows as CSV, JSON, JSON Lines or Parquet.
+
+``write_rows`` consumes its rows one at a time, so a generator of rows is
+written out in constant memory whatever the format.  Parquet needs pyarrow,
+which is only imported when a Parquet file is read or written.
+"""
+import csv
+import json
+import os
+
+PARQUET_BATCH_SIZE = 4096  # rows per Parquet row group
+FORMATS = ["csv", "json", "jsonl", "parquet"]
+
+
+class TabularError(Exception):
+    pass
+
+
+def table_format(path, fmt=None):
+    if fmt:
+        return fmt.lower()
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".jsonl":
+        return "jsonl"
+    if ext == ".json":
+        return "json"
+    if ext == ".parquet":
+        return "parquet"
+    return "csv"
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise TabularError("Parquet files need pyarrow (pip install pyarrow)")
+    return pyarrow, pyarrow.parquet
+
+
+def read_rows(path, fmt=None):
+    """Returns the rows of a CSV, JSON (list of objects), JSON Lines or Parquet file as dicts."""
+    fmt = table_format(path, fmt)
+    if fmt == "parquet":
+        _, pq = _pyarrow()
+        columns = pq.read_table(path).to_pydict()
+        return [dict(zip(columns, values)) for values in zip(*columns.values())]
+    try:
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            if fmt == "csv":
+                return [dict(row) for row in csv.DictReader(f)]
+            if fmt == "jsonl":
+                rows = [json.loads(line) for line in f if line.strip()]
+            else:
+                rows = json.load(f)
+    except (ValueError, csv.Error) as e:  # bad JSON or text that is not UTF-8
+        raise TabularError(f"Could not read {path}: {e}")
+    if isinstance(rows, dict):
+        rows = rows.get("items", [])
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise TabularError(f"{path} does not hold a list of objects")
+    return rows
+
+
+def write_rows(path, columns, rows, fmt=None):
+    """Writes ``rows`` (an iterable of dicts) with ``columns``; returns how many were written."""
+    fmt = table_format(path, fmt)
+    if fmt == "parquet":
+        return _write_parquet(path, columns, rows)
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+        elif fmt == "jsonl":
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+                count += 1
+        else:
+            # Same text as json.dump(list(rows), f, indent=2), one row at a time
+            f.write("[")
+            for row in rows:
+                text = json.dumps(row, ensure_ascii=False, indent=2).replace("\n", "\n  ")
+                f.write(("," if count else "") + "\n  " + text)
+                count += 1
+            f.write("\n]" if count else "]")
+    return count
+
+
+def _write_parquet(path, columns, rows):
+    pa, pq = _pyarrow()
+    writer = None
+    count = 0
+    batch = {column: [] for column in columns}
+    try:
+        for row in rows:
+            for column in columns:
+                batch[column].append(row.get(column))
+            count += 1
+            if count % PARQUET_BATCH_SIZE == 0:
+                writer = _write_batch(pa, pq, path, writer, batch)
+        if count % PARQUET_BATCH_SIZE or writer is None:
+            writer = _write_batch(pa, pq, path, writer, batch)
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
+def _write_batch(pa, pq, path, writer, batch):
+    # The first batch decides the column types: ID as integers, the rest as text
+    table = pa.Table.from_pydict(batch, schema=writer.schema if writer is not None else None)
+    if writer is None:
+        writer = pq.ParquetWriter(path, table.schema)
+    writer.write_table(table)
+    for values in batch.values():
+        values.clear()
+    return writer
@@ -0,0 +1,206 @@
+"""All-or-nothing writes to several project files.
+
+A ``Transaction`` stages the new content of every file it is given in a temp
+file next to it and fsyncs it.  Nothing visible changes until ``commit``,
+which swaps each file in with a single rename.  When more than one file
+changes, a journal listing the files and hard-linked backups of their old
+content is written first, so a commit cut short by a crash can be rolled back
+by ``recover`` on the next load::
+
+    with project.transaction() as tx:
+        tx.write_bytes(path, data)
+        tx.save_image(png_path, image)
+"""
+import json
+import os
+
+from .profiling import count, timed
+
+JOURNAL_FILE = "journal.json"
+TMP_SUFFIX = ".crazyitem-tmp"
+BACKUP_SUFFIX = ".crazyitem-bak"
+
+
+class TransactionError(Exception):
+    pass
+
+
+def _sync_folder(folder):
+    # Makes the renames durable; directories cannot be opened on Windows
+    try:
+        fd = os.open(folder or ".", os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _roll_back(entries):
+    for entry in entries:
+        path, tmp, backup = entry["path"], entry["tmp"], entry["backup"]
+        if backup is not None:
+            if os.path.exists(backup):
+                os.replace(backup, path)
+        elif not os.path.exists(tmp):
+            _remove(path)  # a new file that was already renamed in
+        _remove(tmp)
+
+
+class Transaction:
+    def __init__(self, journal=None):
+        self.journal = journal  # path of the journal file, needed for multi-file commits
+        self.staged = {}        # target path -> temp path
+        self.commit_callbacks = []
+        self.rollback_callbacks = []
+        self.done = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    def _stage(self, path):
+        if self.done:
+            raise TransactionError("Transaction already finished")
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp = path + TMP_SUFFIX
+        self.staged[path] = tmp
+        return tmp
+
+    def write_bytes(self, path, data):
+        tmp = self._stage(path)
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def write_text(self, path, text, encoding="utf-8"):
+        """Like ``open(path, "w").write(text)``, newline translation included."""
+        tmp = self._stage(path)
+        with open(tmp, "w", encoding=encoding) as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def save_image(self, path, image, format="PNG"):
+        tmp = self._stage(path)
+        with open(tmp, "wb") as f:
+            image.save(f, format=format)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def on_commit(self, callback):
+        self.commit_callbacks.append(callback)
+
+    def on_rollback(self, callback):
+        self.rollback_callbacks.append(callback)
+
+    @timed()
+    def commit(self):
+        if self.done:
+            return
+        self.done = True
+        count(files=len(self.staged))
+        try:
+            if len(self.staged) == 1:
+                # One rename is atomic by itself
+                (path, tmp), = self.staged.items()
+                os.replace(tmp, path)
+                _sync_folder(os.path.dirname(path))
+            elif self.staged:
+                self._commit_journaled()
+        except BaseException:
+            for tmp in self.staged.values():
+                _remove(tmp)
+            for callback in self.rollback_callbacks:
+                callback()
+            raise
+        for callback in self.commit_callbacks:
+            callback()
+
+    def _commit_journaled(self):
+        if self.journal is None:
+            raise TransactionError("Writing several files at once needs a journal")
+        entries = [{"path": path, "tmp": tmp, "backup": path + BACKUP_SUFFIX if os.path.exists(path) else None}
+                   for path, tmp in self.staged.items()]
+        with open(self.journal, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+            f.flush()
+            os.fsync(f.fileno())
+        _sync_folder(os.path.dirname(self.journal))
+
+        try:
+            for entry in entries:
+                if entry["backup"] is not None:
+                    _remove(entry["backup"])
+                    try:
+                        os.link(entry["path"], entry["backup"])
+                    except OSError:  # no hard links here: copy, but never leave half a backup
+                        import shutil
+
+                        shutil.copy2(entry["path"], entry["backup"] + TMP_SUFFIX)
+                        os.replace(entry["backup"] + TMP_SUFFIX, entry["backup"])
+            for entry in entries:
+                os.replace(entry["tmp"], entry["path"])
+            for folder in {os.path.dirname(entry["path"]) for entry in entries}:
+                _sync_folder(folder)
+        except BaseException:
+            _roll_back(entries)
+            _remove(self.journal)
+            raise
+        _remove(self.journal)
+        for entry in entries:
+            if entry["backup"] is not None:
+                _remove(entry["backup"])
+
+    def rollback(self):
+        """Drops everything staged; the files on disk were never touched."""
+        if self.done:
+            return
+        self.done = True
+        for tmp in self.staged.values():
+            _remove(tmp)
+        for callback in self.rollback_callbacks:
+            callback()
+
+
+def replace_file(path, data, transaction=None):
+    """Stages ``data`` for ``path`` in ``transaction``, or replaces the file right away."""
+    if transaction is not None:
+        transaction.write_bytes(path, data)
+        return
+    with Transaction() as transaction:
+        transaction.write_bytes(path, data)
+
+
+def recover(journal):
+    """Rolls back a commit that was cut short; returns True if there was one."""
+    try:
+        with open(journal, encoding="utf-8") as f:
+            entries = json.load(f)
+    except FileNotFoundError:
+        return False
+    except ValueError:
+        # The journal itself was not finished, so no file was replaced yet
+        entries = []
+    _roll_back(entries)
+    _remove(journal)
+    return True
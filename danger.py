@@ -1,98 +1,404 @@
-import sys
+import argparse
 import os
-import re
+import sys
+from collections import OrderedDict
 from PyQt5.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QListWidget,
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QListView,
     QLabel, QLineEdit, QPushButton, QTextEdit, QFileDialog, QMessageBox,
-    QSplitter, QListWidgetItem, QScrollArea, QDialog, QComboBox
+    QSplitter, QScrollArea, QDialog, QComboBox, QProgressBar, QStyle,
+    QStyledItemDelegate, QTableWidget, QTableWidgetItem, QDialogButtonBox, QHeaderView, QShortcut, QStatusBar,
+    QMenu
+)
+from PyQt5.QtGui import QColor, QImage, QKeySequence, QPainter, QPixmap
+from PyQt5.QtCore import (
+    Qt, QAbstractListModel, QFileSystemWatcher, QModelIndex, QObject, QRect, QRunnable, QSize,
+    QThread, QThreadPool, QTimer, pyqtSignal
 )
-from PyQt5.QtGui import QPixmap
-from PyQt5.QtCore import Qt
-
-def decode_char_array(array_text):
-    punctuation_map = {
-        "_PERIOD": ".", "_HYPHEN": "-", "_APOSTROPHE": "'", "_EXCLAMATION": "!",
-        "_QUESTION": "?", "_eACUTE": "é", "_NEWLINE": "\n"
-    }
-
-    compress_patterns = [
-        (["_PO", "_KE", "_BL", "_OC", "_OK"], "Pokeblock"),
-        (["_P", "_o", "_k", "_eACUTE", "_BL", "_OC", "_OK"], "Pokéblock"),
-    ]
-
-    tokens = [c.strip() for c in array_text.split(',')]
-    result = []
-    i = 0
-    glyphs = 0
-
-    while i < len(tokens) and glyphs < 13:
-        token = tokens[i]
-        if token == "_END":
-            break
-
-        # Match compressed sequences like Pokeblock
-        matched = False
-        for pattern, word in compress_patterns:
-            if tokens[i:i+len(pattern)] == pattern:
-                result.append(word)
-                i += len(pattern)
-                glyphs += 1
-                matched = True
-                break
-        if matched:
-            continue
-
-        if token == "_SPACE":
-            result.append(" ")
-        elif token in punctuation_map:
-            result.append(punctuation_map[token])
-        elif token.startswith("'") and len(token) == 3:
-            result.append(token[1])
-        elif token.startswith("_") and len(token) == 2:
-            result.append(token[1])
-        elif token.startswith("_"):
-            result.append(token[1:].capitalize())
+
+from crazyitem.cache import state_folder
+from crazyitem.charmap import MAX_NAME_LENGTH
+from crazyitem.profiling import PROFILER, configure, span
+from crazyitem.project import POCKETS, USE_TYPES, ItemProject, ProjectError
+from crazyitem.recent import RecentProjects, same_folder
+from crazyitem.search import SearchIndex
+
+class ProjectLoader(QThread):
+    """Runs ``ItemProject.iter_load`` off the UI thread and reports how far it got."""
+    progress = pyqtSignal(int, int, str)
+    items_loaded = pyqtSignal(int)
+    failed = pyqtSignal(str)
+
+    def __init__(self, project, parent=None):
+        super().__init__(parent)
+        self.project = project
+
+    def run(self):
+        try:
+            with PROFILER.thread():
+                for done, total, step in self.project.iter_load():
+                    self.progress.emit(done, total, step)
+                    if step == "Loading items":
+                        self.items_loaded.emit(len(self.project.data))
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
+class _IconLoad(QRunnable):
+    """Reads and scales one icon on the thread pool (QImage is safe off the UI thread)."""
+
+    def __init__(self, path, generation, size, done):
+        super().__init__()
+        self.path = path
+        self.generation = generation
+        self.size = size
+        self.done = done
+
+    def run(self):
+        image = QImage(self.path)
+        if not image.isNull():
+            image = image.scaled(self.size, self.size)
+        self.done.emit(self.path, self.generation, image)
+
+
+class IconCache(QObject):
+    """LRU cache of icon thumbnails, with background prefetching.
+
+    Thumbnails are scaled once when read; ``invalidate`` drops a path whose
+    PNG was rewritten.  Every path has a generation that ``invalidate`` bumps,
+    so a prefetch of the old file that finishes afterwards is thrown away.
+    """
+    image_ready = pyqtSignal(str, int, QImage)
+
+    def __init__(self, size=48, capacity=512, parent=None):
+        super().__init__(parent)
+        self.size = size
+        self.capacity = capacity
+        self.pixmaps = OrderedDict()
+        self.pending = set()
+        self.generations = {}  # path -> times it was invalidated
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(2)
+        self.image_ready.connect(self.on_image_ready)
+
+    def get(self, path):
+        """Returns the thumbnail for ``path``, reading it now if it is not cached."""
+        if not path:
+            return None
+        pixmap = self.pixmaps.get(path)
+        if pixmap is None:
+            image = QImage(path)
+            if image.isNull():
+                return None
+            pixmap = self.store_image(path, image.scaled(self.size, self.size))
         else:
-            result.append(token.strip("_"))
-
-        i += 1
-        glyphs += 1
-
-    return ''.join(result).strip()
-
-def encode_char_array(text):
-    encode_map = {
-        " ": "_SPACE", "\n": "_NEWLINE", "é": "_eACUTE", "'": "_APOSTROPHE",
-        "!": "_EXCLAMATION", "?": "_QUESTION", "@": "_AT", "-": "_HYPHEN", ".": "_PERIOD"
-    }
-
-    number_map = {str(i): f"_{i}" for i in range(10)}
-
-    # Optional compression for symbol macros like Pokéblock → _PO, _KE, ...
-    compress_map = {
-        "Pokeblock CAS": ["_PO", "_KE", "_BL", "_OC", "_OK", "SPACE", "_C", "_a", "s", "e"],
-        "Pokéblock CAS": ["_P", "_o", "_k", "_eACUTE", "_BL", "_OC", "_OK", "SPACE", "_C", "_a", "s", "e"]
-    }
-
-    for key in compress_map:
-        if text.startswith(key):
-            return ", ".join(compress_map[key] + encode_char_array(text[len(key):]).split(", ")[:-1] + ["_END"])
-
-    result = []
-    for ch in text:
-        if ch in encode_map:
-            result.append(encode_map[ch])
-        elif ch in number_map:
-            result.append(number_map[ch])
-        elif ch.isalpha():
-            result.append(f"_{ch}")
+            self.pixmaps.move_to_end(path)
+        return pixmap
+
+    def prefetch(self, paths):
+        for path in paths:
+            if path and path not in self.pixmaps and path not in self.pending:
+                self.pending.add(path)
+                self.pool.start(_IconLoad(path, self.generations.get(path, 0), self.size, self.image_ready))
+
+    def on_image_ready(self, path, generation, image):
+        if generation == self.generations.get(path, 0):
+            self.store_image(path, image)
+
+    def store_image(self, path, image):
+        self.pending.discard(path)
+        if image.isNull():
+            return None
+        pixmap = QPixmap.fromImage(image)
+        self.pixmaps[path] = pixmap
+        self.pixmaps.move_to_end(path)
+        while len(self.pixmaps) > self.capacity:
+            self.pixmaps.popitem(last=False)
+        return pixmap
+
+    def invalidate(self, path):
+        self.pixmaps.pop(path, None)
+        self.pending.discard(path)
+        self.generations[path] = self.generations.get(path, 0) + 1
+
+    def clear(self):
+        self.pixmaps.clear()
+        for path in self.pending:
+            self.generations[path] = self.generations.get(path, 0) + 1
+        self.pending.clear()
+
+
+class ItemListModel(QAbstractListModel):
+    """Item names for the left panel, read straight from the project's data.
+
+    ``rows`` holds the indices of the items currently shown, so filtering only
+    swaps that list and the view asks for the rows it actually paints.
+    """
+
+    def __init__(self, project, parent=None):
+        super().__init__(parent)
+        self.project = project
+        self.rows = list(range(len(project.data)))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self.project.data[self.rows[index.row()]]
+        if role == Qt.DisplayRole:
+            return item.get("Name", "")
+        if role == Qt.UserRole:
+            return item["ID"]
+        return None
+
+    def append_rows(self, count):
+        """Shows items ``len(rows)..count`` that the loader has just added."""
+        first = len(self.rows)
+        if count > first:
+            self.beginInsertRows(QModelIndex(), first, count - 1)
+            self.rows.extend(range(first, count))
+            self.endInsertRows()
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self.rows = list(rows)
+        self.endResetModel()
+
+    def refresh(self):
+        self.set_rows(range(len(self.project.data)))
+
+    def row_of(self, idx):
+        try:
+            return self.rows.index(idx)
+        except ValueError:
+            return -1
+
+    def item_changed(self, idx):
+        row = self.row_of(idx)
+        if row >= 0:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+
+ATLAS_COLUMNS = 16
+ATLAS_PAGE_SIZE = ATLAS_COLUMNS * ATLAS_COLUMNS
+SPRITE_SIZE = 24
+
+
+class AtlasBuilder(QThread):
+    """Packs item sprites into atlas pages of 16x16 sprites, one page at a time."""
+    page_ready = pyqtSignal(int, QImage)
+
+    def __init__(self, paths, parent=None):
+        super().__init__(parent)
+        self.paths = paths
+
+    def run(self):
+        for page_no, start in enumerate(range(0, len(self.paths), ATLAS_PAGE_SIZE)):
+            if self.isInterruptionRequested():
+                return
+            side = ATLAS_COLUMNS * SPRITE_SIZE
+            page = QImage(side, side, QImage.Format_ARGB32_Premultiplied)
+            page.fill(Qt.transparent)
+            painter = QPainter(page)
+            for i, path in enumerate(self.paths[start:start + ATLAS_PAGE_SIZE]):
+                if not path:
+                    continue
+                image = QImage(path)
+                if image.isNull():
+                    continue
+                x = (i % ATLAS_COLUMNS) * SPRITE_SIZE
+                y = (i // ATLAS_COLUMNS) * SPRITE_SIZE
+                painter.drawImage(QRect(x, y, SPRITE_SIZE, SPRITE_SIZE), image)
+            painter.end()
+            self.page_ready.emit(page_no, page)
+
+
+class IconGridModel(QAbstractListModel):
+    """One row per entry of the grid's ``paths``, so rows and drawn cells always agree."""
+
+    def __init__(self, grid, parent=None):
+        super().__init__(parent)
+        self.grid = grid
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.grid.paths)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        idx = index.row()
+        project = self.grid.editor.project
+        if role == Qt.ToolTipRole and idx < len(project.data):
+            item = project.data[idx]
+            return f"{item.get('Name', '')}\n{project.item_id_to_name.get(idx, '')} ({idx} / {idx:#04X})"
+        if role == Qt.UserRole:
+            return idx
+        return None
+
+    def refresh(self):
+        self.beginResetModel()
+        self.endResetModel()
+
+
+class IconGridDelegate(QStyledItemDelegate):
+    """Draws each cell straight from its atlas page, without a pixmap per item."""
+
+    def __init__(self, grid, parent=None):
+        super().__init__(parent)
+        self.grid = grid
+
+    def sizeHint(self, option, index):
+        return QSize(self.grid.cell_size, self.grid.cell_size)
+
+    def paint(self, painter, option, index):
+        idx = index.row()
+        rect = option.rect
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(rect, QColor("#3d5a80"))
+        target = QRect(0, 0, self.grid.icon_size, self.grid.icon_size)
+        target.moveCenter(rect.center())
+
+        page = self.grid.pages.get(idx // ATLAS_PAGE_SIZE)
+        if not self.grid.paths[idx]:
+            painter.fillRect(target, QColor("#4a1f1f"))
+            painter.drawText(target, Qt.AlignCenter, "?")
+        elif page is not None:
+            i = idx % ATLAS_PAGE_SIZE
+            source = QRect((i % ATLAS_COLUMNS) * SPRITE_SIZE, (i // ATLAS_COLUMNS) * SPRITE_SIZE,
+                           SPRITE_SIZE, SPRITE_SIZE)
+            painter.drawPixmap(target, page, source)
         else:
-            result.append(f"'{ch}'")
-            # Truncate the macro array to max 13 glyphs
-        if len(result) > 13:
-            result = result[:13]
-    result.append("_END")
-    return ", ".join(result)
+            painter.fillRect(target, QColor("#2a2a2a"))
+
+
+class IconGridDialog(QDialog):
+    """Every item's icon at once, to audit sprite coverage."""
+
+    def __init__(self, editor):
+        super().__init__(editor)
+        self.editor = editor
+        self.setWindowTitle("Item Icons")
+        self.resize(900, 700)
+        self.icon_size = SPRITE_SIZE * 2
+        self.cell_size = self.icon_size + 8
+        self.paths = []
+        self.pages = {}
+        self.builder = None
+
+        layout = QVBoxLayout(self)
+        self.summary = QLabel()
+        layout.addWidget(self.summary)
+
+        self.model = IconGridModel(self, self)
+        self.view = QListView()
+        self.view.setViewMode(QListView.IconMode)
+        self.view.setResizeMode(QListView.Adjust)
+        self.view.setMovement(QListView.Static)
+        self.view.setUniformItemSizes(True)
+        self.view.setLayoutMode(QListView.Batched)
+        self.view.setBatchSize(512)
+        self.view.setGridSize(QSize(self.cell_size, self.cell_size))
+        self.view.setItemDelegate(IconGridDelegate(self, self.view))
+        self.view.setModel(self.model)
+        self.view.clicked.connect(lambda index: editor.select_item(index.row()))
+        layout.addWidget(self.view)
+
+    def rebuild(self):
+        """Re-reads every sprite into a fresh atlas on a worker thread."""
+        if self.builder is not None:
+            self.builder.requestInterruption()
+            self.builder.wait()
+        project = self.editor.project
+        self.paths = [project.icon_path(idx) for idx in range(len(project.data))]
+        self.pages = {}
+        self.model.refresh()
+        missing = self.paths.count("")
+        self.summary.setText(f"{len(self.paths) - missing} of {len(self.paths)} items have an icon, {missing} missing")
+
+        self.builder = AtlasBuilder(list(self.paths), self)
+        self.builder.page_ready.connect(self.on_page_ready)
+        self.builder.start()
+
+    def update_rows(self):
+        """Rebuilds the grid if items were added or removed or their sprites moved."""
+        project = self.editor.project
+        if [project.icon_path(idx) for idx in range(len(project.data))] != self.paths:
+            self.rebuild()
+
+    def on_page_ready(self, page_no, image):
+        self.pages[page_no] = QPixmap.fromImage(image)
+        self.view.viewport().update()
+
+    def closeEvent(self, event):
+        if self.builder is not None:
+            self.builder.requestInterruption()
+            self.builder.wait()
+        super().closeEvent(event)
+
+
+class ChangePreviewDialog(QDialog):
+    """Lists the changes an import or bulk edit would make before anything is applied."""
+
+    def __init__(self, parent, project, changes, title):
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.resize(900, 600)
+        layout = QVBoxLayout(self)
+
+        items = len({idx for idx, _, _, _ in changes})
+        layout.addWidget(QLabel(f"{len(changes)} field(s) will change on {items} item(s). "
+                                "Everything is written in one save."))
+
+        table = QTableWidget(len(changes), 4)
+        table.setHorizontalHeaderLabels(["Item", "Field", "Old", "New"])
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.verticalHeader().hide()
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        table.horizontalHeader().setStretchLastSection(True)
+        for row, (idx, column, old, new) in enumerate(changes):
+            name = f"{project.item_id_to_name.get(idx, idx)} ({project.data[idx].Name})"
+            for col, text in enumerate((name, column, old, new)):
+                table.setItem(row, col, QTableWidgetItem(str(text)))
+        table.resizeColumnsToContents()
+        layout.addWidget(table)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.button(QDialogButtonBox.Ok).setText("Apply and Save")
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+
+class BulkEditDialog(QDialog):
+    def __init__(self, parent, fields, count):
+        super().__init__(parent)
+        self.setWindowTitle("Bulk Edit")
+        self.setMinimumWidth(400)
+        layout = QVBoxLayout(self)
+
+        self.field_combo = QComboBox()
+        self.field_combo.addItems(fields)
+        self.value_input = QLineEdit()
+        self.value_input.setPlaceholderText("Value or expression, e.g. POCKET_KEY_ITEMS or price * 1.1")
+        hint = QLabel("Expressions can use any numeric field of the item (price, importance, holdparam, ...), "
+                      "+ - * / // %, round(), min(), max() and x if condition else y.")
+        hint.setWordWrap(True)
+        hint.setStyleSheet("font-size: 12px; color: #aaa;")
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.button(QDialogButtonBox.Ok).setText("Preview")
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+
+        for w in [QLabel(f"Set a field on {count} selected item(s):"), self.field_combo,
+                  self.value_input, hint, buttons]:
+            layout.addWidget(w)
+
+    def get_data(self):
+        return self.field_combo.currentText(), self.value_input.text()
+
 
 class AddItemDialog(QDialog):
     def __init__(self, parent):
@@ -109,22 +415,9 @@ class AddItemDialog(QDialog):
         self.price_input.setPlaceholderText("Price (e.g., 200)")
 
         self.pocket_combo = QComboBox()
-        self.pocket_combo.addItems([
-            "POCKET_ITEMS",
-            "POCKET_KEY_ITEMS",
-            "POCKET_POKE_BALLS",
-            "POCKET_TM_CASE",
-            "POCKET_BERRY_POUCH"
-        ])
+        self.pocket_combo.addItems(POCKETS)
         self.type_combo = QComboBox()
-        self.type_combo.addItems([
-            "ITEM_USE_MAIL",
-            "ITEM_USE_PARTY_MENU",
-            "ITEM_USE_FIELD",
-            "ITEM_USE_PBLOCK_CASE",
-            "ITEM_USE_BAG_MENU",
-            "ITEM_USE_PARTY_MENU_MOVES"
-        ])
+        self.type_combo.addItems(USE_TYPES)
 
         self.icon_btn = QPushButton("Choose 24x24 PNG Icon")
         self.icon_path = QLabel("No icon selected")
@@ -164,177 +457,368 @@ class AddItemDialog(QDialog):
         }
 
 class ItemEditor(QWidget):
-    def __init__(self):
+    def __init__(self, project_path=None):
         super().__init__()
-        self.setWindowTitle("Crazy Item!")
         self.resize(1200, 800)
 
-        self.base_path = self.select_folder()
+        self.recent = RecentProjects()
+        self.base_path = self.select_folder(project_path)
         if not self.base_path:
             sys.exit(0)
+        self.recent.add(self.base_path)
+        self.update_title()
 
-        self.items_h_path = os.path.join(self.base_path, "include", "constants", "items.h")
-        self.item_tables_c_path = os.path.join(self.base_path, "src", "tables", "item_tables.c")
-        self.description_path = os.path.join(self.base_path, "strings", "item_descriptions.string")
-        self.icon_folder = os.path.join(self.base_path, "graphics", "item_sprites")
-        self.table_h_path = os.path.join(self.base_path, "include", "new", "item_tables.h")
-
-        self.data = []
-        self.headers = ["Name", "Price", "HoldEffect", "HoldParam", "Pocket", "Type", "Desc"]
-        self.extra_fields = ["Importance", "Unk19", "FieldUseFunc", "BattleUsage", "BattleUseFunc", "SecondaryId"]
-        self.readonly_tags = set()
-        self.original_rom_defined = set()  # ⬅️ track all DESC_ originally ROM-defined
-        self.descriptions = {}
-        self.icon_map = {}
-        self.graphics_table = {}
-        self.item_id_to_name = {}
-        self.item_blocks = []
+        self.project = ItemProject(self.base_path)
         self.selected_index = -1
-
-        self.load_all()
+        self.loader = None
+        self.select_after_load = -1
+        self.icon_cache = IconCache(48, parent=self)
+        self.icon_grid = None
+
+        # Files edited in another program are merged in once writes settle down
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.schedule_reload)
+        self.watcher.directoryChanged.connect(self.schedule_reload)
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.setInterval(300)
+        self.reload_timer.timeout.connect(self.reload_changed_files)
+
+        # Reading starts before the widgets are built, from the cache when it is warm;
+        # the window shows up right away and items fill in as the loader reads them
+        self.start_loader()
         self.init_ui()
         self.apply_dark_theme()
+        self.show_loading()
+
+    # The editor works directly on the project's containers
+    data = property(lambda self: self.project.data)
+    headers = property(lambda self: self.project.headers)
+    extra_fields = property(lambda self: self.project.extra_fields)
+    descriptions = property(lambda self: self.project.descriptions)
+    readonly_tags = property(lambda self: self.project.readonly_tags)
+    original_rom_defined = property(lambda self: self.project.original_rom_defined)
+    icon_map = property(lambda self: self.project.icon_map)
+    graphics_table = property(lambda self: self.project.graphics_table)
+    item_id_to_name = property(lambda self: self.project.item_id_to_name)
+
+    def select_folder(self, path=None):
+        """The folder given with --project, else the last one opened, else one picked in a dialog."""
+        if path:
+            if os.path.isdir(path):
+                return os.path.abspath(path)
+            QMessageBox.warning(None, "Warning", f"{path} is not a folder, pick the decomp folder instead.")
+        elif self.recent.last():
+            return self.recent.last()
+        return QFileDialog.getExistingDirectory(None, "Select your decomp folder", self.recent.last() or "")
 
-    def select_folder(self):
-        return QFileDialog.getExistingDirectory(None, "Select your decomp folder")
+    def update_title(self):
+        self.setWindowTitle(f"Crazy Item! - {os.path.basename(os.path.normpath(self.base_path))}")
 
     def load_all(self):
-        self.load_item_defines()
-        self.load_icons()
-        self.load_descriptions()
-        self.load_item_graphics_table()
-        self.load_items()
-
-    def load_item_defines(self):
-        """Parses item_tables.c per block, aligns constants correctly."""
-        self.item_id_to_name = {}
-        if not os.path.exists(self.item_tables_c_path):
-            return
-
-        with open(self.item_tables_c_path, "r", encoding="utf-8") as f:
-            raw = f.read()
-
-        blocks = re.findall(r"(\{[^{}]*?\.name\s*=\s*\{[^}]*?\}[^{}]*?\},)", raw, re.DOTALL)
-
-        for idx, block in enumerate(blocks):
-            m = re.search(r"\.itemId\s*=\s*(ITEM_\w+)", block)
-            if m:
-                self.item_id_to_name[idx] = m.group(1)
-
-    def load_icons(self):
-        if os.path.exists(self.icon_folder):
-            for f in os.listdir(self.icon_folder):
-                if f.endswith(".png"):
-                    key = os.path.splitext(f)[0]
-                    self.icon_map[key] = os.path.join(self.icon_folder, f)
-
-    def load_descriptions(self):
-        with open(self.table_h_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if "#define DESC_" in line and "(const u8 *)" in line:
-                    m = re.match(r"#define\s+(DESC_\w+)", line)
-                    if m:
-                        tag = m.group(1)
-                        self.readonly_tags.add(tag)
-                        self.original_rom_defined.add(tag)
-        tag = None
-        lines = []
-        with open(self.description_path, "r", encoding="utf-8-sig") as f:
-            for line in f:
-                if line.startswith("#org @"):
-                    if tag and lines:
-                        self.descriptions[tag] = "\n".join(lines).strip()
-                    tag = line.replace("#org @", "").strip()
-                    lines = []
-                elif tag:
-                    lines.append(line.strip())
-        if tag and lines:
-            self.descriptions[tag] = "\n".join(lines).strip()
-
-    def load_item_graphics_table(self):
-        self.graphics_table = {}
-        if not os.path.exists(self.item_tables_c_path):
-            return
-        with open(self.item_tables_c_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        match = re.search(
-            r'gItemGraphicsTable\s*\[\s*ITEMS_COUNT\s*\+\s*1\s*\]\s*\[\s*2\s*\]\s*=\s*\{(.*?)\};',
-            content, re.DOTALL
-        )
-        if not match:
-            return
-        table_body = match.group(1)
-        lines = [line.strip() for line in table_body.splitlines() if line.strip() and not line.strip().startswith("//")]
-        for item_id, line in enumerate(lines):
-            m = re.match(r"\{\s*([\w\d_]+)\s*,\s*([\w\d_]+)\s*\},?", line)
-            if m:
-                tile_sym, pal_sym = m.groups()
-                self.graphics_table[item_id] = (tile_sym, pal_sym)
-
-    def load_items(self):
-        with open(self.item_tables_c_path, "r", encoding="utf-8") as f:
-            raw = f.read()
-        blocks = re.findall(r"(\{[^{}]*?\.name\s*=\s*\{[^}]*?\}[^{}]*?\},)", raw, re.DOTALL)
-        self.item_blocks = blocks
-        for i, block in enumerate(blocks):
-            item = {h: "" for h in self.headers + self.extra_fields}
-            name_match = re.search(r"\.name = \{(.*?)\}", block)
-            if name_match:
-                item["Name"] = decode_char_array(name_match.group(1))[:13]
-            for field in [
-                ("price", "Price"), ("holdEffect", "HoldEffect"), ("holdEffectParam", "HoldParam"),
-                ("pocket", "Pocket"), ("type", "Type"), ("description", "Desc"),
-                ("importance", "Importance"), ("unk19", "Unk19"), ("fieldUseFunc", "FieldUseFunc"),
-                ("battleUsage", "BattleUsage"), ("battleUseFunc", "BattleUseFunc"), ("secondaryId", "SecondaryId")
-            ]:
-                m = re.search(rf"\.{field[0]} = ([^,\n]+)", block)
-                if m:
-                    item[field[1]] = m.group(1).strip()
-            item["ID"] = i
-            self.data.append(item)
+        """Reloads the project on a worker thread; the list fills in as items arrive."""
+        if self.loader is not None and self.loader.isRunning():
+            return
+        self.start_loader()
+        self.show_loading()
+
+    def start_loader(self):
+        # Connected to methods rather than widgets, so it can start before init_ui
+        self.loader = ProjectLoader(self.project, self)
+        self.loader.progress.connect(self.on_load_progress)
+        self.loader.items_loaded.connect(self.on_items_loaded)
+        self.loader.failed.connect(self.on_load_failed)
+        self.loader.finished.connect(self.on_load_finished)
+        self.loader.start()
+
+    def show_loading(self):
+        self.selected_index = -1
+        self.set_editing_enabled(False)
+        self.list_model.set_rows([])
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+
+    def open_project(self, path):
+        """Switches the window to another decomp folder."""
+        if not path or same_folder(path, self.base_path):
+            return
+        if self.loader is not None and self.loader.isRunning():
+            return
+        if self.has_unsaved_changes():
+            answer = QMessageBox.question(
+                self, "Unsaved Changes", "Open another project and lose the changes that were not saved?",
+                QMessageBox.Yes | QMessageBox.No
+            )
+            if answer != QMessageBox.Yes:
+                return
+        watched = self.watcher.files() + self.watcher.directories()
+        if watched:
+            self.watcher.removePaths(watched)
+        if self.icon_grid is not None:
+            self.icon_grid.close()
+            self.icon_grid = None
+        self.icon_cache.clear()
+        self.clear_fields()
+
+        self.base_path = os.path.abspath(path)
+        self.project = ItemProject(self.base_path)
+        self.list_model.project = self.project
+        self.search_index = SearchIndex(self.project)
+        self.search_box.clear()
+        self.recent.add(self.base_path)
+        self.update_title()
+        self.load_all()
 
-    def import_icon(self):
+    def open_other_project(self):
+        path = QFileDialog.getExistingDirectory(self, "Select your decomp folder", self.base_path)
+        self.open_project(path)
+
+    def update_recent_menu(self):
+        self.recent_menu.clear()
+        for path in self.recent.existing():
+            action = self.recent_menu.addAction(path)
+            action.setEnabled(not same_folder(path, self.base_path))
+            action.triggered.connect(lambda checked=False, path=path: self.open_project(path))
+        self.recent_menu.addSeparator()
+        self.recent_menu.addAction("Browse...", self.open_other_project)
+
+    def has_unsaved_changes(self):
+        return bool(self.fields_modified() or self.project.dirty or self.project.dirty_descriptions
+                    or self.project.pending_externs)
+
+    def clear_fields(self):
+        self.selected_index = -1
+        for line in self.fields.values():
+            line.clear()
+        self.desc_edit.clear()
+        self.icon_preview.clear()
+        self.id_label.clear()
+
+    def on_load_progress(self, done, total, step):
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(done)
+        self.progress_bar.setFormat(f"{step}... %v / %m")
+
+    def on_items_loaded(self, count):
+        self.list_model.append_rows(count)
+
+    def on_load_failed(self, message):
+        QMessageBox.critical(self, "Error", f"Could not load the project:\n{message}")
+
+    def on_load_finished(self):
+        self.progress_bar.hide()
+        self.icon_cache.clear()
+        if self.icon_grid is not None and self.icon_grid.isVisible():
+            self.icon_grid.rebuild()
+        self.list_model.append_rows(len(self.data))
+        self.search_index.rebuild()
+        self.set_editing_enabled(True)
+        if self.search_box.text().strip():
+            self.filter_items(self.search_box.text())
+        if self.select_after_load >= 0:
+            self.select_item(self.select_after_load)
+            self.select_after_load = -1
+        self.show_warnings()
+        self.show_profile()
+        self.watch_files()
+        if self.project.changed_files():  # something changed while loading
+            self.schedule_reload()
+
+    def watch_files(self):
+        # Editors that save by replacing a file make the watcher drop it, so re-add
+        watched = set(self.watcher.files()) | set(self.watcher.directories())
+        paths = [p for p in self.project.watched_paths() if p not in watched and os.path.exists(p)]
+        if paths:
+            self.watcher.addPaths(paths)
+
+    def schedule_reload(self, path=""):
+        self.reload_timer.start()
+
+    def reload_changed_files(self):
+        """Merges files changed outside the editor without reloading everything."""
+        if self.loader is not None and self.loader.isRunning():
+            return  # on_load_finished looks again
+        self.watch_files()
+        snapshot = self.field_snapshot()
+        try:
+            rows, icons = self.project.reload_changed()
+        except (OSError, ValueError, ProjectError):
+            self.reload_timer.start()  # probably caught halfway through a write
+            return
+        self.show_warnings()
+        self.show_profile()
+        self.merge_reload(rows, icons, snapshot)
+
+    def field_snapshot(self):
+        """What the fields of the selected item show when untouched, for ``merge_reload``."""
         idx = self.selected_index
         if idx < 0 or idx >= len(self.data):
-            QMessageBox.warning(self, "No Item", "Please select an item first.")
+            return None
+        item = dict(self.data[idx])
+        return item, self.descriptions.get(item["Desc"], "[ROM defined]")
+
+    def merge_reload(self, rows, icons, snapshot=None):
+        """Updates the rows that changed in the project; fields the user is editing are left alone."""
+        if icons:
+            self.icon_cache.clear()
+        if self.icon_grid is not None and self.icon_grid.isVisible():
+            if icons:
+                self.icon_grid.rebuild()
+            elif rows:
+                self.icon_grid.update_rows()
+        if not rows:
             return
 
-        file_path, _ = QFileDialog.getOpenFileName(self, "Import PNG Icon", "", "PNG Images (*.png)")
-        if not file_path:
+        self.search_index.rebuild()
+        if self.search_box.text().strip():
+            self.filter_items(self.search_box.text())
+        elif len(self.data) > len(self.list_model.rows):
+            self.list_model.append_rows(len(self.data))
+        elif len(self.data) < len(self.list_model.rows):
+            self.list_model.refresh()
+        for idx in rows:
+            if idx < len(self.data):
+                self.list_model.item_changed(idx)
+
+        idx = self.selected_index
+        if snapshot is None or idx not in rows or idx >= len(self.data):
+            return
+        previous, previous_desc = snapshot
+        item = self.data[idx]
+        for field, line in self.fields.items():
+            if line.text() == previous.get(field, ""):
+                line.setText(item.get(field, ""))
+        if self.desc_edit.toPlainText() == previous_desc:
+            self.desc_edit.setText(self.descriptions.get(item.get("Desc", ""), "[ROM defined]"))
+
+    def set_editing_enabled(self, enabled):
+        for widget in (self.open_project_btn, self.search_box, self.save_btn, self.import_icon_btn, self.add_btn, self.icon_grid_btn,
+                       self.export_btn, self.import_changes_btn, self.bulk_edit_btn):
+            widget.setEnabled(enabled)
+        self.update_history_buttons()
+
+    def show_warnings(self):
+        while self.project.warnings:
+            QMessageBox.warning(self, "Warning", self.project.warnings.pop(0))
+
+    def show_profile(self):
+        """With profiling on, shows the last load or save in the status bar and logs every span."""
+        if not PROFILER.enabled:
+            return
+        self.status_bar.showMessage(PROFILER.summary())
+        try:
+            log_path = os.path.join(state_folder(self.base_path), "profile.log")
+        except OSError:
+            log_path = None
+        report = PROFILER.flush(log_path)
+        if report:
+            print(report, file=sys.stderr)
+
+    def export_items(self):
+        path, selected = QFileDialog.getSaveFileName(
+            self, "Export Items", "items.csv",
+            "CSV (*.csv);;JSON Lines (*.jsonl);;JSON (*.json);;Parquet (*.parquet)"
+        )
+        if not path:
             return
+        from crazyitem.tabular import TabularError, write_rows
 
-        from PIL import Image
+        # Without an extension, go by the filter that was picked
+        fmt = None if os.path.splitext(path)[1] else selected.split("*.")[-1].rstrip(")")
+        try:
+            with span("export", [path]):
+                count = write_rows(path, self.project.columns(), self.project.iter_rows(), fmt)
+        except (OSError, TabularError) as e:
+            QMessageBox.critical(self, "Error", f"Could not export items:\n{e}")
+            return
+        finally:
+            self.show_profile()
+        QMessageBox.information(self, "Exported", f"{count} items written to {path}")
+
+    def import_changes(self):
+        """Applies a spreadsheet of field changes after showing what it would change."""
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Import Changes", "", "Tables (*.csv *.json *.jsonl *.parquet);;All Files (*)"
+        )
+        if not path or not self.commit_field_edits():
+            return
+        from crazyitem.tabular import TabularError, read_rows
 
         try:
-            img = Image.open(file_path)
-            if img.size != (24, 24):
-                QMessageBox.critical(self, "Invalid Size", "Image must be exactly 24x24 pixels.")
-                return
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Could not open image: {e}")
+            changes = self.project.diff_rows(read_rows(path))
+        except (OSError, ValueError, ProjectError, TabularError) as e:
+            QMessageBox.critical(self, "Error", f"Could not read {path}:\n{e}")
+            return
+        if not changes:
+            QMessageBox.information(self, "Import Changes", "The file matches the current items, nothing to change.")
+            return
+        if ChangePreviewDialog(self, self.project, changes, "Import Changes").exec_() != QDialog.Accepted:
+            return
+        if self.apply_and_save(changes, "import"):
+            QMessageBox.information(self, "Import Changes", f"{len(changes)} field(s) changed")
+
+    def bulk_edit(self):
+        """Sets one field, to a value or an expression, on every selected item with a single save."""
+        indices = sorted({index.data(Qt.UserRole) for index in self.list_view.selectionModel().selectedIndexes()})
+        if not indices:
+            QMessageBox.warning(self, "No Items", "Select the items to edit first (Ctrl+click or Shift+click).")
+            return
+        if not self.commit_field_edits():
             return
+        dialog = BulkEditDialog(self, self.headers + self.extra_fields, len(indices))
+        if dialog.exec_() != QDialog.Accepted:
+            return
+        field, text = dialog.get_data()
+        try:
+            changes = self.project.bulk_changes(indices, field, text)
+        except ProjectError as e:
+            QMessageBox.critical(self, "Error", str(e))
+            return
+        if not changes:
+            QMessageBox.information(self, "Bulk Edit", f"Every selected item already has that {field}.")
+            return
+        if ChangePreviewDialog(self, self.project, changes, "Bulk Edit").exec_() != QDialog.Accepted:
+            return
+        if self.apply_and_save(changes, f"bulk edit of {field}"):
+            QMessageBox.information(self, "Bulk Edit", f"{field} changed on {len(changes)} item(s)")
+
+    def apply_and_save(self, changes, label):
+        """Applies ``diff_rows``-style changes as one undo step and writes them in one save."""
+        snapshot = self.field_snapshot()
+        self.project.apply_changes(changes, label)
+        self.merge_reload(sorted({idx for idx, _, _, _ in changes}), False, snapshot)
+        self.update_history_buttons()
+        try:
+            self.project.save_all()
+        except (OSError, ProjectError) as e:
+            QMessageBox.critical(self, "Error", f"Changes were applied but could not be saved:\n{e}")
+            return False
+        finally:
+            self.show_profile()
+        return True
 
-        item_id = self.data[idx].get("ID")
-        tile_symbol, pal_symbol = self.graphics_table.get(item_id, ("", ""))
-        if not tile_symbol or not pal_symbol:
-            QMessageBox.warning(self, "No Symbols", f"Graphics symbols not found for item ID {item_id}")
+    def import_icon(self):
+        idx = self.selected_index
+        if idx < 0 or idx >= len(self.data):
+            QMessageBox.warning(self, "No Item", "Please select an item first.")
             return
 
-        base_symbol = tile_symbol
-        if base_symbol.endswith("Tiles"):
-            base_symbol = base_symbol[:-5]
+        file_path, _ = QFileDialog.getOpenFileName(self, "Import PNG Icon", "", "PNG Images (*.png)")
+        if not file_path:
+            return
 
-        dest_path = os.path.join(self.icon_folder, f"{base_symbol}.png")
         try:
-            os.makedirs(self.icon_folder, exist_ok=True)
-            img.save(dest_path)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save image: {e}")
+            base_symbol = self.project.import_icon(idx, file_path)
+        except ProjectError as e:
+            QMessageBox.critical(self, "Error", str(e))
             return
+        finally:
+            self.show_profile()
+        self.icon_cache.invalidate(self.project.icon_path(idx))
+        if self.icon_grid is not None and self.icon_grid.isVisible():
+            self.icon_grid.rebuild()
 
-        self.icon_map[base_symbol] = dest_path
         self.load_item_into_fields(idx)
-        self.update_item_tables_header(tile_symbol, pal_symbol)
         QMessageBox.information(self, "Imported", f"Icon for {base_symbol} updated.")
 
     def add_item(self):
@@ -343,228 +827,69 @@ class ItemEditor(QWidget):
             return
 
         data = dialog.get_data()
-        const_name = data["const"]
-        display = data["display"]
-        desc = data["description"]
-        price = data["price"]
-        pocket = data["pocket"]
-        use_type = data["type"]
-        icon_path = data["icon_path"]
-
-        if not (const_name and display and desc and price and icon_path):
-            QMessageBox.warning(self, "Missing Info", "All fields are required.")
-            return
-
-        # STEP 1: Assign next available ID from items.h
-        with open(self.items_h_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        # Find the #define ITEMS_COUNT line
-        count_index = None
-        for i, line in enumerate(lines):
-            if line.strip().startswith("#define ITEMS_COUNT"):
-                count_index = i
-                break
-
-        if count_index is None:
-            QMessageBox.critical(self, "Error", "Could not find ITEMS_COUNT in items.h")
-            return
-
-        # Walk backwards to find the last real item ID
-        last_id = None
-        for j in range(count_index - 1, -1, -1):
-            match = re.search(r"#define\s+ITEM_\w+\s+(0x[0-9A-Fa-f]+)", lines[j])
-            if match:
-                last_id = int(match.group(1), 16)
-                break
-
-        if last_id is None:
-            QMessageBox.critical(self, "Error", "Could not parse previous item ID before ITEMS_COUNT")
-            return
-
-        new_id = last_id + 1
-
-        # Insert new define before ITEMS_COUNT
-        lines.insert(count_index, f"#define ITEM_{const_name} 0x{new_id:03X}\n")
-
-        
-        # ✅ Update ITEMS_COUNT line
-        lines[count_index + 1] = f"#define ITEMS_COUNT (ITEM_{const_name} + 1)\n"
-
-        # Save items.h
-        with open(self.items_h_path, "w", encoding="utf-8") as f:
-            f.writelines(lines)
-
-
-        # STEP 2: Add externs to item_tables.h
-        externs = [
-            f"extern const u32 gBag_{const_name}Tiles[];\n",
-            f"extern const u32 gBag_{const_name}Pal[];\n",
-            f"extern const u8 DESC_{const_name}[];\n"
-        ]
-        with open(self.table_h_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        endif_index = None
-        for i, line in enumerate(lines):
-            if line.strip() == "#endif":
-                endif_index = i
-                break
-
-        if endif_index is not None:
-            for ext in reversed(externs):
-                lines.insert(endif_index, ext)
-
-            with open(self.table_h_path, "w", encoding="utf-8") as f:
-                f.writelines(lines)
-        else:
-            QMessageBox.warning(self, "Warning", "#endif not found in item_tables.h. Appending at end.")
-            with open(self.table_h_path, "a", encoding="utf-8") as f:
-                f.writelines(externs)
-
-
-        # STEP 3: Add description
-        with open(self.description_path, "a", encoding="utf-8") as f:
-            f.write(f"\n#org @DESC_{const_name}\n{desc.strip()}\n")
-
-        from PIL import Image
-
-        # Build the output path
-        icon_filename = f"gBag_{const_name}.png"
-        icon_out = os.path.join(self.icon_folder, icon_filename)
-
         try:
-            # Validate the image
-            img = Image.open(icon_path)
-            if img.size != (24, 24):
-                QMessageBox.critical(self, "Invalid Icon", "Icon must be exactly 24×24 pixels.")
-                return
-
-            # Ensure output folder exists
-            os.makedirs(self.icon_folder, exist_ok=True)
-
-            # Save validated image
-            img.save(icon_out)
-
-        except Exception as e:
-            QMessageBox.critical(self, "Icon Copy Failed", f"Could not save icon:\n{e}")
+            new_id = self.project.add_item(
+                data["const"], data["display"], data["price"], data["pocket"],
+                data["type"], data["description"], data["icon_path"]
+            )
+        except ProjectError as e:
+            self.show_warnings()
+            QMessageBox.critical(self, "Error", str(e))
             return
+        finally:
+            self.show_profile()
+        self.show_warnings()
 
-        # STEP 5: Patch gItemGraphicsTable (in .c file)
-        with open(self.item_tables_c_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        QMessageBox.information(self, "Item Added", f"{data['const']} added as ID 0x{new_id:03X}")
+        # The project already merged the new item in; show it and select it
+        self.search_box.clear()
+        self.merge_reload([len(self.data) - 1], True)
+        self.select_item(len(self.data) - 1)
 
-        # a. Insert into gItemGraphicsTable
-        # Find start of gItemGraphicsTable[][] block
-        gtable_match = re.search(r"gItemGraphicsTable\s*\[\s*ITEMS_COUNT\s*\+\s*1\s*\]\s*\[\s*2\s*\]\s*=\s*\{", content)
-        if gtable_match:
-            # Find first closing `};` after the match
-            start_index = gtable_match.end()
-            end_index = content.find("};", start_index)
-            if end_index == -1:
-                raise Exception("Could not find end of gItemGraphicsTable block")
-
-            graphic_entry = f"    {{ gBag_{const_name}Tiles, gBag_{const_name}Pal }},\n"
-            content = content[:end_index] + graphic_entry + content[end_index:]
-        else:
-            QMessageBox.warning(self, "Warning", "Could not find gItemGraphicsTable block in item_tables.c")
-
-        # b. Insert into gItemData[]
-        # Find start of gItemData[] block
-        gdata_match = re.search(r"const struct Item gItemData\[\]\s*=\s*\{", content)
-        if gdata_match:
-            # Find first closing `};` after the match
-            start_index = gdata_match.end()
-            end_index = content.find("};", start_index)
-            if end_index == -1:
-                raise Exception("Could not find end of gItemData block")
-
-            data_entry = f"""    [ITEM_{const_name}] = {{
-                .name = {{ {encode_char_array(display)} }},
-                .itemId = ITEM_{const_name},
-                .price = {price},
-                .description = DESC_{const_name},
-                .pocket = {pocket},
-                .type = {use_type},
-                .fieldUseFunc = NULL,
-                .battleUsage = 0,
-                .battleUseFunc = NULL,
-                .importance = 0,
-                .unk19 = 0,
-                .holdEffect = 0,
-                .holdEffectParam = 0,
-                .secondaryId = 0
-            }},\n"""
-            content = content[:end_index] + data_entry + content[end_index:]
-        else:
-            QMessageBox.warning(self, "Warning", "Could not find gItemData[] block in item_tables.c")
-
-
-        with open(self.item_tables_c_path, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        QMessageBox.information(self, "Item Added", f"{const_name} added as ID 0x{new_id:03X}")
-        # Refresh all data
-        self.data.clear()
-        self.item_blocks.clear()
-        self.descriptions.clear()
-        self.icon_map.clear()
-        self.graphics_table.clear()
-        self.item_id_to_name.clear()
-        self.readonly_tags.clear()
-        self.original_rom_defined.clear()
-
-        self.load_all()
-        self.filter_items("")
-        self.list_widget.setCurrentRow(len(self.data) - 1)
-
-    def update_item_tables_header(self, tile_sym, pal_sym):
-        if not os.path.exists(self.table_h_path):
+    def on_item_selected(self, current, previous):
+        if not current.isValid():
             return
-
-        with open(self.table_h_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        defines = [
-            rf"#define\s+{tile_sym}\s+\(\(u32\*\).+?\)",
-            rf"#define\s+{pal_sym}\s+\(\(u32\*\).+?\)",
-        ]
-
-        # Convert to extern if defined
-        changed = False
-        for sym in [tile_sym, pal_sym]:
-            pattern = rf"#define\s+{sym}\s+\(\(u32\*\).+?\)"
-            if re.search(pattern, content):
-                content = re.sub(pattern, f"extern const u32 {sym}[];", content)
-                changed = True
-
-        if changed:
-            with open(self.table_h_path, "w", encoding="utf-8") as f:
-                f.write(content)
-
-    def update_desc_define_to_extern(self, desc_tag):
-        if not os.path.exists(self.table_h_path):
+        real_idx = current.data(Qt.UserRole)
+        if real_idx == self.selected_index:
             return
+        # Keep what was typed for the item being left; it becomes an undo step
+        old_idx = self.selected_index
+        if not self.commit_field_edits():
+            QTimer.singleShot(0, lambda: self.select_item(old_idx))
+            return
+        if 0 <= old_idx < len(self.data):
+            self.search_index.update(old_idx)
+            self.list_model.item_changed(old_idx)
+        self.update_history_buttons()
+        self.load_item_into_fields(real_idx)
 
-        with open(self.table_h_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        pattern = rf"#define\s+{desc_tag}\s+\(\(const u8 \*\)[^\)]+\)"
-        replacement = f"extern const u8 {desc_tag}[];"
-
-        if re.search(pattern, content):
-            content = re.sub(pattern, replacement, content)
-
-            with open(self.table_h_path, "w", encoding="utf-8") as f:
-                f.write(content)
+    def undo(self):
+        self.replay_history(self.project.undo)
 
-            self.readonly_tags.remove(desc_tag)
+    def redo(self):
+        self.replay_history(self.project.redo)
 
-    def on_item_selected(self, current, previous):
-        if not current:
+    def replay_history(self, replay):
+        # Typed but uncommitted edits count as the newest step
+        if not self.save_btn.isEnabled() or not self.commit_field_edits():
             return
-        real_idx = current.data(Qt.UserRole)
-        self.load_item_into_fields(real_idx)
+        snapshot = self.field_snapshot()
+        self.merge_reload(replay(), False, snapshot)
+        self.update_history_buttons()
+
+    def update_history_buttons(self):
+        history = self.project.history
+        for button, action, able, label in (
+            (self.undo_btn, "Undo", history.can_undo() or self.fields_modified(), history.undo_label()),
+            (self.redo_btn, "Redo", history.can_redo(), history.redo_label()),
+        ):
+            button.setEnabled(able and self.save_btn.isEnabled())
+            button.setToolTip(f"{action} {label}".strip())
+
+    def select_item(self, idx):
+        row = self.list_model.row_of(idx)
+        if row >= 0:
+            self.list_view.setCurrentIndex(self.list_model.index(row))
 
     # next part: UI setup, search, and 13-char enforcement...
     def init_ui(self):
@@ -575,22 +900,39 @@ class ItemEditor(QWidget):
         left_panel = QWidget()
         left_layout = QVBoxLayout(left_panel)
 
+        # Opened straight into the last project at launch, so switching is done from here
+        self.open_project_btn = QPushButton("📂 Open Project")
+        self.recent_menu = QMenu(self)
+        self.recent_menu.aboutToShow.connect(self.update_recent_menu)
+        self.open_project_btn.setMenu(self.recent_menu)
+        left_layout.addWidget(self.open_project_btn)
+
         self.search_box = QLineEdit()
-        self.search_box.setPlaceholderText("🔍 Search items...")
-        self.search_box.textChanged.connect(self.filter_items)
+        self.search_box.setPlaceholderText("🔍 Search items... (e.g. pocket:key_items price>1000)")
+        self.search_box.textChanged.connect(self.schedule_filter)
         left_layout.addWidget(self.search_box)
 
-        self.list_widget = QListWidget()
-        self.list_widget.setMinimumWidth(300)
-        for item in self.data:
-            item_id = item.get("ID", 0)
-            raw_name = self.item_id_to_name.get(item_id, f"ITEM_{item_id:03}")
-            display = raw_name.replace("ITEM_", "").replace("_END", "").replace("_", " ")
-            list_item = QListWidgetItem(item.get("Name", f"ITEM_{item_id:03}"))
-            list_item.setData(Qt.UserRole, item_id)
-            self.list_widget.addItem(list_item)
-            left_layout.addWidget(self.list_widget)
-        self.list_widget.currentItemChanged.connect(self.on_item_selected)
+        # Filter once typing pauses rather than on every keystroke
+        self.search_index = SearchIndex(self.project)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(lambda: self.filter_items(self.search_box.text()))
+
+        # Rows are only painted when visible, and filtering swaps row lists instead of rebuilding widgets
+        self.list_model = ItemListModel(self.project, self)
+        self.list_view = QListView()
+        self.list_view.setMinimumWidth(300)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSelectionMode(QListView.ExtendedSelection)
+        self.list_view.setModel(self.list_model)
+        self.list_view.selectionModel().currentChanged.connect(self.on_item_selected)
+        left_layout.addWidget(self.list_view)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setTextVisible(True)
+        self.progress_bar.hide()
+        left_layout.addWidget(self.progress_bar)
         right_panel = QWidget()
         right_layout = QVBoxLayout(right_panel)
 
@@ -600,8 +942,7 @@ class ItemEditor(QWidget):
             label = QLabel(f"{field}:")
             label.setFixedWidth(130)
             line = QLineEdit()
-            if field == "Name":
-                line.setMaxLength(13)
+            line.textEdited.connect(self.update_history_buttons)
             self.fields[field] = line
             row.addWidget(label)
             row.addWidget(line)
@@ -610,6 +951,7 @@ class ItemEditor(QWidget):
         right_layout.addWidget(QLabel("Description:"))
         self.desc_edit = QTextEdit()
         self.desc_edit.setFixedHeight(120)
+        self.desc_edit.textChanged.connect(self.update_history_buttons)
         right_layout.addWidget(self.desc_edit)
 
         self.icon_preview = QLabel()
@@ -622,6 +964,17 @@ class ItemEditor(QWidget):
         self.id_label.setStyleSheet("font-size: 12px; margin-top: 5px; color: #aaa;")
         right_layout.addWidget(self.id_label)
 
+        history_row = QHBoxLayout()
+        self.undo_btn = QPushButton("↶ Undo")
+        self.undo_btn.clicked.connect(self.undo)
+        history_row.addWidget(self.undo_btn)
+        self.redo_btn = QPushButton("↷ Redo")
+        self.redo_btn.clicked.connect(self.redo)
+        history_row.addWidget(self.redo_btn)
+        right_layout.addLayout(history_row)
+        QShortcut(QKeySequence.Undo, self, self.undo)
+        QShortcut(QKeySequence.Redo, self, self.redo)
+
         self.save_btn = QPushButton("💾 Save All Changes")
         self.save_btn.clicked.connect(self.save_all)
         right_layout.addWidget(self.save_btn)
@@ -634,22 +987,51 @@ class ItemEditor(QWidget):
         self.add_btn.clicked.connect(self.add_item)
         left_layout.addWidget(self.add_btn)
 
+        self.icon_grid_btn = QPushButton("🖼 Show All Icons")
+        self.icon_grid_btn.clicked.connect(self.show_icon_grid)
+        left_layout.addWidget(self.icon_grid_btn)
+
+        self.export_btn = QPushButton("📤 Export Items")
+        self.export_btn.clicked.connect(self.export_items)
+        left_layout.addWidget(self.export_btn)
+
+        self.import_changes_btn = QPushButton("📥 Import Changes")
+        self.import_changes_btn.clicked.connect(self.import_changes)
+        left_layout.addWidget(self.import_changes_btn)
+
+        self.bulk_edit_btn = QPushButton("✏ Bulk Edit Selected")
+        self.bulk_edit_btn.clicked.connect(self.bulk_edit)
+        left_layout.addWidget(self.bulk_edit_btn)
+
         splitter.addWidget(left_panel)
         splitter.addWidget(right_panel)
         splitter.setSizes([300, 900])
 
         layout.addWidget(splitter)
 
-    def filter_items(self, text):
-        self.list_widget.clear()
-        text = text.strip().lower()
+        # Per-phase timings of the last load or save, only with --profile / CRAZYITEM_PROFILE
+        self.status_bar = QStatusBar()
+        self.status_bar.setSizeGripEnabled(False)
+        self.status_bar.setVisible(PROFILER.enabled)
+        layout.addWidget(self.status_bar)
+
+    def show_icon_grid(self):
+        if self.icon_grid is None:
+            self.icon_grid = IconGridDialog(self)
+        self.icon_grid.rebuild()
+        self.icon_grid.show()
+        self.icon_grid.raise_()
+
+    def schedule_filter(self, text):
+        self.search_timer.start()
 
-        for item in self.data:
-            name = item.get("Name", "")
-            if text in name.lower():
-                list_item = QListWidgetItem(name)
-                list_item.setData(Qt.UserRole, item["ID"])  # Store real index
-                self.list_widget.addItem(list_item)
+    def filter_items(self, text):
+        self.search_timer.stop()
+        if text.strip():
+            rows = self.search_index.search(text)
+        else:
+            rows = range(len(self.data))
+        self.list_model.set_rows(rows)
 
     def load_item_into_fields(self, idx):
         if idx < 0 or idx >= len(self.data):
@@ -679,9 +1061,7 @@ class ItemEditor(QWidget):
         else:
             self.desc_edit.setReadOnly(False)
 
-        tile_symbol, _ = self.graphics_table.get(idx, ("", ""))
-        icon_key = tile_symbol[:-5] if tile_symbol.endswith("Tiles") else tile_symbol
-        path = self.icon_map.get(icon_key, "")
+        path = self.project.icon_path(idx)
 
         item_id = item.get("ID", 0)
         raw_name = self.item_id_to_name.get(item_id, f"ITEM_{item_id:03}")
@@ -690,72 +1070,65 @@ class ItemEditor(QWidget):
         self.setWindowTitle(f"Crazy Item - {display_name} (ID: {item_id} / {item_id:#04X})")
         self.id_label.setText(f"ID: {item_id} / {item_id:#04X}    Constant: {raw_name}")
 
-        if path and os.path.exists(path):
-            pixmap = QPixmap(path)
-            self.icon_preview.setPixmap(pixmap.scaled(48, 48))
+        pixmap = self.icon_cache.get(path)
+        if pixmap is not None:
+            self.icon_preview.setPixmap(pixmap)
         else:
             self.icon_preview.clear()
+        self.prefetch_icons(idx)
 
-    def save_all(self):
-        with open(self.item_tables_c_path, "r", encoding="utf-8") as f:
-            raw = f.read()
+    def prefetch_icons(self, idx, radius=8):
+        """Warms the icon cache for the rows around ``idx`` so arrow keys stay smooth."""
+        row = self.list_model.row_of(idx)
+        if row < 0:
+            return
+        rows = self.list_model.rows[max(row - radius, 0):row + radius + 1]
+        self.icon_cache.prefetch(self.project.icon_path(i) for i in rows)
 
-        new_blocks = []
-        # Update current item with UI edits before saving
+    def commit_field_edits(self):
+        """Moves the edits in the fields into the project; False if they cannot be kept."""
         if self.selected_index >= 0:
-            item = self.data[self.selected_index]
-            for field in self.headers[:-1] + self.extra_fields:
-                item[field] = self.fields[field].text()
-        
-            # do NOT overwrite the tag; just update text separately
-            if self.selected_index >= 0:
-                item = self.data[self.selected_index]
-                tag = item.get("Desc", "")
-                if tag:
-                    current_text = self.desc_edit.toPlainText().strip()
-                    original_text = self.descriptions.get(tag, "").strip()
-
-                    if tag in self.original_rom_defined and tag in self.readonly_tags:
-                        if current_text != original_text:
-                            self.update_desc_define_to_extern(tag)
-                            self.readonly_tags.discard(tag)
-
-                    if tag not in self.readonly_tags:
-                        self.descriptions[tag] = current_text
-
-        for idx, item in enumerate(self.data):
-            name = item['Name'][:13]
-            name_array = encode_char_array(name)
-            block = self.item_blocks[idx]
-            block = re.sub(r"\.name = \{[^}]*\}", f".name = {{{name_array}}}", block)
-            for field in [
-                ("price", "Price"), ("holdEffect", "HoldEffect"), ("holdEffectParam", "HoldParam"),
-                ("pocket", "Pocket"), ("type", "Type"), ("description", "Desc"),
-                ("importance", "Importance"), ("unk19", "Unk19"), ("fieldUseFunc", "FieldUseFunc"),
-                ("battleUsage", "BattleUsage"), ("battleUseFunc", "BattleUseFunc"), ("secondaryId", "SecondaryId")
-            ]:
-                block = re.sub(rf"\.{field[0]} = [^,\n]+", f".{field[0]} = {item[field[1]]}", block)
-            new_blocks.append(block)
-
-        pattern = r"(\{[^{}]*?\.name\s*=\s*\{[^}]*?\}[^{}]*?\},)"
-        new_content = re.sub(pattern, lambda m: new_blocks.pop(0), raw, count=len(new_blocks), flags=re.DOTALL)
-
-        with open(self.item_tables_c_path, "w", encoding="utf-8") as f:
-            f.write(new_content)
-
-        # Save descriptions
+            name = self.fields["Name"].text()
+            length = self.project.charmap.length(name)
+            if length > MAX_NAME_LENGTH:
+                QMessageBox.warning(self, "Name Too Long",
+                                    f"'{name}' takes {length} characters, item names have room for {MAX_NAME_LENGTH}.")
+                return False
+            with self.project.history.step(f"edit of {name}"):
+                for field in self.headers[:-1] + self.extra_fields:
+                    self.project.set_field(self.selected_index, field, self.fields[field].text())
+
+                # do NOT overwrite the tag; just update text separately
+                tag = self.data[self.selected_index].get("Desc", "")
+                text = self.desc_edit.toPlainText()
+                # The placeholder of an untouched ROM-defined description is not an edit
+                if tag and (tag in self.descriptions or text != "[ROM defined]"):
+                    self.project.set_description(tag, text)
+        return True
+
+    def fields_modified(self):
+        idx = self.selected_index
+        if idx < 0 or idx >= len(self.data):
+            return False
+        item = self.data[idx]
+        return (any(line.text() != item.get(field, "") for field, line in self.fields.items())
+                or self.desc_edit.toPlainText() != self.descriptions.get(item.get("Desc", ""), "[ROM defined]"))
+
+    def save_all(self):
+        # Update current item with UI edits before saving
+        if not self.commit_field_edits():
+            return
+
+        try:
+            self.project.save_all()
+        except (OSError, ProjectError) as e:
+            QMessageBox.critical(self, "Error", f"Could not save changes:\n{e}")
+            return
+        finally:
+            self.show_profile()
         if self.selected_index >= 0:
-            item = self.data[self.selected_index]
-            tag = item.get("Desc", "")
-            if tag and tag not in self.readonly_tags:
-                self.descriptions[tag] = self.desc_edit.toPlainText().strip()
-        lines = []
-        for tag, text in self.descriptions.items():
-            lines.append(f"#org @{tag}")
-            lines.extend(text.splitlines())
-            lines.append("")
-        with open(self.description_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+            self.search_index.update(self.selected_index)
+            self.list_model.item_changed(self.selected_index)
 
         QMessageBox.information(self, "Saved", "Changes written to item_tables.c and item_descriptions.string")
     def apply_dark_theme(self):
@@ -778,7 +1151,7 @@ class ItemEditor(QWidget):
         QPushButton:hover {
             background-color: #444;
         }
-        QListWidget {
+        QListView {
             background-color: #2a2a2a;
             color: #ffffff;
         }
@@ -787,8 +1160,33 @@ class ItemEditor(QWidget):
         }
         """)
 
+    def closeEvent(self, event):
+        if self.loader is not None:
+            self.loader.wait()
+        self.icon_cache.pool.waitForDone()
+        if self.icon_grid is not None:
+            self.icon_grid.close()
+        super().closeEvent(event)
+
+def parse_args(argv):
+    """Reads the editor's own options; everything else is left for Qt."""
+    parser = argparse.ArgumentParser(prog="crazyitem-editor", description="Crazy Item editor")
+    parser.add_argument("--project", "-p", metavar="FOLDER",
+                        help="decomp folder to open (default: the last one opened)")
+    parser.add_argument("--profile", action="store_true",
+                        help="show load and save timings in the status bar and log them to .crazyitem/profile.log")
+    parser.add_argument("--profile-stats", metavar="FILE.pstats", help="also run cProfile and write its stats here")
+    args, qt_args = parser.parse_known_args(argv[1:])
+    return args, argv[:1] + qt_args
+
+
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = ItemEditor()
+    args, qt_argv = parse_args(sys.argv)
+    # The packaged exe has no console, so CRAZYITEM_PROFILE works as well
+    configure(args.profile, args.profile_stats)
+    app = QApplication(qt_argv)
+    window = ItemEditor(args.project)
     window.show()
-    sys.exit(app.exec())
+    code = app.exec()
+    PROFILER.stop()
+    sys.exit(code)
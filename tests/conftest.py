@@ -0,0 +1,48 @@
+"""Fixtures shared by the tests: a fresh copy of the golden decomp tree."""
+import os
+import shutil
+
+import pytest
+
+GOLDEN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+GOLDEN_PROJECT = os.path.join(GOLDEN, "project")
+ICON = os.path.join(GOLDEN, "icon24.png")        # 24x24, what the editor accepts
+SMALL_ICON = os.path.join(GOLDEN, "icon16.png")  # 16x16, rejected
+
+ITEM_TABLES_C = os.path.join("src", "tables", "item_tables.c")
+ITEM_TABLES_H = os.path.join("include", "new", "item_tables.h")
+ITEMS_H = os.path.join("include", "constants", "items.h")
+DESCRIPTIONS = os.path.join("strings", "item_descriptions.string")
+
+
+def read_bytes(*parts):
+    with open(os.path.join(*parts), "rb") as f:
+        return f.read()
+
+
+def tree_bytes(folder):
+    """``{relative path: content}`` of every project file, the editor's own ``.crazyitem`` folder left out."""
+    files = {}
+    for root, dirs, names in os.walk(folder):
+        dirs[:] = [d for d in dirs if d != ".crazyitem"]
+        for name in names:
+            path = os.path.join(root, name)
+            files[os.path.relpath(path, folder)] = read_bytes(path)
+    return files
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    """A copy of ``golden/project`` that the test may write to."""
+    folder = str(tmp_path / "project")
+    shutil.copytree(GOLDEN_PROJECT, folder)
+    return folder
+
+
+@pytest.fixture
+def project(project_dir):
+    from crazyitem import ItemProject
+
+    project = ItemProject(project_dir, use_cache=False)
+    project.load_all()
+    return project
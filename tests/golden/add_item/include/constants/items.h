@@ -0,0 +1,15 @@
+#ifndef GUARD_CONSTANTS_ITEMS_H
+#define GUARD_CONSTANTS_ITEMS_H
+
+#define ITEM_NONE 0x000
+#define ITEM_POTION 0x001
+#define ITEM_POKE_BALL 0x002
+#define ITEM_POKEBLOCK_KIT 0x003
+#define ITEM_KINGS_ROCK 0x004
+#define ITEM_UP_GRADE 0x005
+#define ITEM_X_ATTACK 0x006
+
+#define ITEM_MAX_REPEL 0x007
+#define ITEMS_COUNT (ITEM_MAX_REPEL + 1)
+
+#endif // GUARD_CONSTANTS_ITEMS_H
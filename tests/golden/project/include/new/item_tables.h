@@ -0,0 +1,27 @@
+#ifndef GUARD_ITEM_TABLES_H
+#define GUARD_ITEM_TABLES_H
+
+extern const u8 DESC_NONE[];
+extern const u8 DESC_POTION[];
+#define DESC_POKE_BALL ((const u8 *) 0x8419C00)
+extern const u8 DESC_POKEBLOCK_KIT[];
+#define DESC_KINGS_ROCK ((const u8 *) 0x841A2B5)
+extern const u8 DESC_UP_GRADE[];
+extern const u8 DESC_X_ATTACK[];
+
+extern const u32 gBag_QuestionMarkTiles[];
+extern const u32 gBag_QuestionMarkPal[];
+extern const u32 gBag_PotionTiles[];
+extern const u32 gBag_PotionPal[];
+#define gBag_PokeBallTiles ((u32*) 0x83D5A84)
+#define gBag_PokeBallPal ((u32*) 0x83D5B24)
+extern const u32 gBag_PokeblockKitTiles[];
+extern const u32 gBag_PokeblockKitPal[];
+#define gBag_KingsRockTiles ((u32*) 0x83D60B4)
+#define gBag_KingsRockPal ((u32*) 0x83D6154)
+extern const u32 gBag_UpGradeTiles[];
+extern const u32 gBag_UpGradePal[];
+extern const u32 gBag_XAttackTiles[];
+extern const u32 gBag_XAttackPal[];
+
+#endif // GUARD_ITEM_TABLES_H
@@ -0,0 +1,144 @@
+#include "../config.h"
+#include "../../include/new/item_tables.h"
+
+const struct Item gItemData[] =
+{
+	[ITEM_NONE] =
+	{
+		.name = {_QUESTION, _QUESTION, _QUESTION, _QUESTION, _QUESTION, _QUESTION, _QUESTION, _QUESTION, _END},
+		.itemId = ITEM_NONE,
+		.price = 0,
+		.holdEffect = 0,
+		.holdEffectParam = 0,
+		.description = DESC_NONE,
+		.importance = 0,
+		.unk19 = 0,
+		.pocket = POCKET_ITEMS,
+		.type = 4,
+		.fieldUseFunc = (void*) 0x80A2325,
+		.battleUsage = 0,
+		.battleUseFunc = NULL,
+		.secondaryId = 0,
+	},
+
+	// Medicine
+	[ITEM_POTION] =
+	{
+		.name = {_P, _o, _t, _i, _o, _n, _END},
+		.itemId = ITEM_POTION,
+		.price = 300,
+		.holdEffect = HOLD_EFFECT_RESTORE_HP,
+		.holdEffectParam = 20,
+		.description = DESC_POTION,
+		.importance = 0,
+		.unk19 = 0,
+		.pocket = POCKET_ITEMS,
+		.type = ITEM_USE_PARTY_MENU,
+		.fieldUseFunc = FieldUseFunc_Medicine,
+		.battleUsage = ITEM_B_USE_MEDICINE,
+		.battleUseFunc = BattleUseFunc_Medicine,
+		.secondaryId = 0,
+	},
+
+	[ITEM_POKE_BALL] =
+	{
+		.name = {_P, _o, _k, _eACUTE, _SPACE, _B, _a, _l, _l, _END},
+		.itemId = ITEM_POKE_BALL,
+		.price = 200,
+		.holdEffect = 0,
+		.holdEffectParam = 0,
+		.description = DESC_POKE_BALL,
+		.importance = 0,
+		.unk19 = 0,
+		.pocket = POCKET_POKE_BALLS,
+		.type = 0,
+		.fieldUseFunc = NULL,
+		.battleUsage = 2,
+		.battleUseFunc = BattleUseFunc_PokeBallEtc,
+		.secondaryId = 4,
+	},
+
+	[ITEM_POKEBLOCK_KIT] =
+	{
+		/* the glyph sequence, not plain letters */
+		.name = {_PO, _KE, _BL, _OC, _OK, _SPACE, _K, _i, _t, _END},
+		.itemId = ITEM_POKEBLOCK_KIT,
+		.description = DESC_POKEBLOCK_KIT,
+		.price = 0,
+		.holdEffect = 0,
+		.holdEffectParam = 0,
+		.importance = 1,
+		.unk19 = 0,
+		.pocket = POCKET_KEY_ITEMS,
+		.type = ITEM_USE_FIELD,
+		.fieldUseFunc = FieldUseFunc_PokeblockCase,
+		.battleUsage = 0,
+		.battleUseFunc = NULL,
+		.secondaryId = 0,
+	},
+
+	[ITEM_KINGS_ROCK] =
+	{
+		.name = {_K, _i, _n, _g, _APOSTROPHE, _s, _SPACE, _R, _o, _c, _k, _END},
+		.itemId = ITEM_KINGS_ROCK,
+		.price = 100,
+		.holdEffect = HOLD_EFFECT_FLINCH,
+		.holdEffectParam = 10,
+		.description = DESC_KINGS_ROCK,
+		.importance = 0,
+		.unk19 = 0,
+		.pocket = POCKET_ITEMS,
+		.type = 4,
+		.fieldUseFunc = (void*) 0x80A2325,
+		.battleUsage = 0,
+		.battleUseFunc = NULL,
+		.secondaryId = 0,
+	},
+
+	[ITEM_UP_GRADE] =
+	{
+		.name = {_U, _p, _HYPHEN, _G, _r, _a, _d, _e, _END},
+		.itemId = ITEM_UP_GRADE,
+		.price = 2100,
+		.holdEffect = 0,
+		.holdEffectParam = 0,
+		.description = DESC_UP_GRADE,
+		.importance = 0,
+		.unk19 = 0,
+		.pocket = POCKET_ITEMS,
+		.type = 4,
+		.fieldUseFunc = (void*) 0x80A2325,
+		.battleUsage = 0,
+		.battleUseFunc = NULL,
+		.secondaryId = 0,
+	},
+
+	[ITEM_X_ATTACK] =
+	{
+		.name = {_X, _SPACE, _A, _t, _t, _a, _c, _k, '&', _END},
+		.itemId = ITEM_X_ATTACK,
+		.price = 500,
+		.holdEffect = 0,
+		.holdEffectParam = 0,
+		.description = DESC_X_ATTACK,
+		.importance = 0,
+		.unk19 = 0,
+		.pocket = POCKET_ITEMS,
+		.type = ITEM_USE_BAG_MENU,
+		.fieldUseFunc = (void*) 0x80A2325,
+		.battleUsage = 1,
+		.battleUseFunc = BattleUseFunc_StatBooster,
+		.secondaryId = 0,
+	},
+};
+
+const u32* const gItemGraphicsTable[ITEMS_COUNT + 1][2] =
+{
+	{gBag_QuestionMarkTiles, gBag_QuestionMarkPal},
+	{gBag_PotionTiles, gBag_PotionPal},
+	{gBag_PokeBallTiles, gBag_PokeBallPal},
+	{gBag_PokeblockKitTiles, gBag_PokeblockKitPal},
+	{gBag_KingsRockTiles, gBag_KingsRockPal},
+	{gBag_UpGradeTiles, gBag_UpGradePal},
+	{gBag_XAttackTiles, gBag_XAttackPal},
+};
@@ -0,0 +1,35 @@
+"""The benchmark fixtures load like a real project and the harness runs end to end."""
+import json
+
+from benchmarks import run
+from benchmarks.fixtures import make_project
+from crazyitem import ItemProject
+
+
+def test_fixture_loads(tmp_path):
+    make_project(str(tmp_path), 120)
+    project = ItemProject(str(tmp_path), use_cache=False)
+    project.load_all()
+    assert len(project.data) == 120
+    assert project.item_id_to_name[119] == "ITEM_SYNTH_00119"
+    assert all(project.icon_path(idx) for idx in range(len(project.data)))
+    assert project.readonly_tags and project.descriptions
+    for idx, record in enumerate(project.item_tables.items):
+        assert project.charmap.encode(project.data[idx].Name) == record.name_array().strip()
+
+
+def test_harness_saves_and_compares(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert run.main(["--sizes", "30", "--repeat", "1", "--min-time", "0"]) == 0
+    saved, = tmp_path.joinpath(run.RESULTS_DIR).glob("*.json")
+    results = json.loads(saved.read_text())["results"]
+    assert "load_all_cold[30]" in results and "save_all[30]" in results
+
+    # A baseline that was impossibly fast makes every benchmark a regression
+    for timing in results.values():
+        timing["median"] = 1e-12
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"results": results}))
+    argv = ["--sizes", "30", "--repeat", "1", "--min-time", "0", "-k", "load", "--no-save",
+            "--compare", str(baseline), "--fail-on-regression"]
+    assert run.main(argv) == 1
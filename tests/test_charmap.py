@@ -0,0 +1,76 @@
+"""Round-trip properties of the ``.name`` codec.
+
+Set ``CRAZYITEM_ITEM_TABLES`` to a decomp's src/tables/item_tables.c to also
+check every name in it.
+"""
+import os
+import random
+
+import pytest
+
+from crazyitem.charmap import DEFAULT_CHARMAP, MAX_NAME_LENGTH, Charmap, parse_charmap, split_char_array
+from crazyitem.item_tables import read_item_tables
+
+TOKENS = [
+    "_A", "_b", "_Z", "_0", "_9", "_SPACE", "_PERIOD", "_HYPHEN", "_APOSTROPHE", "_EXCLAMATION",
+    "_QUESTION", "_eACUTE", "_NEWLINE", "_AT", "_PO", "_KE", "_BL", "_OC", "_OK", "_P", "_o", "_k",
+    "_e", "_l", "_c", "_PK", "_MN", "_XYZ", "0x53", "'x'", "'a'", "'&'", "'{'", "'}'", "','",
+    "'\\\\'", "'\\n'", "'\\''",
+]
+
+
+def round_trips(charmap, array_text):
+    tokens = split_char_array(array_text)
+    if tokens and tokens[-1] == "_END":
+        tokens.pop()
+    return charmap.tokens(charmap.decode(array_text), None) == tokens
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_random_arrays_round_trip(seed):
+    rng = random.Random(seed)
+    for _ in range(2000):
+        tokens = [rng.choice(TOKENS) for _ in range(rng.randint(0, 16))]
+        array_text = ", ".join(tokens + ["_END"])
+        assert round_trips(DEFAULT_CHARMAP, array_text), array_text
+
+
+def test_encode_decode_is_identity():
+    for array_text in ("_P, _o, _t, _i, _o, _n, _END", "_PO, _KE, _BL, _OC, _OK, _SPACE, _C, _a, _s, _e, _END"):
+        assert DEFAULT_CHARMAP.encode(DEFAULT_CHARMAP.decode(array_text)) == array_text
+
+
+def test_sequence_words():
+    assert DEFAULT_CHARMAP.decode("_PO, _KE, _BL, _OC, _OK, _END") == "Pokeblock"
+    # Spelled out letter by letter, the same word must not turn into the glyphs
+    spelled = "_P, _o, _k, _e, _b, _l, _o, _c, _k, _END"
+    assert DEFAULT_CHARMAP.decode(spelled) == "{_P}okeblock"
+    assert DEFAULT_CHARMAP.encode(DEFAULT_CHARMAP.decode(spelled)) == spelled
+
+
+def test_unknown_tokens_are_kept():
+    assert DEFAULT_CHARMAP.decode("_PK, _MN, 'a', _END") == "{_PK}{_MN}{'a'}"
+    assert DEFAULT_CHARMAP.encode("{_PK}{_MN}{'a'}") == "_PK, _MN, 'a', _END"
+
+
+def test_encode_limit():
+    assert DEFAULT_CHARMAP.tokens("A" * 20) == ["_A"] * MAX_NAME_LENGTH
+    # A sequence word that does not fit is dropped whole
+    assert DEFAULT_CHARMAP.tokens("ABCDEFGHI Pokeblock") == DEFAULT_CHARMAP.tokens("ABCDEFGHI ")
+    assert DEFAULT_CHARMAP.length("Pokeblock Case") == 10
+
+
+def test_charmap_symbols():
+    charmap = Charmap(parse_charmap("'♂' = B5 @ male\nMALE = B5\nPK = 53\n'A' = BB\n"))
+    assert charmap.encode("♂") == "_MALE, _END"
+    assert charmap.decode("_MALE, _PK, _END") == "♂{_PK}"
+    assert round_trips(charmap, "_MALE, _PK, _A, _END")
+
+
+@pytest.mark.skipif(not os.environ.get("CRAZYITEM_ITEM_TABLES"), reason="CRAZYITEM_ITEM_TABLES not set")
+def test_real_item_tables_round_trip():
+    tables = read_item_tables(os.environ["CRAZYITEM_ITEM_TABLES"])
+    assert tables.items
+    failed = [record.name_array() for record in tables.items
+              if not round_trips(DEFAULT_CHARMAP, record.name_array())]
+    assert not failed
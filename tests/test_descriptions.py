@@ -0,0 +1,73 @@
+"""``write_descriptions`` rewrites the changed #org blocks and nothing else."""
+import random
+
+import pytest
+
+from crazyitem.descriptions import read_descriptions, write_descriptions
+
+LINES = ["Some text", "  padded  ", "", "é accents"]
+NEW_TEXTS = ["New text", "Two\nlines", "", "Some text", "x" * 30]
+
+
+def random_file(rng):
+    newline = rng.choice(["\n", "\r\n"])
+    parts = []
+    if rng.random() < 0.2:
+        parts.append("﻿")
+    if rng.random() < 0.2:
+        parts.append("junk line" + newline)
+    tags = [f"DESC_{i}" for i in range(rng.randint(0, 6))]
+    for tag in tags:
+        parts.append(f"#org @{tag}{newline}")
+        parts.extend(rng.choice(LINES) + newline for _ in range(rng.randint(0, 3)))
+        parts.extend(newline for _ in range(rng.randint(0, 2)))
+    text = "".join(parts)
+    if text and rng.random() < 0.3:
+        text = text.rstrip("\r\n")
+    return text, tags
+
+
+def layout(index):
+    blocks = {tag: (b.start, b.text_start, b.text_end, b.text_newline) for tag, b in index.blocks.items()}
+    return blocks, index.size, index.ends_with_newline
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_random_files(tmp_path, seed):
+    rng = random.Random(seed)
+    path = str(tmp_path / "item_descriptions.string")
+    for _ in range(250):
+        text, tags = random_file(rng)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        with open(path, "rb") as f:
+            before = f.read()
+        index, texts = read_descriptions(path)
+        old_blocks = {tag: before[b.start:b.text_end] for tag, b in index.blocks.items()}
+        changes = {tag: rng.choice(NEW_TEXTS) for tag in tags + ["DESC_NEW1", "DESC_NEW2"] if rng.random() < 0.4}
+
+        write_descriptions(path, index, changes)
+        with open(path, "rb") as f:
+            after = f.read()
+        new_index, new_texts = read_descriptions(path)
+
+        # The index kept in memory matches a fresh parse of the written file
+        assert layout(index) == layout(new_index), (text, changes)
+        expected = dict(texts, **changes)
+        assert {tag: new_texts.get(tag, "") for tag in new_index.blocks} == \
+            {tag: expected.get(tag, "") for tag in new_index.blocks}
+        for tag, block in new_index.blocks.items():
+            if tag in old_blocks and tag not in changes:
+                assert after[block.start:block.text_end].rstrip(b"\r\n") == old_blocks[tag].rstrip(b"\r\n")
+        if not changes:
+            assert after == before
+
+
+def test_new_block_uses_file_newlines(tmp_path):
+    path = str(tmp_path / "item_descriptions.string")
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write("#org @DESC_A\r\nFirst.\r\n")
+    index, _ = read_descriptions(path)
+    write_descriptions(path, index, {"DESC_A": "One\ntwo", "DESC_B": "Second."})
+    with open(path, "rb") as f:
+        assert f.read() == b"#org @DESC_A\r\nOne\r\ntwo\r\n\r\n#org @DESC_B\r\nSecond.\r\n"
@@ -0,0 +1,92 @@
+"""Imported rows, bulk edits and undo end up in the project the same way typed edits do."""
+import os
+
+import pytest
+
+from crazyitem import ProjectError, cli
+from crazyitem.expression import ExpressionError, evaluate, is_expression
+
+from .conftest import ITEM_TABLES_C, read_bytes
+
+
+def test_diff_rows_and_apply(project):
+    rows = [
+        {"Constant": "ITEM_POTION", "Price": "350", "Pocket": "", "Description": "Heals 20 HP."},
+        {"ID": "5", "Name": "Up-Grade"},  # unchanged
+        {"ID": "0x4", "Description": "May flinch."},  # ROM-defined
+    ]
+    changes = project.diff_rows(rows)
+    assert changes == [
+        (1, "Price", "300", "350"),
+        (1, "Description", "A spray-type medicine.\\nIt restores the HP of\\none Pokémon by 20 points.",
+         "Heals 20 HP."),
+        (4, "Description", "", "May flinch."),
+    ]
+    project.apply_changes(changes)
+    assert project.data[1].Price == "350" and project.descriptions["DESC_KINGS_ROCK"] == "May flinch."
+    assert project.pending_externs == {"DESC_KINGS_ROCK"}
+    assert project.diff_rows(rows) == []
+
+    # One undo step takes back the whole import, ROM-defined tag included
+    project.undo()
+    assert project.data[1].Price == "300"
+    assert "DESC_KINGS_ROCK" in project.readonly_tags and not project.pending_externs
+    with pytest.raises(ProjectError):
+        project.diff_rows([{"Constant": "ITEM_MISSING", "Price": "1"}])
+
+
+def test_long_name_rejected(project_dir, capsys):
+    before = read_bytes(project_dir, ITEM_TABLES_C)
+    assert cli.main(["--project", project_dir, "set", "1", "Name=Super Mega Long Potion Name"]) == 1
+    assert "ITEM_POTION: 'Super Mega Long Potion Name' is longer" in capsys.readouterr().err
+
+    changes = os.path.join(project_dir, "changes.csv")
+    with open(changes, "w", encoding="utf-8") as f:
+        f.write("Constant,Name,Price\nITEM_POKE_BALL,,250\nITEM_POTION,Super Mega Long Potion Name,\n")
+    for dry_run in (["--dry-run"], []):
+        assert cli.main(["--project", project_dir, "import", changes] + dry_run) == 1
+        assert "is longer than the 13 characters" in capsys.readouterr().err
+    assert read_bytes(project_dir, ITEM_TABLES_C) == before
+
+@pytest.mark.parametrize("name, text", [
+    ("changes.json", '[{"ID": 1, "Price": 5}'),
+    ("changes.jsonl", '{"ID": 1}\n{"ID": 2,\n'),
+    ("changes.json", '{"items": [1, 2]}'),
+])
+def test_cli_bad_table(project_dir, capsys, name, text):
+    path = os.path.join(project_dir, name)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    for command in (["import", path], ["add-batch", path]):
+        assert cli.main(["--project", project_dir] + command) == 1
+        err = capsys.readouterr().err
+        assert err.startswith("error: ") and path in err and "Traceback" not in err
+
+
+def test_bulk_changes(project):
+    changes = project.bulk_changes([1, 2, 4], "Price", "price * 1.5 if price < 250 else price")
+    assert changes == [(2, "Price", "200", "300"), (4, "Price", "100", "150")]
+    assert project.bulk_changes([1, 2], "Pocket", "POCKET_KEY_ITEMS") == [
+        (1, "Pocket", "POCKET_ITEMS", "POCKET_KEY_ITEMS"), (2, "Pocket", "POCKET_POKE_BALLS", "POCKET_KEY_ITEMS")]
+    with pytest.raises(ProjectError, match="longer"):
+        project.bulk_changes([1], "Name", "Potion Potion Potion")
+    with pytest.raises(ProjectError, match="ITEM_NONE"):
+        project.bulk_changes([0], "Price", "price / 0")
+
+
+def test_expressions():
+    item = {"Price": "0x10", "HoldParam": "20", "Pocket": "POCKET_ITEMS"}
+    assert evaluate("price * 2 + holdparam", item) == "52"
+    assert evaluate("round(price / 3)", item) == "5"
+    assert evaluate("(void*) 0x80A2325", item) == "(void*) 0x80A2325"
+    assert not is_expression("POCKET_KEY_ITEMS") and is_expression("price")
+    for text in ("__import__('os')", "pocket + 1", "price ** 1000", "item.Price",
+                 "((((price ** 64) ** 64) ** 64) ** 64) ** 64", "price << 64 << 64 << 64", "int(1e300)"):
+        with pytest.raises(ExpressionError):
+            evaluate(text, item)
+
+    # The result has to fit the field's member of struct Item
+    assert evaluate("price * 4000", item, "Price") == "64000"
+    for text, field in (("price * 5000", "Price"), ("holdparam * 20", "HoldParam"), ("price - 17", "Price")):
+        with pytest.raises(ExpressionError, match=f"{field} must be between"):
+            evaluate(text, item, field)
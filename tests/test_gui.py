@@ -0,0 +1,168 @@
+"""The editor window on the golden project, without a display (QT_QPA_PLATFORM=offscreen).
+
+Skipped when PyQt5 is not installed; everything else in tests/ runs without Qt.
+"""
+import os
+import shutil
+import time
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+
+import master  # noqa: E402
+
+from crazyitem.recent import ENV_VAR as RECENT_ENV_VAR  # noqa: E402
+
+from .conftest import GOLDEN_PROJECT, ICON, ITEM_TABLES_C, read_bytes, tree_bytes  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def dialogs(project_dir, tmp_path, monkeypatch):
+    """Messages shown, with the folder dialog picking the project and the recent list kept in ``tmp_path``."""
+    messages = []
+    box = QtWidgets.QMessageBox
+    monkeypatch.setenv(RECENT_ENV_VAR, str(tmp_path / "config"))
+    monkeypatch.setattr(QtWidgets.QFileDialog, "getExistingDirectory",
+                        lambda *args, **kwargs: messages.append(("folder", "")) or project_dir)
+    monkeypatch.setattr(box, "question", lambda *args, **kwargs: box.No)
+    for kind in ("information", "warning", "critical"):
+        monkeypatch.setattr(box, kind, lambda parent, title, text, *args, _kind=kind: messages.append((_kind, text)))
+    return messages
+
+
+def wait_for_load(app, w):
+    started = time.time()
+    while (not w.save_btn.isEnabled() or w.loader.isRunning()) and time.time() - started < 10:
+        app.processEvents()
+
+
+def open_editor(app, messages, project_path=None):
+    w = master.ItemEditor(project_path)
+    w.messages = messages
+    wait_for_load(app, w)
+    return w
+
+
+def close_editor(app, w):
+    w.close()
+    w.deleteLater()
+    app.processEvents()
+
+
+@pytest.fixture
+def window(app, dialogs):
+    """An ``ItemEditor`` on a copy of the golden project, its dialogs answered without showing."""
+    w = open_editor(app, dialogs)
+    yield w
+    close_editor(app, w)
+
+
+def test_window_loads_project(window):
+    assert window.list_model.rowCount() == 7
+    assert not [m for m in window.messages if m[0] not in ("information", "folder")]
+    window.select_item(4)
+    assert window.fields["Name"].text() == "King's Rock"
+    # ROM-defined and left locked
+    assert window.desc_edit.isReadOnly() and window.desc_edit.toPlainText() == "[ROM defined]"
+
+
+def test_browse_and_save_is_byte_identical(window, project_dir):
+    for idx in range(7):
+        window.select_item(idx)
+        assert window.selected_index == idx
+    window.save_all()
+    assert window.messages[-1][0] == "information"
+    assert tree_bytes(project_dir) == tree_bytes(GOLDEN_PROJECT)
+
+
+def test_edit_save_undo(window, project_dir):
+    window.select_item(1)
+    window.fields["Price"].setText("450")
+    window.save_all()
+    assert window.project.data[1].Price == "450"
+    assert b".price = 450," in tree_bytes(project_dir)[os.path.join("src", "tables", "item_tables.c")]
+
+    window.undo()
+    assert window.fields["Price"].text() == "300"
+    window.save_all()
+    assert tree_bytes(project_dir) == tree_bytes(GOLDEN_PROJECT)
+
+
+def test_icon_grid_follows_reload(window, app, project_dir):
+    window.show_icon_grid()
+    grid = window.icon_grid
+    assert grid.model.rowCount() == len(grid.paths) == 7
+
+    # Someone else inserts a Super Potion after Potion
+    path = os.path.join(project_dir, ITEM_TABLES_C)
+    data = read_bytes(path)
+    potion = data.index(b"\t[ITEM_POTION] =")
+    potion_end = data.index(b"\t},\n", potion) + 4
+    super_potion = data[potion:potion_end].replace(b"POTION", b"SUPER_POTION")
+    with open(path, "wb") as f:
+        f.write(data[:potion_end] + b"\n" + super_potion + data[potion_end:])
+    window.reload_changed_files()
+    assert grid.model.rowCount() == len(grid.paths) == len(window.data) == 8
+    assert grid.paths[2] == window.project.icon_path(2)
+    grid.view.grab()  # paints every cell
+
+
+def test_reopens_last_project(app, dialogs, project_dir, tmp_path):
+    close_editor(app, open_editor(app, dialogs))
+    assert dialogs.count(("folder", "")) == 1
+
+    # The next launch goes straight to it, and --project to another folder
+    w = open_editor(app, dialogs)
+    assert dialogs.count(("folder", "")) == 1 and w.base_path == project_dir
+    assert w.list_model.rowCount() == 7
+    close_editor(app, w)
+
+    other = str(tmp_path / "other")
+    shutil.copytree(GOLDEN_PROJECT, other)
+    w = open_editor(app, dialogs, other)
+    assert w.base_path == other and w.recent.paths == [other, project_dir]
+    close_editor(app, w)
+
+
+def test_open_project(window, app, tmp_path):
+    other = str(tmp_path / "other")
+    shutil.copytree(GOLDEN_PROJECT, other)
+    window.select_item(1)
+    window.fields["Price"].setText("450")
+    window.open_project(other)  # unsaved changes, and the question is answered No
+    assert window.base_path != other
+
+    window.fields["Price"].setText("300")
+    window.open_project(other)
+    wait_for_load(app, window)
+    assert window.base_path == other and window.project.base_path == other
+    assert window.list_model.rowCount() == 7 and window.fields["Price"].text() == ""
+    assert window.recent.last() == other
+
+
+def test_parse_args():
+    args, qt_argv = master.parse_args(["master.py", "--project", "decomp", "-style", "fusion"])
+    assert args.project == "decomp" and qt_argv == ["master.py", "-style", "fusion"]
+
+
+def test_icon_cache_drops_stale_prefetch(app, tmp_path):
+    cache = master.IconCache(48)
+    path = str(tmp_path / "icon.png")
+    shutil.copy(ICON, path)
+    cache.prefetch([path])
+    cache.invalidate(path)  # the PNG is replaced while its prefetch is running
+    cache.pool.waitForDone()
+    app.processEvents()
+    assert path not in cache.pixmaps and not cache.pending
+
+    cache.prefetch([path])
+    cache.pool.waitForDone()
+    app.processEvents()
+    assert path in cache.pixmaps
@@ -0,0 +1,29 @@
+"""Importing the core stays cheap: modules load when their names are first used."""
+import subprocess
+import sys
+
+import pytest
+
+import crazyitem
+
+LOADED = "import sys, {0}; print(sorted(m for m in sys.modules if m.startswith('crazyitem')))"
+
+
+def loaded_modules(statement):
+    out = subprocess.run([sys.executable, "-c", LOADED.format(statement)], capture_output=True, text=True, check=True)
+    return out.stdout.strip()
+
+
+def test_package_import_is_lazy():
+    assert loaded_modules("crazyitem") == "['crazyitem']"
+    assert loaded_modules("crazyitem.charmap") == "['crazyitem', 'crazyitem.charmap']"
+
+
+def test_exports_resolve():
+    from crazyitem.project import ItemProject
+    assert crazyitem.ItemProject is ItemProject
+    assert set(crazyitem.__all__) <= set(dir(crazyitem))
+    for name in crazyitem.__all__:
+        assert getattr(crazyitem, name) is not None
+    with pytest.raises(AttributeError, match="missing"):
+        crazyitem.missing
@@ -0,0 +1,26 @@
+"""The item_tables.c parser on constructs the golden project does not have."""
+from crazyitem.item_tables import apply_edits, field_edit, parse_item_tables
+
+SOURCE = b"""const struct Item gItemData[] =
+{
+    [ITEM_NONE] = {
+        .itemId = ITEM_NONE,
+        .holdEffect = HOLD(1, 2),
+        .holdEffectParam = MAX((1, 2), 3) + 1,
+        .price = (4,
+    },
+};
+"""
+
+
+def test_parenthesized_values():
+    tables = parse_item_tables(SOURCE)
+    record, = tables.items
+    assert record.fields["holdEffect"] == "HOLD(1, 2)"
+    assert record.fields["holdEffectParam"] == "MAX((1, 2), 3) + 1"
+    assert record.fields["price"] == "(4"  # unbalanced, taken as far as the comma
+    assert tables.item_data_end == SOURCE.index(b"};")
+
+    apply_edits(tables, [field_edit(tables, record, "holdEffect", "HOLD_EFFECT_NONE")])
+    assert b"        .holdEffect = HOLD_EFFECT_NONE,\n        .holdEffectParam" in tables.raw
+    assert parse_item_tables(tables.raw).items[0].fields == record.fields
@@ -0,0 +1,70 @@
+"""Spans around the loaders and writers, and the --profile switches."""
+import os
+import pstats
+
+import pytest
+
+from crazyitem import cli
+from crazyitem.profiling import ENV_VAR, PROFILER, configure
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    monkeypatch.delenv(ENV_VAR, raising=False)
+    yield PROFILER
+    PROFILER.stop()
+    PROFILER.flush()
+
+
+def names(spans):
+    return [span.name for span in spans]
+
+
+def test_off_by_default(profiler, project_dir):
+    assert configure() is False
+    from crazyitem import ItemProject
+    ItemProject(project_dir, use_cache=False).load_all()
+    assert not profiler.enabled and profiler.roots == []
+
+
+def test_load_and_save_spans(profiler, project):
+    configure(profile=True)
+    project.load_all()
+    project.set_field(1, "Price", "301")
+    project.save_all()
+
+    load, save = profiler.roots
+    assert names(load.children) == [
+        "load_charmap", "load_item_defines", "load_descriptions", "load_item_graphics_table", "load_items"]
+    assert load.info == {"item_tables": "parsed", "descriptions": "parsed"}
+    defines, descriptions = load.children[1], load.children[2]
+    assert names(defines.children) == ["read_item_tables"]
+    assert defines.children[0].info == {"items": 7, "graphics": 7}
+    assert descriptions.info == {"rom_defines": 2, "blocks": 5}
+    assert descriptions.bytes == sum(os.path.getsize(path) for path in (project.table_h_path, project.description_path))
+    assert load.children[0].bytes is None  # no charmap.txt
+
+    assert names(save.children) == ["save_item_tables", "save_descriptions", "save_externs", "commit"]
+    assert save.children[0].info == {"edits": 1} and save.children[-1].info == {"files": 1}
+    assert profiler.summary().split()[0] in ("load_all", "save_all")
+
+    report = profiler.flush()
+    assert "  load_descriptions" in report and "rom_defines=2 blocks=5" in report
+    assert profiler.roots == [] and profiler.summary() == ""
+
+
+def test_cli_profile(profiler, project_dir, tmp_path, capsys):
+    stats = str(tmp_path / "list.pstats")
+    assert cli.main(["--project", project_dir, "--profile-stats", stats, "list"]) == 0
+    err = capsys.readouterr().err
+    assert err.startswith("load_all ") and "read_item_tables" in err and "item_tables=parsed" in err
+    assert not profiler.enabled
+    assert any(func[2] == "iter_load" for func in pstats.Stats(stats).stats)
+
+
+def test_env_var(profiler, project_dir, monkeypatch, capsys):
+    monkeypatch.setenv(ENV_VAR, "1")
+    assert cli.main(["--project", project_dir, "export", os.path.join(project_dir, "items.csv")]) == 0
+    err = capsys.readouterr().err
+    assert err.startswith("export ") and "load_items" not in err
+    assert profiler.stats_path is None
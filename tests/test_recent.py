@@ -0,0 +1,48 @@
+"""The recent projects list the editor reopens the last project from."""
+import os
+
+from crazyitem.recent import ENV_VAR, MAX_RECENT, RECENT_FILE, RecentProjects, config_folder
+
+
+def test_most_recent_first(tmp_path):
+    path = str(tmp_path / "config" / RECENT_FILE)
+    folders = []
+    for name in "abc":
+        folders.append(str(tmp_path / name))
+        os.mkdir(folders[-1])
+    recent = RecentProjects(path)
+    assert recent.last() is None
+    for folder in folders + [folders[0]]:
+        recent.add(folder)
+    assert RecentProjects(path).paths == [folders[0], folders[2], folders[1]]
+
+    os.rmdir(folders[0])  # moved or deleted since
+    assert RecentProjects(path).last() == folders[2]
+
+
+def test_limit(tmp_path):
+    recent = RecentProjects(str(tmp_path / RECENT_FILE))
+    for n in range(MAX_RECENT + 5):
+        recent.add(str(tmp_path / str(n)))
+    assert len(recent.paths) == MAX_RECENT and recent.paths[0] == str(tmp_path / str(MAX_RECENT + 4))
+
+
+def test_damaged_or_unwritable(tmp_path):
+    path = tmp_path / RECENT_FILE
+    path.write_text('{"recent": [')
+    assert RecentProjects(str(path)).paths == []
+    path.write_text('{"recent": ["/a", 3]}')
+    assert RecentProjects(str(path)).paths == ["/a"]
+
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    recent = RecentProjects(str(blocker / RECENT_FILE))
+    recent.add(str(tmp_path))  # cannot be saved, but still remembered
+    assert recent.last() == str(tmp_path)
+
+
+def test_config_folder(monkeypatch, tmp_path):
+    monkeypatch.setenv(ENV_VAR, str(tmp_path))
+    assert config_folder() == str(tmp_path)
+    monkeypatch.delenv(ENV_VAR)
+    assert os.path.basename(config_folder()) == "crazyitem"
@@ -0,0 +1,178 @@
+"""Loading and saving a decomp tree must not change a byte that was not edited."""
+import os
+
+from crazyitem import ItemProject
+
+from .conftest import DESCRIPTIONS, GOLDEN_PROJECT, ITEM_TABLES_C, ITEM_TABLES_H, read_bytes, tree_bytes
+
+
+def load(folder, use_cache=False):
+    project = ItemProject(folder, use_cache=use_cache)
+    project.load_all()
+    return project
+
+
+def test_golden_project_loads(project):
+    names = [item.Name for item in project.data]
+    assert names == ["????????", "Potion", "Poké Ball", "Pokeblock Kit", "King's Rock", "Up-Grade", "X Attack&"]
+    assert project.item_id_to_name[3] == "ITEM_POKEBLOCK_KIT"
+    assert project.data[1].Price == "300" and project.data[3].Pocket == "POCKET_KEY_ITEMS"
+    assert project.readonly_tags == {"DESC_POKE_BALL", "DESC_KINGS_ROCK"}
+    assert project.descriptions["DESC_POKEBLOCK_KIT"] == "A case for holding\\nPokéblocks."
+    # A description spread over two lines of the file
+    assert project.descriptions["DESC_UP_GRADE"] == "A transparent device\\nfilled with all sorts\nof data."
+    assert project.icon_path(1).endswith("gBag_Potion.png")
+    assert project.icon_path(6) == ""
+    assert not project.warnings
+
+
+def test_save_without_edits_is_byte_identical(project, project_dir):
+    project.save_all()
+    assert tree_bytes(project_dir) == tree_bytes(GOLDEN_PROJECT)
+
+
+def test_save_after_cached_load_is_byte_identical(project_dir):
+    first = load(project_dir, use_cache=True)  # writes the cache
+    second = load(project_dir, use_cache=True)
+    assert [dict(item) for item in second.data] == [dict(item) for item in first.data]
+    assert second.descriptions == first.descriptions
+    second.save_all()
+    assert tree_bytes(project_dir) == tree_bytes(GOLDEN_PROJECT)
+
+
+def test_file_changed_while_loading_is_not_cached(project_dir, monkeypatch):
+    from crazyitem import project as project_module
+
+    path = os.path.join(project_dir, ITEM_TABLES_C)
+    real_read = project_module.read_item_tables
+
+    def read_then_checkout(*args):
+        # Like a git checkout landing while the file is parsed: same size, new mtime
+        tables = real_read(*args)
+        with open(path, "rb") as f:
+            data = f.read()
+        mtime = os.stat(path).st_mtime_ns
+        with open(path, "wb") as f:
+            f.write(data.replace(b".price = 300,", b".price = 301,"))
+        os.utime(path, ns=(mtime + 10 ** 9, mtime + 10 ** 9))
+        return tables
+
+    monkeypatch.setattr(project_module, "read_item_tables", read_then_checkout)
+    assert load(project_dir, use_cache=True).data[1].Price == "300"
+    monkeypatch.undo()
+    assert load(project_dir, use_cache=True).data[1].Price == "301"
+
+
+def test_file_changed_after_cache_check_is_parsed(project_dir, monkeypatch):
+    from crazyitem import cache as cache_module
+
+    path = os.path.join(project_dir, ITEM_TABLES_C)
+    load(project_dir, use_cache=True)
+    real_get = cache_module.ProjectCache.get
+
+    def get_then_write(self, name, paths):
+        # The cached entry still matched, then the file changes before it is read
+        payload = real_get(self, name, paths)
+        if name == "item_tables":
+            data = read_bytes(path)
+            with open(path, "wb") as f:
+                f.write(data.replace(b".price = 300,", b".price = 3000,"))
+        return payload
+
+    monkeypatch.setattr(cache_module.ProjectCache, "get", get_then_write)
+    project = load(project_dir, use_cache=True)
+    assert project.data[1].Price == "3000" and project.item_tables.raw == read_bytes(path)
+    project.set_field(1, "Price", "350")
+    project.save_all()
+    assert b".price = 350," in read_bytes(path)
+
+
+def test_edit_then_revert_is_byte_identical(project, project_dir):
+    old_name, old_price = project.data[3].Name, project.data[1].Price
+    old_text = project.descriptions["DESC_UP_GRADE"]
+    project.set_field(3, "Name", "Pokeblock Case")
+    project.set_field(1, "Price", "350")
+    project.set_description("DESC_UP_GRADE", "Short.")
+    project.save_all()
+    assert tree_bytes(project_dir) != tree_bytes(GOLDEN_PROJECT)
+
+    project.set_field(3, "Name", old_name)
+    project.set_field(1, "Price", old_price)
+    project.set_description("DESC_UP_GRADE", old_text)
+    project.save_all()
+    assert tree_bytes(project_dir) == tree_bytes(GOLDEN_PROJECT)
+
+
+def test_edits_touch_only_their_lines(project, project_dir):
+    project.set_field(4, "Price", "150")
+    project.set_field(5, "Name", "Up-Grade 2")
+    project.set_description("DESC_X_ATTACK", "Raises Attack.")
+    project.save_all()
+
+    def changed_lines(path):
+        old = read_bytes(GOLDEN_PROJECT, path).splitlines(True)
+        new = read_bytes(project_dir, path).splitlines(True)
+        assert len(old) == len(new)
+        return [(a, b) for a, b in zip(old, new) if a != b]
+
+    assert changed_lines(ITEM_TABLES_C) == [
+        (b"\t\t.price = 100,\n", b"\t\t.price = 150,\n"),
+        (b"\t\t.name = {_U, _p, _HYPHEN, _G, _r, _a, _d, _e, _END},\n",
+         b"\t\t.name = {_U, _p, _HYPHEN, _G, _r, _a, _d, _e, _SPACE, _2, _END},\n"),
+    ]
+    # The last block has no trailing newline and keeps it that way; CRLF and BOM stay
+    assert changed_lines(DESCRIPTIONS) == [
+        (b"Raises the Attack\\nstat during one battle.", b"Raises Attack."),
+    ]
+    assert read_bytes(project_dir, DESCRIPTIONS).startswith(b"\xef\xbb\xbf#org @DESC_NONE\r\n")
+    assert read_bytes(project_dir, ITEM_TABLES_H) == read_bytes(GOLDEN_PROJECT, ITEM_TABLES_H)
+
+    reloaded = load(project_dir)
+    assert reloaded.data[4].Price == "150" and reloaded.data[5].Name == "Up-Grade 2"
+    assert reloaded.descriptions["DESC_X_ATTACK"] == "Raises Attack."
+
+
+def test_sequence_name_round_trips(project, project_dir):
+    # Glyph sequence, accented letter and quoted character survive a rename of another item
+    project.set_field(1, "Name", "Potion 2")
+    project.save_all()
+    reloaded = load(project_dir)
+    assert [item.Name for item in reloaded.data[2:]] == [item.Name for item in project.data[2:]]
+    tables = read_bytes(project_dir, ITEM_TABLES_C)
+    assert b"_PO, _KE, _BL, _OC, _OK, _SPACE, _K, _i, _t, _END" in tables
+    assert b"_X, _SPACE, _A, _t, _t, _a, _c, _k, '&', _END" in tables
+
+
+def test_undo_to_start_is_byte_identical(project, project_dir):
+    project.set_field(2, "Price", "250")
+    project.set_description("DESC_POTION", "Heals 20 HP.")
+    project.save_all()
+    project.undo(2)
+    project.save_all()
+    assert tree_bytes(project_dir) == tree_bytes(GOLDEN_PROJECT)
+    assert not os.path.exists(os.path.join(project_dir, ".crazyitem", "journal.json"))
+
+
+def test_reload_keeps_edits_on_their_items(project, project_dir):
+    path = os.path.join(project_dir, ITEM_TABLES_C)
+    project.set_field(4, "Price", "150")  # King's Rock, not saved
+    project.set_field(5, "Price", "250")  # Up-Grade, about to be removed
+    data = read_bytes(path)
+    potion = data.index(b"\t[ITEM_POTION] =")
+    potion_end = data.index(b"\t},\n", potion) + 4
+    up_grade = data.index(b"\t[ITEM_UP_GRADE] =")
+    up_grade_end = data.index(b"\t},\n", up_grade) + 4
+    # Someone else inserts a Super Potion after Potion and deletes Up-Grade
+    super_potion = data[potion:potion_end].replace(b"POTION", b"SUPER_POTION").replace(b"= 300", b"= 700")
+    with open(path, "wb") as f:
+        f.write(data[:potion_end] + b"\n" + super_potion + data[potion_end:up_grade] + data[up_grade_end:])
+
+    rows, _ = project.reload_files([path])
+    assert project.item_id_to_name[2] == "ITEM_SUPER_POTION" and project.data[2].Price == "700"
+    assert project.item_id_to_name[5] == "ITEM_KINGS_ROCK" and project.data[5].Price == "150"
+    assert project.dirty == {5: {"Price"}} and 5 in rows
+    assert "ITEM_UP_GRADE" in project.warnings[-1]
+
+    project.undo()
+    assert project.data[5].Price == "100" and project.data[4].Name == "Pokeblock Kit"
+    assert not project.history.can_undo()
@@ -0,0 +1,33 @@
+"""SearchIndex: the indexed lookups give what checking every item gives."""
+from crazyitem.search import SearchIndex, parse_query
+
+QUERIES = [
+    "potion", "POT", "p", "o", "ball", "kit pocket:key", "pocket:items", "pocket:", "hold:",
+    '"a case"', '"ase for"', '"pok"', "'", "price>0", "price>0 pocket:key_items", "zz", "",
+]
+
+
+def scanned(index, query):
+    terms = parse_query(query)
+    return [idx for idx in range(len(index.rows)) if all(index._matches(idx, term) for term in terms)]
+
+
+def check(index):
+    for query in QUERIES:
+        index.last_terms = index.last_result = None
+        assert index.search(query) == scanned(index, query), query
+
+
+def test_search_matches_scan(project):
+    index = SearchIndex(project)
+    assert index.search("po") == [1, 2, 3]
+    assert index.search("pot") == [1]  # narrowed
+    assert index.search("pocket:key") == [3]
+    check(index)
+
+    project.set_field(4, "Name", "King's Pot")
+    project.set_field(4, "Pocket", "POCKET_KEY_ITEMS")
+    index.update(4)
+    assert index.search("pot") == [1, 4]
+    assert index.search("pocket:key") == [3, 4]
+    check(index)
@@ -0,0 +1,90 @@
+"""A save either replaces every file or none, even when cut short."""
+import os
+
+import pytest
+
+from crazyitem import transaction as tx_module
+from crazyitem.transaction import TMP_SUFFIX, Transaction, recover
+
+
+class Crash(BaseException):
+    """Stands in for the process dying: nothing after it runs."""
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@pytest.fixture
+def files(tmp_path):
+    a, b, c = (str(tmp_path / name) for name in "abc")
+    for path, data in ((a, b"A0"), (b, b"B0")):
+        with open(path, "wb") as f:
+            f.write(data)
+    return a, b, c, str(tmp_path / "journal.json")
+
+
+def test_commit_and_rollback(files):
+    a, b, c, journal = files
+    with Transaction(journal) as tx:
+        tx.write_bytes(a, b"A1")
+        tx.write_bytes(c, b"C1")
+        assert read(a) == b"A0"  # staged only
+    assert (read(a), read(b), read(c)) == (b"A1", b"B0", b"C1")
+
+    with pytest.raises(ValueError):
+        with Transaction(journal) as tx:
+            tx.write_bytes(a, b"A2")
+            raise ValueError
+    assert read(a) == b"A1"
+    assert sorted(os.listdir(os.path.dirname(a))) == ["a", "b", "c"]
+
+
+def test_failed_rename_rolls_back(files, monkeypatch):
+    a, b, c, journal = files
+    real_replace = os.replace
+    calls = []
+
+    def failing_replace(src, dst):
+        calls.append(dst)
+        if len(calls) == 3:
+            raise OSError("disk full")
+        return real_replace(src, dst)
+
+    monkeypatch.setattr(tx_module.os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        with Transaction(journal) as tx:
+            tx.write_bytes(a, b"A1")
+            tx.write_bytes(b, b"B1")
+            tx.write_bytes(c, b"C1")
+    monkeypatch.undo()
+    assert (read(a), read(b)) == (b"A0", b"B0")
+    assert sorted(os.listdir(os.path.dirname(a))) == ["a", "b"]
+
+
+def test_recover_after_crash(files, monkeypatch):
+    a, b, c, journal = files
+    real_replace = os.replace
+
+    def crashing_replace(src, dst):
+        real_replace(src, dst)
+        if src.endswith(TMP_SUFFIX) and dst == c:
+            raise Crash
+
+    # A real crash runs no clean-up at all
+    monkeypatch.setattr(tx_module.os, "replace", crashing_replace)
+    monkeypatch.setattr(tx_module, "_roll_back", lambda entries: None)
+    monkeypatch.setattr(tx_module, "_remove", lambda path: None)
+    tx = Transaction(journal)
+    tx.write_bytes(a, b"A2")
+    tx.write_bytes(c, b"C2")
+    with pytest.raises(Crash):
+        tx.commit()
+    monkeypatch.undo()
+    assert os.path.exists(journal) and read(a) == b"A2"
+
+    assert recover(journal) is True
+    assert read(a) == b"A0" and not os.path.exists(c)
+    assert sorted(os.listdir(os.path.dirname(a))) == ["a", "b"]
+    assert recover(journal) is False
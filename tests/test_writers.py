@@ -0,0 +1,156 @@
+"""``add_item``, ``import_icon`` and the item_tables.h patchers against golden files."""
+import os
+
+import pytest
+
+from crazyitem import ItemProject, ProjectError, cli
+
+from .conftest import (
+    DESCRIPTIONS, GOLDEN, GOLDEN_PROJECT, ICON, ITEM_TABLES_C, ITEM_TABLES_H, ITEMS_H, SMALL_ICON, read_bytes,
+    tree_bytes
+)
+
+SPRITES = os.path.join("graphics", "item_sprites")
+
+
+def header_lines(folder):
+    return read_bytes(folder, ITEM_TABLES_H).decode("utf-8").splitlines()
+
+
+def test_add_item_matches_golden(project, project_dir):
+    pytest.importorskip("PIL")
+    new_id = project.add_item("ITEM_MAX_REPEL", "Max Repel", "700", "POCKET_ITEMS", "ITEM_USE_BAG_MENU",
+                              "Repels weak wild\\nPokémon for 250 steps.", ICON)
+    assert new_id == 7
+    for path in (ITEMS_H, ITEM_TABLES_H, ITEM_TABLES_C, DESCRIPTIONS):
+        assert read_bytes(project_dir, path) == read_bytes(GOLDEN, "add_item", path), path
+    assert os.path.exists(os.path.join(project_dir, SPRITES, "gBag_MAX_REPEL.png"))
+    assert not project.warnings
+
+    # Merged into the loaded project, and the same as a fresh load
+    assert project.data[7].Name == "Max Repel" and project.item_id_to_name[7] == "ITEM_MAX_REPEL"
+    assert project.descriptions["DESC_MAX_REPEL"] == "Repels weak wild\\nPokémon for 250 steps."
+    fresh = ItemProject(project_dir, use_cache=False)
+    fresh.load_all()
+    assert [dict(item) for item in fresh.data] == [dict(item) for item in project.data]
+    assert fresh.icon_path(7) == project.icon_path(7) != ""
+
+
+def test_add_items_keeps_crlf(project_dir):
+    pytest.importorskip("PIL")
+    for path in (ITEMS_H, ITEM_TABLES_H, ITEM_TABLES_C):
+        data = read_bytes(project_dir, path)
+        with open(os.path.join(project_dir, path), "wb") as f:
+            f.write(data.replace(b"\n", b"\r\n"))
+    project = ItemProject(project_dir, use_cache=False)
+    project.load_all()
+    project.add_item("ITEM_MAX_REPEL", "Max Repel", "700", "POCKET_ITEMS", "ITEM_USE_BAG_MENU",
+                     "Repels weak wild\\nPokémon for 250 steps.", ICON)
+    for path in (ITEMS_H, ITEM_TABLES_H, ITEM_TABLES_C):
+        assert read_bytes(project_dir, path) == read_bytes(GOLDEN, "add_item", path).replace(b"\n", b"\r\n"), path
+
+    # A batch lands after the first item, and the table still loads
+    project.add_items([{"const": const, "display": const.title(), "price": "10", "description": "Test.",
+                        "icon_path": ICON} for const in ("ONE", "TWO")])
+    for path in (ITEMS_H, ITEM_TABLES_H, ITEM_TABLES_C):
+        assert b"\n" not in read_bytes(project_dir, path).replace(b"\r\n", b""), path
+    assert [item.Name for item in project.data[7:]] == ["Max Repel", "One", "Two"]
+    assert project.icon_path(9).endswith("gBag_TWO.png")
+
+
+def test_cli_add_prints_constant_once(project_dir, capsys):
+    pytest.importorskip("PIL")
+    argv = ["--project", project_dir, "add", "ITEM_MAX_REPEL", "--name", "Max Repel", "--price", "700",
+            "--description", "Repels.", "--icon", ICON]
+    assert cli.main(argv) == 0
+    assert capsys.readouterr().out == "ITEM_MAX_REPEL added as ID 0x007\n"
+
+
+def test_add_item_rejects_bad_input(project, project_dir):
+    pytest.importorskip("PIL")
+    args = ["Max Repel", "700", "POCKET_ITEMS", "ITEM_USE_BAG_MENU", "Repels."]
+    with pytest.raises(ProjectError, match="already exists"):
+        project.add_item("ITEM_POTION", *args, ICON)
+    with pytest.raises(ProjectError, match="Invalid constant"):
+        project.add_item("MAX-REPEL", *args, ICON)
+    with pytest.raises(ProjectError, match="24"):
+        project.add_item("MAX_REPEL", *args, SMALL_ICON)
+    with pytest.raises(ProjectError, match="required"):
+        project.add_item("MAX_REPEL", "", "700", "POCKET_ITEMS", "ITEM_USE_BAG_MENU", "Repels.", ICON)
+    assert tree_bytes(project_dir) == tree_bytes(GOLDEN_PROJECT)
+
+
+def test_import_icon_turns_rom_sprite_into_extern(project, project_dir):
+    pytest.importorskip("PIL")
+    assert project.import_icon(4, ICON) == "gBag_KingsRock"
+    lines = header_lines(project_dir)
+    assert "extern const u32 gBag_KingsRockTiles[];" in lines
+    assert "extern const u32 gBag_KingsRockPal[];" in lines
+    assert not any("gBag_KingsRock" in line and "#define" in line for line in lines)
+    # Nothing else in the header moved
+    assert len(lines) == len(header_lines(GOLDEN_PROJECT))
+    assert "#define gBag_PokeBallTiles ((u32*) 0x83D5A84)" in lines
+    assert project.icon_path(4) == os.path.join(project.icon_folder, "gBag_KingsRock.png")
+    assert read_bytes(project.icon_path(4)) != read_bytes(GOLDEN_PROJECT, SPRITES, "gBag_KingsRock.png")
+
+
+def test_import_icon_over_extern_sprite(project, project_dir):
+    pytest.importorskip("PIL")
+    assert project.import_icon(1, ICON) == "gBag_Potion"
+    assert read_bytes(project_dir, ITEM_TABLES_H) == read_bytes(GOLDEN_PROJECT, ITEM_TABLES_H)
+    # The item without a sprite file gets one
+    assert project.icon_path(6) == ""
+    project.import_icon(6, ICON)
+    assert project.icon_path(6).endswith("gBag_XAttack.png")
+
+
+def test_import_icon_rejects_wrong_size(project, project_dir):
+    pytest.importorskip("PIL")
+    with pytest.raises(ProjectError, match="24x24"):
+        project.import_icon(4, SMALL_ICON)
+    with pytest.raises(ProjectError, match="Could not open"):
+        project.import_icon(4, os.path.join(project_dir, DESCRIPTIONS))
+    assert tree_bytes(project_dir) == tree_bytes(GOLDEN_PROJECT)
+
+
+def test_update_item_tables_header(project, project_dir):
+    project.update_item_tables_header("gBag_PokeBallTiles", "gBag_PokeBallPal")
+    old, new = header_lines(GOLDEN_PROJECT), header_lines(project_dir)
+    assert [(a, b) for a, b in zip(old, new) if a != b] == [
+        ("#define gBag_PokeBallTiles ((u32*) 0x83D5A84)", "extern const u32 gBag_PokeBallTiles[];"),
+        ("#define gBag_PokeBallPal ((u32*) 0x83D5B24)", "extern const u32 gBag_PokeBallPal[];"),
+    ]
+    # Already externs: the file is left alone
+    before = os.stat(os.path.join(project_dir, ITEM_TABLES_H)).st_mtime_ns
+    project.update_item_tables_header("gBag_PotionTiles", "gBag_PotionPal")
+    assert os.stat(os.path.join(project_dir, ITEM_TABLES_H)).st_mtime_ns == before
+
+
+def test_update_desc_define_to_extern(project, project_dir):
+    project.update_desc_define_to_extern("DESC_POKE_BALL")
+    old, new = header_lines(GOLDEN_PROJECT), header_lines(project_dir)
+    assert [(a, b) for a, b in zip(old, new) if a != b] == [
+        ("#define DESC_POKE_BALL ((const u8 *) 0x8419C00)", "extern const u8 DESC_POKE_BALL[];"),
+    ]
+    assert project.readonly_tags == {"DESC_KINGS_ROCK"}
+
+    project.update_desc_define_to_extern(["DESC_KINGS_ROCK", "DESC_POTION"])
+    assert "extern const u8 DESC_KINGS_ROCK[];" in header_lines(project_dir)
+    assert not project.readonly_tags
+    assert read_bytes(project_dir, ITEM_TABLES_C) == read_bytes(GOLDEN_PROJECT, ITEM_TABLES_C)
+
+
+def test_editing_rom_description_saves_extern_and_text(project, project_dir):
+    project.set_description("DESC_KINGS_ROCK", "May make the foe\\nflinch.")
+    assert "DESC_KINGS_ROCK" not in project.readonly_tags
+    # Nothing is written before the save
+    assert tree_bytes(project_dir) == tree_bytes(GOLDEN_PROJECT)
+    project.save_all()
+    assert "extern const u8 DESC_KINGS_ROCK[];" in header_lines(project_dir)
+    assert read_bytes(project_dir, DESCRIPTIONS).endswith(
+        b"stat during one battle.\r\n\r\n#org @DESC_KINGS_ROCK\r\nMay make the foe\\nflinch.\r\n")
+
+    fresh = ItemProject(project_dir, use_cache=False)
+    fresh.load_all()
+    assert fresh.readonly_tags == {"DESC_POKE_BALL"}
+    assert fresh.descriptions["DESC_KINGS_ROCK"] == "May make the foe\\nflinch."